@@ -0,0 +1,240 @@
+import asyncio
+import time
+from collections import deque
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from app.application.prescreen import prescreen
+from app.application.rules import DEFAULT_POLICY, ScoringPolicy
+from app.application.use_cases import (
+    _no_appraisal,
+    analyze_potential,
+    failed_evaluation,
+    outcome_of,
+    record_outcome,
+    record_stage,
+    rejected_evaluation,
+)
+from app.domain.models import (
+    DomainAvailability,
+    DomainEvaluation,
+    EvaluationPlan,
+    Recommendation,
+    SkipReason,
+)
+from app.domain.ports import (
+    NULL_METRICS,
+    AsyncAppraisalProvider,
+    AsyncAvailabilityProvider,
+    AsyncWhoisProvider,
+    MetricsRecorder,
+)
+from app.domain.results import EvaluationTable
+
+
+class AsyncEvaluateDomainUseCase:
+    def __init__(
+        self,
+        availability_provider: AsyncAvailabilityProvider,
+        appraisal_provider: AsyncAppraisalProvider,
+        whois_provider: AsyncWhoisProvider,
+        plan: Optional[EvaluationPlan] = None,
+        policy: ScoringPolicy = DEFAULT_POLICY,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        self._availability_provider = availability_provider
+        self._appraisal_provider = appraisal_provider
+        self._whois_provider = whois_provider
+        self._plan = plan or EvaluationPlan.full()
+        self._policy = policy
+        self._metrics = metrics
+
+    async def execute(
+        self, domain: str, availability: Optional[DomainAvailability] = None
+    ) -> DomainEvaluation:
+        started = time.perf_counter()
+        try:
+            result = await self._evaluate(domain, availability)
+        except Exception:
+            record_outcome(self._metrics, "error", started)
+            raise
+        record_outcome(self._metrics, outcome_of(result), started)
+        return result
+
+    async def _evaluate(
+        self, domain: str, availability: Optional[DomainAvailability]
+    ) -> DomainEvaluation:
+        reason = self.prescreen(domain)
+        if reason is not None:
+            return rejected_evaluation(domain, reason)
+
+        if availability is None:
+            availability = await self._timed(
+                "availability", self._availability_provider.check_availability(domain)
+            )
+
+        # Appraisal and WHOIS do not depend on each other, so they run together
+        registrant = None
+        if availability.available:
+            appraisal = await self._timed(
+                "appraisal", self._appraisal_provider.get_appraisal(domain)
+            )
+        elif self._plan.appraise_taken and self._plan.registrant:
+            appraisal, registrant = await asyncio.gather(
+                self._timed(
+                    "appraisal", self._appraisal_provider.get_appraisal(domain)
+                ),
+                self._timed("whois", self._whois_provider.get_registrant(domain)),
+            )
+        else:
+            appraisal = _no_appraisal(domain)
+            if self._plan.appraise_taken:
+                appraisal = await self._timed(
+                    "appraisal", self._appraisal_provider.get_appraisal(domain)
+                )
+            if self._plan.registrant:
+                registrant = await self._timed(
+                    "whois", self._whois_provider.get_registrant(domain)
+                )
+
+        started = time.perf_counter()
+        is_buy = analyze_potential(domain, availability, appraisal, self._policy)
+        record_stage(self._metrics, "scoring", started)
+
+        return DomainEvaluation(
+            domain=domain,
+            is_available=availability.available,
+            go_value=appraisal.go_value,
+            sale_probability=appraisal.sale_probability,
+            recommendation=Recommendation.BUY if is_buy else Recommendation.SKIP,
+            price=availability.price,
+            registrant=registrant,
+        )
+
+    def prescreen(self, domain: str) -> Optional[SkipReason]:
+        return prescreen(domain, self._policy)
+
+    async def prefetch_availability(
+        self, domains: List[str]
+    ) -> Dict[str, DomainAvailability]:
+        if not self._availability_provider.supports_bulk:
+            return {}
+        started = time.perf_counter()
+        try:
+            results = await self._availability_provider.check_availability_bulk(
+                domains
+            )
+        except Exception as e:
+            print(f"Bulk availability failed for {len(domains)} domains: {e}")
+            self._metrics.increment("domain_intel_bulk_failures_total")
+            return {}
+        record_stage(self._metrics, "availability_bulk", started)
+        return {result.domain: result for result in results}
+
+    async def _timed(self, stage: str, awaitable: Awaitable[Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            record_stage(self._metrics, stage, started)
+
+
+class AsyncBatchEvaluateUseCase:
+    def __init__(
+        self,
+        evaluate_use_case: AsyncEvaluateDomainUseCase,
+        max_concurrency: int = 200,
+        chunk_size: int = 500,
+    ):
+        self._evaluate_use_case = evaluate_use_case
+        self._max_concurrency = max(1, max_concurrency)
+        self._chunk_size = max(1, chunk_size)
+
+    async def execute(self, domains: Iterable[str]) -> EvaluationTable:
+        results = EvaluationTable()
+        async for result in self.execute_iter(domains):
+            results.append(result)
+        return results
+
+    async def execute_iter(
+        self, domains: Iterable[str], ordered: bool = True
+    ) -> AsyncIterator[DomainEvaluation]:
+        """
+        Async counterpart of BatchEvaluateUseCase.execute_iter.
+        At most `max_concurrency` evaluations are in flight on the event loop.
+        """
+        tasks: Set[asyncio.Task] = set()
+        queue: Deque[asyncio.Task] = deque()
+        try:
+            async for domain, availability in self._with_availability(domains):
+                task = asyncio.create_task(self._evaluate_safe(domain, availability))
+                tasks.add(task)
+                if ordered:
+                    queue.append(task)
+                    if len(queue) >= self._max_concurrency:
+                        head = queue.popleft()
+                        tasks.discard(head)
+                        yield await head
+                elif len(tasks) >= self._max_concurrency:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+
+            if ordered:
+                while queue:
+                    head = queue.popleft()
+                    tasks.discard(head)
+                    yield await head
+            else:
+                while tasks:
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+        finally:
+            # Consumer stopped early (or was cancelled): drop the rest
+            for task in tasks:
+                task.cancel()
+
+    async def _with_availability(
+        self, domains: Iterable[str]
+    ) -> AsyncIterator[Tuple[str, Optional[DomainAvailability]]]:
+        iterator = iter(domains)
+        while True:
+            chunk = list(islice(iterator, self._chunk_size))
+            if not chunk:
+                return
+            candidates = [
+                domain
+                for domain in chunk
+                if self._evaluate_use_case.prescreen(domain) is None
+            ]
+            prefetched: Dict[str, DomainAvailability] = {}
+            if len(candidates) > 1:
+                prefetched = await self._evaluate_use_case.prefetch_availability(
+                    candidates
+                )
+            for domain in chunk:
+                yield domain, prefetched.get(domain)
+
+    async def _evaluate_safe(
+        self, domain: str, availability: Optional[DomainAvailability] = None
+    ) -> DomainEvaluation:
+        try:
+            return await self._evaluate_use_case.execute(domain, availability)
+        except Exception as e:
+            return failed_evaluation(domain, e)
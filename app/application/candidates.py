@@ -0,0 +1,66 @@
+import itertools
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.application.prescreen import prescreen
+from app.application.rules import DEFAULT_POLICY, ScoringPolicy
+from app.domain.ports import SeenFilter
+
+# (literal text, list name or None) pieces of a pattern
+Piece = Tuple[str, Optional[str]]
+
+
+def parse_pattern(pattern: str, lists: Dict[str, Sequence[str]]) -> List[Piece]:
+    """Splits e.g. "{prefix}{word}.{tld}" into literals and list names."""
+    pieces: List[Piece] = []
+    for literal, field, _, _ in Formatter().parse(pattern):
+        if field is not None and field not in lists:
+            raise ValueError(f"Pattern {pattern!r} uses unknown list {{{field}}}")
+        pieces.append((literal, field))
+    return pieces
+
+
+def count_combinations(patterns: Iterable[str], lists: Dict[str, Sequence[str]]) -> int:
+    """Candidates the patterns expand to, duplicates included."""
+    total = 0
+    for pattern in patterns:
+        size = 1
+        for _, field in parse_pattern(pattern, lists):
+            if field is not None:
+                size *= len(lists[field])
+        total += size
+    return total
+
+
+def expand(pattern: str, lists: Dict[str, Sequence[str]]) -> Iterator[str]:
+    """
+    Every combination, lazily; only the lists are held in memory. Each
+    placeholder varies on its own, so "{word}{word}.com" yields all pairs.
+    """
+    pieces = parse_pattern(pattern, lists)
+    template = "".join(
+        literal.replace("{", "{{").replace("}", "}}") + ("{}" if field else "")
+        for literal, field in pieces
+    )
+    choices = [lists[field] for _, field in pieces if field is not None]
+    for combination in itertools.product(*choices):
+        yield template.format(*combination)
+
+
+def generate_candidates(
+    patterns: Iterable[str],
+    lists: Dict[str, Sequence[str]],
+    seen: SeenFilter,
+    policy: ScoringPolicy = DEFAULT_POLICY,
+) -> Iterator[str]:
+    """
+    Unique candidate domains from `patterns`, ready for the batch. Pre-screen
+    rejects are dropped here, before they cost any memory in `seen`.
+    """
+    for pattern in patterns:
+        for domain in expand(pattern, lists):
+            domain = domain.strip().lower()
+            if "." not in domain or prescreen(domain, policy) is not None:
+                continue
+            if seen.add(domain):
+                yield domain
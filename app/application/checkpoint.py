@@ -0,0 +1,76 @@
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from app.application.use_cases import BatchEvaluateUseCase
+from app.domain.models import DomainEvaluation
+from app.domain.ports import EvaluationJournal
+from app.domain.results import EvaluationTable
+
+# Placeholder for a domain that is being evaluated in this run
+_PENDING = object()
+
+
+class CheckpointedBatchEvaluateUseCase:
+    """
+    Wraps a batch so every successful evaluation is journaled as it completes.
+    Domains found in `completed` (loaded from a previous run's journal) are not
+    evaluated again; their saved results are merged into the output instead.
+    Failed evaluations are not journaled, so a resume retries them.
+    """
+
+    def __init__(
+        self,
+        batch: BatchEvaluateUseCase,
+        journal: EvaluationJournal,
+        completed: Optional[Dict[str, DomainEvaluation]] = None,
+    ):
+        self._batch = batch
+        self._journal = journal
+        self._completed = completed or {}
+
+    @property
+    def resumed(self) -> int:
+        return len(self._completed)
+
+    def execute(self, domains: Iterable[str]) -> EvaluationTable:
+        return EvaluationTable(self.execute_iter(domains))
+
+    def execute_iter(
+        self, domains: Iterable[str], ordered: bool = True
+    ) -> Iterator[DomainEvaluation]:
+        # Input order is kept by queueing saved results and placeholders
+        # side by side; the inner batch only ever sees the pending domains.
+        slots: Deque[Any] = deque()
+        saved: List[DomainEvaluation] = []
+
+        def remaining() -> Iterator[str]:
+            for domain in domains:
+                done = self._completed.get(domain.lower())
+                if done is None:
+                    slots.append(_PENDING)
+                    yield domain
+                elif ordered:
+                    slots.append(done)
+                else:
+                    saved.append(done)
+
+        try:
+            for result in self._batch.execute_iter(remaining(), ordered=ordered):
+                if result.error is None:
+                    self._journal.record(result)
+                if ordered:
+                    yield from _drain_saved(slots)
+                    slots.popleft()
+                else:
+                    yield from saved
+                    saved.clear()
+                yield result
+            yield from _drain_saved(slots)
+            yield from saved
+        finally:
+            self._journal.flush()
+
+
+def _drain_saved(slots: Deque[Any]) -> Iterator[DomainEvaluation]:
+    while slots and slots[0] is not _PENDING:
+        yield slots.popleft()
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from app.application.rules import DEFAULT_POLICY, ScoringPolicy
+from app.domain.models import SkipReason
+
+
+def prescreen(
+    domain: str, policy: ScoringPolicy = DEFAULT_POLICY
+) -> Optional[SkipReason]:
+    """
+    Structural rules that depend only on the domain string.
+    Any domain rejected here can never be a BUY, so it needs no lookups.
+    """
+    domain_name = domain.split(".", 1)[0]
+
+    # Too many hyphens is usually junk
+    if domain_name.count("-") > policy.max_hyphens:
+        return SkipReason.TOO_MANY_HYPHENS
+
+    # Digits mixed with letters are hard to sell unless very short
+    if len(domain_name) > policy.max_mixed_length and not domain_name.isdigit():
+        if any(char.isdigit() for char in domain_name):
+            return SkipReason.MIXED_ALNUM_TOO_LONG
+
+    # Shorter is better
+    if len(domain_name) > policy.max_length:
+        return SkipReason.TOO_LONG
+
+    return None
@@ -0,0 +1,111 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(__file__), "default_rules.json")
+
+
+@dataclass(frozen=True)
+class TierRule:
+    min_value: float
+    min_probability: float
+    heuristic_bonus: int
+
+
+@dataclass(frozen=True)
+class ScoringPolicy:
+    """
+    Business rules compiled from a rules file.
+    TLD tiers are flattened into a TLD -> thresholds table, so evaluating
+    a domain costs one dict lookup instead of walking the tier definitions.
+    """
+
+    tld_rules: Dict[str, TierRule]
+    default_rule: TierRule
+    # Structure
+    max_hyphens: int
+    hyphen_penalty: float
+    max_mixed_length: int
+    digit_penalty: float
+    max_length: int
+    # ROI
+    roi_multiple: float
+    high_price: float
+    high_price_roi_multiple: float
+    # Fallback heuristic
+    short_length: int
+    short_bonus: int
+    medium_length: int
+    medium_bonus: int
+    clean_bonus: int
+    cheap_price: float
+    cheap_bonus: int
+    heuristic_buy_score: int
+
+    def rule_for(self, tld: str) -> TierRule:
+        return self.tld_rules.get(tld, self.default_rule)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScoringPolicy":
+        tld_rules: Dict[str, TierRule] = {}
+        for tier in data["tiers"].values():
+            rule = _tier_rule(tier)
+            for tld in tier["tlds"]:
+                # First tier listing a TLD wins, matching the if/elif order
+                tld_rules.setdefault(tld.lower(), rule)
+
+        structure = data["structure"]
+        roi = data["roi"]
+        heuristic = data["heuristic"]
+        return cls(
+            tld_rules=tld_rules,
+            default_rule=_tier_rule(data["default_tier"]),
+            max_hyphens=int(structure["max_hyphens"]),
+            hyphen_penalty=float(structure["hyphen_penalty"]),
+            max_mixed_length=int(structure["max_mixed_length"]),
+            digit_penalty=float(structure["digit_penalty"]),
+            max_length=int(structure["max_length"]),
+            roi_multiple=float(roi["min_multiple"]),
+            high_price=float(roi["high_price"]),
+            high_price_roi_multiple=float(roi["high_price_min_multiple"]),
+            short_length=int(heuristic["short_length"]),
+            short_bonus=int(heuristic["short_bonus"]),
+            medium_length=int(heuristic["medium_length"]),
+            medium_bonus=int(heuristic["medium_bonus"]),
+            clean_bonus=int(heuristic["clean_bonus"]),
+            cheap_price=float(heuristic["cheap_price"]),
+            cheap_bonus=int(heuristic["cheap_bonus"]),
+            heuristic_buy_score=int(heuristic["buy_score"]),
+        )
+
+
+def _tier_rule(tier: Dict[str, Any]) -> TierRule:
+    return TierRule(
+        min_value=float(tier["min_value"]),
+        min_probability=float(tier["min_probability"]),
+        heuristic_bonus=int(tier.get("heuristic_bonus", 0)),
+    )
+
+
+def load_policy(path: Optional[str] = None) -> ScoringPolicy:
+    """
+    Compiles a rules file. A custom file only needs the sections it changes:
+    "tiers" replaces the built-in tiers, other sections are merged key by key.
+    """
+    data = _read(DEFAULT_RULES_PATH)
+    if path:
+        for section, value in _read(path).items():
+            if isinstance(value, dict) and section != "tiers":
+                data[section] = {**data.get(section, {}), **value}
+            else:
+                data[section] = value
+    return ScoringPolicy.from_dict(data)
+
+
+def _read(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+DEFAULT_POLICY = load_policy()
@@ -0,0 +1,198 @@
+from dataclasses import replace
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.application.rules import DEFAULT_POLICY, ScoringPolicy
+from app.domain.models import DomainEvaluation, Recommendation
+from app.domain.results import AVAILABLE, EvaluationTable
+
+
+def split_domains(domains: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Splits domains into name (first label) and lower-cased TLD columns."""
+    names: List[str] = []
+    tlds: List[str] = []
+    for domain in domains:
+        names.append(domain.partition(".")[0])
+        tlds.append(domain.rpartition(".")[2].lower())
+    return np.array(names, dtype=str), np.array(tlds, dtype=str)
+
+
+class BatchScorer:
+    """
+    Columnar equivalent of analyze_potential.
+    Takes one array per input field and decides a whole batch at once,
+    for rescoring large sets of already-fetched evaluations.
+    """
+
+    def __init__(self, policy: ScoringPolicy = DEFAULT_POLICY):
+        self._policy = policy
+
+    def score(
+        self,
+        names: np.ndarray,
+        tlds: np.ndarray,
+        available: np.ndarray,
+        prices: np.ndarray,
+        go_values: np.ndarray,
+        probabilities: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (buy, heuristic_score) arrays. `prices` uses NaN for "no price".
+        The heuristic score is the fallback score used when GoValue data is missing.
+        """
+        available = np.asarray(available, dtype=bool)
+        prices = np.asarray(prices, dtype=float)
+        go_values = np.asarray(go_values, dtype=float)
+        probabilities = np.asarray(probabilities, dtype=float)
+
+        policy = self._policy
+
+        # 1. TLD tiers, looked up once per distinct TLD
+        min_value, min_prob, tld_bonus = self._tld_columns(tlds)
+
+        # 2. Structure (same rules as the pre-screen plus the value penalties)
+        length, hyphens, digits = _name_features(names)
+        has_digit = digits > 0
+        mixed = has_digit & (digits < length)
+
+        rejected = (
+            (hyphens > policy.max_hyphens)
+            | (mixed & (length > policy.max_mixed_length))
+            | (length > policy.max_length)
+        )
+        min_value = (
+            min_value
+            + policy.hyphen_penalty * (hyphens > 0)
+            + policy.digit_penalty * mixed
+        )
+
+        # 4. ROI check (NaN compares False, so rows without a price pass)
+        priced = prices > 0
+        roi_failed = priced & (go_values < prices * policy.roi_multiple)
+        roi_failed |= (
+            priced
+            & (prices > policy.high_price)
+            & (go_values < prices * policy.high_price_roi_multiple)
+        )
+
+        meets_api_criteria = (go_values >= min_value) & (probabilities >= min_prob)
+
+        # Fallback heuristic for rows without API data
+        score = (
+            tld_bonus
+            + policy.short_bonus * (length <= policy.short_length)
+            + policy.medium_bonus
+            * ((length > policy.short_length) & (length <= policy.medium_length))
+            + policy.clean_bonus * ((hyphens == 0) & ~has_digit)
+            + policy.cheap_bonus * ((prices != 0) & (prices < policy.cheap_price))
+        ).astype(np.int32)
+        heuristic_buy = (
+            (go_values == 0)
+            & (probabilities == 0)
+            & (score >= policy.heuristic_buy_score)
+        )
+
+        buy = (
+            available
+            & ~rejected
+            & ~roi_failed
+            & (meets_api_criteria | heuristic_buy)
+        )
+        return buy, score
+
+    def _tld_columns(
+        self, tlds: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Row 0 of each table is the default tier; known TLDs map to 1..n
+        index = {tld: i + 1 for i, tld in enumerate(self._policy.tld_rules)}
+        rules = [self._policy.default_rule, *self._policy.tld_rules.values()]
+        tlds = np.asarray(tlds, dtype=str)
+        codes = np.fromiter(
+            (index.get(tld, 0) for tld in tlds.tolist()), np.intp, tlds.size
+        )
+        min_value = np.array([rule.min_value for rule in rules], dtype=float)
+        min_prob = np.array([rule.min_probability for rule in rules], dtype=float)
+        bonus = np.array([rule.heuristic_bonus for rule in rules], dtype=np.int32)
+        return min_value[codes], min_prob[codes], bonus[codes]
+
+    def score_evaluations(
+        self, evaluations: Sequence[DomainEvaluation]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(evaluations, EvaluationTable):
+            domains: Iterable[str] = evaluations.domains
+        else:
+            domains = (e.domain for e in evaluations)
+        names, tlds = split_domains(domains)
+        count = len(evaluations)
+        if isinstance(evaluations, EvaluationTable):
+            # Numeric columns are already contiguous; view them without copying
+            return self.score(
+                names,
+                tlds,
+                np.frombuffer(evaluations.availability_codes, np.int8) == AVAILABLE,
+                np.frombuffer(evaluations.prices, float),
+                np.frombuffer(evaluations.go_values, float),
+                np.frombuffer(evaluations.sale_probabilities, float),
+            )
+        return self.score(
+            names,
+            tlds,
+            np.fromiter((bool(e.is_available) for e in evaluations), bool, count),
+            np.fromiter((_price(e.price) for e in evaluations), float, count),
+            np.fromiter((e.go_value for e in evaluations), float, count),
+            np.fromiter((e.sale_probability for e in evaluations), float, count),
+        )
+
+    def recommendations(
+        self, evaluations: Sequence[DomainEvaluation]
+    ) -> List[Recommendation]:
+        buy, _ = self.score_evaluations(evaluations)
+        return [Recommendation.BUY if b else Recommendation.SKIP for b in buy]
+
+
+def rescore(
+    evaluations: Iterable[DomainEvaluation],
+    policy: ScoringPolicy,
+    chunk_size: int = 100_000,
+) -> Iterator[DomainEvaluation]:
+    """
+    Re-decides stored evaluations under another policy, without any lookups.
+    Rows rejected by the pre-screen or failed have no provider data and stay SKIP.
+    """
+    scorer = BatchScorer(policy)
+    iterator = iter(evaluations)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        for evaluation, recommendation in zip(chunk, scorer.recommendations(chunk)):
+            yield replace(evaluation, recommendation=recommendation)
+
+
+def _name_features(names: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns (length, hyphen count, digit count) per name.
+    Works on the raw UCS-4 code points of the fixed-width string array,
+    so no Python-level call is made per name.
+    """
+    names = np.ascontiguousarray(names, dtype=str)
+    if names.size == 0 or names.dtype.itemsize == 0:
+        empty = np.zeros(names.size, dtype=np.int64)
+        return empty, empty, empty
+
+    codes = names.view(np.uint32).reshape(names.size, -1)
+    length = np.count_nonzero(codes, axis=1)
+    hyphens = np.count_nonzero(codes == ord("-"), axis=1)
+    digits = np.count_nonzero((codes >= ord("0")) & (codes <= ord("9")), axis=1)
+
+    # str.isdigit also accepts non-ASCII digits; those rare rows take the slow path
+    non_ascii = np.flatnonzero((codes > 127).any(axis=1))
+    for i in non_ascii:
+        digits[i] = sum(char.isdigit() for char in str(names[i]))
+    return length, hyphens, digits
+
+
+def _price(price: Optional[float]) -> float:
+    return np.nan if price is None else price
@@ -1,11 +1,163 @@
-from typing import List
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
 from app.domain.models import (
     DomainEvaluation,
+    EvaluationPlan,
     Recommendation,
     DomainAvailability,
     DomainAppraisal,
+    SkipReason,
+)
+from app.domain.results import EvaluationTable
+from app.application.prescreen import prescreen
+from app.application.rules import DEFAULT_POLICY, ScoringPolicy
+from app.domain.ports import (
+    AppraisalProvider,
+    AvailabilityProvider,
+    MetricsRecorder,
+    NULL_METRICS,
+    WhoisProvider,
 )
-from app.domain.ports import AvailabilityProvider, AppraisalProvider, WhoisProvider
+
+
+def analyze_potential(
+    domain: str,
+    availability: DomainAvailability,
+    appraisal: DomainAppraisal,
+    policy: ScoringPolicy = DEFAULT_POLICY,
+) -> bool:
+    """
+    Comprehensive domain evaluation logic.
+    Analyzes TLD tier, structure, length, availability, and financial metrics.
+    All thresholds come from the compiled scoring policy.
+    """
+    # 0. Basic Availability Check
+    if not availability.available:
+        return False
+
+    # 1. TLD Analysis: premium, standard or obscure tier thresholds
+    tld = domain.rpartition(".")[2].lower()
+    rule = policy.rule_for(tld)
+    min_value = rule.min_value
+    min_prob = rule.min_probability
+
+    # 2. Structure and Length Check (string-only rules live in the pre-screen)
+    if prescreen(domain, policy) is not None:
+        return False
+
+    domain_name = domain.partition(".")[0]
+    has_hyphen = "-" in domain_name
+    has_digit = any(char.isdigit() for char in domain_name)
+
+    # Hyphens: Generally reduce resale liquidity
+    if has_hyphen:
+        min_value += policy.hyphen_penalty
+
+    # Numbers: Pure numeric (e.g. 888.com) is good, short mixed (buy4u) needs more value
+    if has_digit and not domain_name.isdigit():
+        min_value += policy.digit_penalty
+
+    # 4. Financial Viability (ROI Check)
+    # If we have a buy price, ensure potential profit margin
+    price = availability.price
+    if price and price > 0:
+        # e.g. 3x: Buy for $1000, GoValue should be $3000+
+        if appraisal.go_value < (price * policy.roi_multiple):
+            return False
+
+        # Hard cap on investment risk, unless it's an amazing deal
+        if price > policy.high_price:
+            if appraisal.go_value < (price * policy.high_price_roi_multiple):
+                return False
+
+    # Final Decision
+    meets_api_criteria = (
+        appraisal.go_value >= min_value and appraisal.sale_probability >= min_prob
+    )
+
+    if meets_api_criteria:
+        return True
+
+    # Fallback Heuristic: If API data is missing (0), but domain structure is strong
+    if appraisal.go_value == 0 and appraisal.sale_probability == 0:
+        # Preferred TLD choice
+        score = rule.heuristic_bonus
+
+        # Short length bonus
+        if len(domain_name) <= policy.short_length:
+            score += policy.short_bonus
+        elif len(domain_name) <= policy.medium_length:
+            score += policy.medium_bonus
+
+        # Clean name bonus
+        if not has_hyphen and not has_digit:
+            score += policy.clean_bonus
+
+        # If affordable
+        if price and price < policy.cheap_price:
+            score += policy.cheap_bonus
+
+        # Threshold for "Heuristic Buy"
+        if score >= policy.heuristic_buy_score:
+            return True
+
+    return False
+
+
+def _no_appraisal(domain: str) -> DomainAppraisal:
+    # Placeholder for lookups skipped by the evaluation plan
+    return DomainAppraisal(domain=domain, go_value=0.0, sale_probability=0.0)
+
+
+def rejected_evaluation(domain: str, reason: SkipReason) -> DomainEvaluation:
+    return DomainEvaluation(
+        domain=domain,
+        is_available=None,
+        go_value=0.0,
+        sale_probability=0.0,
+        recommendation=Recommendation.SKIP,
+        skip_reason=reason,
+    )
+
+
+def failed_evaluation(domain: str, error: Exception) -> DomainEvaluation:
+    return DomainEvaluation(
+        domain=domain,
+        is_available=False,
+        go_value=0.0,
+        sale_probability=0.0,
+        recommendation=Recommendation.SKIP,
+        error=str(error) or type(error).__name__,
+    )
+
+
+def outcome_of(evaluation: DomainEvaluation) -> str:
+    if evaluation.skip_reason is not None:
+        return "rejected"
+    return evaluation.recommendation.name.lower()
+
+
+def record_stage(metrics: MetricsRecorder, stage: str, started: float) -> None:
+    metrics.observe(
+        "domain_intel_stage_seconds", time.perf_counter() - started, stage=stage
+    )
+
+
+def record_outcome(metrics: MetricsRecorder, outcome: str, started: float) -> None:
+    metrics.observe("domain_intel_evaluation_seconds", time.perf_counter() - started)
+    metrics.increment("domain_intel_evaluations_total", outcome=outcome)
 
 
 class EvaluateDomainUseCase:
@@ -14,27 +166,63 @@ class EvaluateDomainUseCase:
         availability_provider: AvailabilityProvider,
         appraisal_provider: AppraisalProvider,
         whois_provider: WhoisProvider,
+        plan: Optional[EvaluationPlan] = None,
+        policy: ScoringPolicy = DEFAULT_POLICY,
+        metrics: MetricsRecorder = NULL_METRICS,
     ):
         self._availability_provider = availability_provider
         self._appraisal_provider = appraisal_provider
         self._whois_provider = whois_provider
+        self._plan = plan or EvaluationPlan.full()
+        self._policy = policy
+        self._metrics = metrics
 
-    def execute(self, domain: str) -> DomainEvaluation:
-        # Arthur's logic: Check availability first
-        availability: DomainAvailability = (
-            self._availability_provider.check_availability(domain)
-        )
+    def execute(
+        self, domain: str, availability: Optional[DomainAvailability] = None
+    ) -> DomainEvaluation:
+        started = time.perf_counter()
+        try:
+            result = self._evaluate(domain, availability)
+        except Exception:
+            record_outcome(self._metrics, "error", started)
+            raise
+        record_outcome(self._metrics, outcome_of(result), started)
+        return result
+
+    def _evaluate(
+        self, domain: str, availability: Optional[DomainAvailability]
+    ) -> DomainEvaluation:
+        # Reject structurally hopeless domains before spending any API quota
+        reason = self.prescreen(domain)
+        if reason is not None:
+            return rejected_evaluation(domain, reason)
 
-        # Get appraisal to combine results as per requirements
-        appraisal: DomainAppraisal = self._appraisal_provider.get_appraisal(domain)
+        # Arthur's logic: Check availability first (unless prefetched in bulk)
+        if availability is None:
+            started = time.perf_counter()
+            availability = self._availability_provider.check_availability(domain)
+            record_stage(self._metrics, "availability", started)
 
-        # Get WHOIS info if not available (or generally)
+        # Get appraisal to combine results as per requirements.
+        # Taken domains are SKIP regardless, so the plan may leave them unappraised.
+        if availability.available or self._plan.appraise_taken:
+            started = time.perf_counter()
+            appraisal = self._appraisal_provider.get_appraisal(domain)
+            record_stage(self._metrics, "appraisal", started)
+        else:
+            appraisal = _no_appraisal(domain)
+
+        # Get WHOIS info if not available (and the plan asks for it)
         registrant = None
-        if not availability.available:
+        if not availability.available and self._plan.registrant:
+            started = time.perf_counter()
             registrant = self._whois_provider.get_registrant(domain)
+            record_stage(self._metrics, "whois", started)
 
         # Advanced Analysis
+        started = time.perf_counter()
         is_buy = self._analyze_potential(domain, availability, appraisal)
+        record_stage(self._metrics, "scoring", started)
 
         return DomainEvaluation(
             domain=domain,
@@ -46,119 +234,118 @@ class EvaluateDomainUseCase:
             registrant=registrant,
         )
 
+    def prescreen(self, domain: str) -> Optional[SkipReason]:
+        return prescreen(domain, self._policy)
+
+    def prefetch_availability(self, domains: List[str]) -> Dict[str, DomainAvailability]:
+        """
+        Checks availability for many domains with one bulk request.
+        Returns an empty mapping on failure so domains fall back to single checks.
+        """
+        if not self._availability_provider.supports_bulk:
+            return {}
+        started = time.perf_counter()
+        try:
+            results = self._availability_provider.check_availability_bulk(domains)
+        except Exception as e:
+            print(f"Bulk availability failed for {len(domains)} domains: {e}")
+            self._metrics.increment("domain_intel_bulk_failures_total")
+            return {}
+        record_stage(self._metrics, "availability_bulk", started)
+        return {result.domain: result for result in results}
+
     def _analyze_potential(
         self,
         domain: str,
         availability: DomainAvailability,
         appraisal: DomainAppraisal,
     ) -> bool:
-        """
-        Comprehensive domain evaluation logic.
-        Analyzes TLD tier, structure, length, availability, and financial metrics.
-        """
-        # 0. Basic Availability Check
-        if not availability.available:
-            return False
-
-        # 1. TLD Analysis
-        tld = domain.split(".")[-1].lower()
-        premium_tlds = {"com", "ai", "io"}
-        standard_tlds = {"net", "org", "co", "app", "dev"}
+        return analyze_potential(domain, availability, appraisal, self._policy)
 
-        # Base thresholds
-        min_value = 500.0
-        min_prob = 0.2
 
-        if tld in premium_tlds:
-            min_value = 500  # Keep standard for premium
-        elif tld in standard_tlds:
-            min_value = 1000  # Higher bar for standard
-            min_prob = 0.3
-        else:
-            # Obscure TLDs need very high stats to be worth flipping
-            min_value = 2500
-            min_prob = 0.4
-
-        # 2. Structure Check (Hyphens and Numbers)
-        domain_name = domain.split(".")[0]
-
-        # Hyphens: Generally reduce resale liquidity
-        if "-" in domain_name:
-            if domain_name.count("-") > 1:
-                return False  # More than 1 hyphen is usually junk
-            min_value += 500  # Raise bar for hyphenated domains
-
-        # Numbers: Digits mixed with letters usually bad
-        if any(char.isdigit() for char in domain_name):
-            # Pure numeric (e.g. 888.com) is good, but mixed (buy4you) is bad
-            if not domain_name.isdigit():
-                # Unless very short, mixed alphanumeric is hard to sell
-                if len(domain_name) > 6:
-                    return False
-                min_value += 500
-
-        # 3. Length Check
-        # Shorter is better.
-        if len(domain_name) > 20:
-            return False
-
-        # 4. Financial Viability (ROI Check)
-        # If we have a buy price, ensure potential profit margin
-        if availability.price and availability.price > 0:
-            # We want at least 3x potential return based on GoValue
-            # e.g. Buy for $1000, GoValue should be $3000+
-            if appraisal.go_value < (availability.price * 3):
-                return False
-
-            # Hard cap on investment risk (e.g. don't suggest buying $5000 domains automatically)
-            if availability.price > 2000:
-                # Unless it's an amazing deal (10x)
-                if appraisal.go_value < (availability.price * 10):
-                    return False
-
-        # Final Decision
-        meets_api_criteria = (
-            appraisal.go_value >= min_value and appraisal.sale_probability >= min_prob
-        )
+class BatchEvaluateUseCase:
+    def __init__(
+        self,
+        evaluate_use_case: EvaluateDomainUseCase,
+        max_workers: int = 1,
+        chunk_size: int = 500,
+    ):
+        self._evaluate_use_case = evaluate_use_case
+        self._max_workers = max(1, max_workers)
+        # Availability is prefetched in bulk for this many domains at a time
+        self._chunk_size = max(1, chunk_size)
 
-        if meets_api_criteria:
-            return True
+    def execute(self, domains: Iterable[str]) -> EvaluationTable:
+        return EvaluationTable(self.execute_iter(domains))
 
-        # Fallback Heuristic: If API data is missing (0), but domain structure is strong
-        if appraisal.go_value == 0 and appraisal.sale_probability == 0:
-            score = 0
-            # Preferred choice
-            if tld in premium_tlds:
-                score += 50
-            elif tld in standard_tlds:
-                score += 20
-
-            # Short length bonus
-            if len(domain_name) <= 6:
-                score += 30
-            elif len(domain_name) <= 10:
-                score += 15
-
-            # Clean name bonus
-            if "-" not in domain_name and not any(
-                char.isdigit() for char in domain_name
-            ):
-                score += 20
-
-            # If affordable
-            if availability.price and availability.price < 50:
-                score += 10
-
-            # Threshold for "Heuristic Buy"
-            if score >= 80:
-                return True
+    def execute_iter(
+        self, domains: Iterable[str], ordered: bool = True
+    ) -> Iterator[DomainEvaluation]:
+        """
+        Evaluates domains on a bounded worker pool.
+        Yields results in input order, or in completion order if `ordered` is False.
+        Only a small window of domains is in flight, so `domains` may be a generator.
+        """
+        items = self._with_availability(domains)
 
-        return False
+        if self._max_workers == 1:
+            for domain, availability in items:
+                yield self._evaluate_safe(domain, availability)
+            return
 
+        window = self._max_workers * 2
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="evaluate"
+        ) as pool:
+            if ordered:
+                queue: Deque[Future] = deque()
+                for domain, availability in items:
+                    queue.append(
+                        pool.submit(self._evaluate_safe, domain, availability)
+                    )
+                    if len(queue) >= window:
+                        yield queue.popleft().result()
+                while queue:
+                    yield queue.popleft().result()
+            else:
+                pending: Set[Future] = set()
+                for domain, availability in items:
+                    pending.add(pool.submit(self._evaluate_safe, domain, availability))
+                    if len(pending) >= window:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
 
-class BatchEvaluateUseCase:
-    def __init__(self, evaluate_use_case: EvaluateDomainUseCase):
-        self._evaluate_use_case = evaluate_use_case
+    def _with_availability(
+        self, domains: Iterable[str]
+    ) -> Iterator[Tuple[str, Optional[DomainAvailability]]]:
+        # Splits the input into chunks and prefetches availability for each chunk
+        iterator = iter(domains)
+        while True:
+            chunk = list(islice(iterator, self._chunk_size))
+            if not chunk:
+                return
+            # Pre-screened rejects are never sent to the bulk endpoint
+            candidates = [
+                domain
+                for domain in chunk
+                if self._evaluate_use_case.prescreen(domain) is None
+            ]
+            prefetched: Dict[str, DomainAvailability] = {}
+            if len(candidates) > 1:
+                prefetched = self._evaluate_use_case.prefetch_availability(candidates)
+            for domain in chunk:
+                yield domain, prefetched.get(domain)
 
-    def execute(self, domains: List[str]) -> List[DomainEvaluation]:
-        return [self._evaluate_use_case.execute(domain) for domain in domains]
+    def _evaluate_safe(
+        self, domain: str, availability: Optional[DomainAvailability] = None
+    ) -> DomainEvaluation:
+        # One failing domain must not abort the whole batch
+        try:
+            return self._evaluate_use_case.execute(domain, availability)
+        except Exception as e:
+            return failed_evaluation(domain, e)
@@ -0,0 +1,61 @@
+import time
+from typing import List
+
+from app.application.use_cases import BatchEvaluateUseCase
+from app.domain.models import DomainEvaluation
+from app.domain.ports import WorkQueue
+
+
+class ShardWorker:
+    """
+    Pulls shards from a work queue and evaluates them until the queue is drained.
+    Several of these can run side by side in processes. While other workers
+    still hold leases it waits, so it can pick up a shard whose owner died.
+    """
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        batch: BatchEvaluateUseCase,
+        worker_id: str,
+        renew_every: float = 60.0,
+        poll_every: float = 5.0,
+    ):
+        self._queue = queue
+        self._batch = batch
+        self._worker_id = worker_id
+        self._renew_every = renew_every
+        # A released shard is pending again before any lease runs out
+        self._poll_every = poll_every
+
+    def run(self) -> int:
+        """Returns the number of domains this worker evaluated."""
+        evaluated = 0
+        while True:
+            shard = self._queue.lease(self._worker_id)
+            if shard is None:
+                wait = self._queue.seconds_until_lease()
+                if wait is None:
+                    return evaluated
+                time.sleep(min(wait, self._poll_every))
+                continue
+
+            results: List[DomainEvaluation] = []
+            renewed_at = time.monotonic()
+            try:
+                for result in self._batch.execute_iter(shard.domains):
+                    results.append(result)
+                    if time.monotonic() - renewed_at >= self._renew_every:
+                        if not self._queue.renew(shard):
+                            # Lease lost to another worker; drop this shard
+                            break
+                        renewed_at = time.monotonic()
+                else:
+                    if self._queue.complete(shard, results):
+                        evaluated += len(results)
+            except KeyboardInterrupt:
+                self._queue.release(shard, "interrupted")
+                raise
+            except Exception as e:
+                print(f"Worker {self._worker_id}: shard {shard.id} failed: {e}")
+                self._queue.release(shard, str(e))
@@ -0,0 +1,463 @@
+import os
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Optional, Union
+
+# Wires the ports to their adapters for every entry point (main.py, the
+# worker processes, benchmarks/). Only what every run needs is imported
+# here: HTTP clients, python-whois and the optional modes load on first
+# use, which keeps a one-off CLI call (e.g. from cron) cheap;
+# tests/test_import_time.py guards this.
+from app.infrastructure.cache import (
+    AsyncCachedAppraisalProvider,
+    AsyncCachedAvailabilityProvider,
+    AsyncCachedWhoisProvider,
+    CachedAppraisalProvider,
+    CachedAvailabilityProvider,
+    CachedWhoisProvider,
+    SqliteCache,
+)
+from app.infrastructure.config import Settings
+from app.infrastructure.lazy import (
+    LazyAppraisalProvider,
+    LazyAvailabilityProvider,
+    LazyWhoisProvider,
+)
+from app.infrastructure.memo import (
+    AsyncMemoizedAppraisalProvider,
+    AsyncMemoizedAvailabilityProvider,
+    AsyncMemoizedWhoisProvider,
+    MemoCache,
+    MemoizedAppraisalProvider,
+    MemoizedAvailabilityProvider,
+    MemoizedWhoisProvider,
+)
+from app.application.rules import ScoringPolicy, load_policy
+from app.application.use_cases import BatchEvaluateUseCase, EvaluateDomainUseCase
+from app.domain.models import EvaluationPlan
+from app.domain.ports import (
+    NULL_METRICS,
+    AppraisalProvider,
+    AsyncWhoisProvider,
+    AvailabilityProvider,
+    MetricsRecorder,
+    WhoisProvider,
+)
+
+if TYPE_CHECKING:
+    from app.application.async_use_cases import AsyncBatchEvaluateUseCase
+    from app.infrastructure.hedging import HedgeDelay
+    from app.infrastructure.profiling import Profiler
+    from app.infrastructure.whois_client import WhoisClient
+    from app.infrastructure.work_queue import FileWorkQueue, SqliteWorkQueue
+    from app.infrastructure.zone_index import ZoneDirectory
+
+def build_cache(
+    settings: Settings,
+    metrics: MetricsRecorder = NULL_METRICS,
+    enabled: bool = True,
+    refresh: bool = False,
+    resources: Optional[ExitStack] = None,
+) -> Optional[SqliteCache]:
+    if not enabled or not settings.CACHE_ENABLED:
+        return None
+    cache = SqliteCache(
+        settings.CACHE_PATH,
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        refresh=refresh,
+        metrics=metrics,
+    )
+    if resources is not None:
+        # Registered first, so closed last; writes the batched access times
+        resources.callback(cache.close)
+    return cache
+
+
+def build_metrics(enabled: bool) -> MetricsRecorder:
+    # Metrics are only collected when they will be written
+    if not enabled:
+        return NULL_METRICS
+    from app.infrastructure.metrics import MetricsRegistry
+
+    return MetricsRegistry()
+
+
+def build_profiler(enabled: bool) -> Optional["Profiler"]:
+    if not enabled:
+        return None
+    from app.infrastructure.profiling import Profiler
+
+    return Profiler()
+
+
+def build_memo(
+    settings: Settings, metrics: MetricsRecorder = NULL_METRICS, name: str = "memo"
+) -> MemoCache:
+    return MemoCache(
+        maxsize=settings.MEMO_MAX_ENTRIES,
+        ttl=settings.MEMO_TTL,
+        metrics=metrics,
+        name=name,
+    )
+
+
+def build_zones(settings: Settings) -> Optional["ZoneDirectory"]:
+    # Nothing to import or open until `zone build` has been run
+    if not os.path.isdir(settings.ZONE_INDEX_DIR):
+        return None
+    from app.infrastructure.zone_index import ZoneDirectory
+
+    return ZoneDirectory(settings.ZONE_INDEX_DIR, settings.ZONE_INDEX_MAX_AGE)
+
+
+def build_python_whois(
+    settings: Settings,
+    metrics: MetricsRecorder = NULL_METRICS,
+    resources: Optional[ExitStack] = None,
+) -> WhoisProvider:
+    from app.infrastructure.whois_service import GlobalWhoisService, WhoisParserPool
+
+    if settings.WHOIS_PROCESSES <= 0:
+        return GlobalWhoisService(metrics)
+    parser = WhoisParserPool(settings.WHOIS_PROCESSES)
+    if resources is not None:
+        resources.callback(parser.close)
+    return GlobalWhoisService(metrics, parser)
+
+
+def whois_backend(
+    name: str,
+    settings: Settings,
+    client: "WhoisClient",
+    metrics: MetricsRecorder = NULL_METRICS,
+    resources: Optional[ExitStack] = None,
+) -> WhoisProvider:
+    if name == "python-whois":
+        return build_python_whois(settings, metrics, resources)
+
+    from app.infrastructure.whois_service import NativeWhoisService
+
+    native = NativeWhoisService(client, metrics)
+    if name == "native":
+        return native
+
+    from app.infrastructure.rdap import RdapWhoisService
+
+    # TLDs without RDAP fall back to port 43
+    return RdapWhoisService(settings, native, metrics=metrics)
+
+
+def build_hedge_delay(settings: Settings) -> "HedgeDelay":
+    from app.infrastructure.hedging import HedgeDelay
+
+    return HedgeDelay(settings.WHOIS_HEDGE_PERCENTILE, settings.WHOIS_HEDGE_MIN_DELAY)
+
+
+def build_whois(
+    settings: Settings,
+    metrics: MetricsRecorder = NULL_METRICS,
+    cache: Optional[SqliteCache] = None,
+    max_workers: int = 8,
+    resources: Optional[ExitStack] = None,
+    profiler: Optional["Profiler"] = None,
+) -> WhoisProvider:
+    from app.infrastructure.whois_client import WhoisClient
+
+    # The disk cache also keeps the TLD -> server map between runs. With
+    # hedging both sources share the client, so per-server limits still hold.
+    client = WhoisClient(settings.WHOIS_TIMEOUT, settings.WHOIS_MAX_PER_SERVER, cache)
+    primary = whois_backend(
+        settings.WHOIS_BACKEND, settings, client, metrics, resources
+    )
+    hedge = settings.WHOIS_HEDGE_BACKEND
+    if not hedge or hedge == settings.WHOIS_BACKEND:
+        return primary
+
+    from app.infrastructure.hedging import HedgedWhoisProvider
+
+    secondary = whois_backend(hedge, settings, client, metrics, resources)
+    if profiler is not None:
+        from app.infrastructure.profiling import ThreadCpuWhoisProvider
+
+        # Both sources run on the hedge pool, not on the profiled caller
+        primary = ThreadCpuWhoisProvider(primary, profiler)
+        secondary = ThreadCpuWhoisProvider(secondary, profiler)
+    hedged = HedgedWhoisProvider(
+        primary,
+        secondary,
+        build_hedge_delay(settings),
+        metrics,
+        # Each caller can hold two lookups, plus abandoned slow ones
+        max_workers=4 * max_workers,
+    )
+    if resources is not None:
+        resources.callback(hedged.close)
+    return hedged
+
+
+def async_whois_backend(
+    name: str,
+    settings: Settings,
+    client: "WhoisClient",
+    metrics: MetricsRecorder = NULL_METRICS,
+    profiler: Optional["Profiler"] = None,
+    resources: Optional[ExitStack] = None,
+) -> AsyncWhoisProvider:
+    if name == "python-whois":
+        from app.infrastructure.whois_service import AsyncGlobalWhoisService
+
+        blocking_whois = build_python_whois(settings, metrics, resources)
+        if profiler is not None:
+            from app.infrastructure.profiling import ProfiledWhoisProvider
+
+            # WHOIS runs on executor threads, where its CPU time can be measured
+            blocking_whois = ProfiledWhoisProvider(blocking_whois, profiler)
+        return AsyncGlobalWhoisService(settings.WHOIS_MAX_CONCURRENCY, blocking_whois)
+
+    from app.infrastructure.whois_client import AsyncWhoisClient
+    from app.infrastructure.whois_service import AsyncNativeWhoisService
+
+    whois_service: AsyncWhoisProvider = AsyncNativeWhoisService(
+        AsyncWhoisClient(client), metrics
+    )
+    if name != "native":
+        from app.infrastructure.rdap import AsyncRdapWhoisService
+
+        whois_service = AsyncRdapWhoisService(settings, whois_service, metrics=metrics)
+    if profiler is not None:
+        from app.infrastructure.profiling import AsyncProfiledWhoisProvider
+
+        whois_service = AsyncProfiledWhoisProvider(whois_service, profiler)
+    return whois_service
+
+
+def build_async_whois(
+    settings: Settings,
+    metrics: MetricsRecorder = NULL_METRICS,
+    cache: Optional[SqliteCache] = None,
+    profiler: Optional["Profiler"] = None,
+    resources: Optional[ExitStack] = None,
+) -> AsyncWhoisProvider:
+    from app.infrastructure.whois_client import WhoisClient
+
+    client = WhoisClient(settings.WHOIS_TIMEOUT, settings.WHOIS_MAX_PER_SERVER, cache)
+    hedge = settings.WHOIS_HEDGE_BACKEND
+    if not hedge or hedge == settings.WHOIS_BACKEND:
+        return async_whois_backend(
+            settings.WHOIS_BACKEND, settings, client, metrics, profiler, resources
+        )
+
+    from app.infrastructure.hedging import AsyncHedgedWhoisProvider
+
+    # Profiled as a whole: a hedged lookup is one "whois" stage call
+    whois_service: AsyncWhoisProvider = AsyncHedgedWhoisProvider(
+        async_whois_backend(
+            settings.WHOIS_BACKEND, settings, client, metrics, resources=resources
+        ),
+        async_whois_backend(hedge, settings, client, metrics, resources=resources),
+        build_hedge_delay(settings),
+        metrics,
+    )
+    if profiler is not None:
+        from app.infrastructure.profiling import AsyncProfiledWhoisProvider
+
+        whois_service = AsyncProfiledWhoisProvider(whois_service, profiler)
+    return whois_service
+
+
+def build_batch_use_case(
+    settings: Settings,
+    max_workers: int,
+    cache: Optional[SqliteCache] = None,
+    plan: Optional[EvaluationPlan] = None,
+    policy: Optional[ScoringPolicy] = None,
+    metrics: MetricsRecorder = NULL_METRICS,
+    profiler: Optional["Profiler"] = None,
+    resources: Optional[ExitStack] = None,
+) -> BatchEvaluateUseCase:
+    # `resources` collects what has to be shut down at the end of the run
+    # Profiled inside the lazy wrappers, so building a provider (and importing
+    # its HTTP stack) on first call is not charged to its stage. Innermost, so
+    # only real provider calls are timed, not cache hits.
+    def availability() -> AvailabilityProvider:
+        from app.infrastructure.godaddy import GoDaddyAvailabilityService
+
+        service: AvailabilityProvider = GoDaddyAvailabilityService(
+            settings, metrics, profiler
+        )
+        if profiler is not None:
+            from app.infrastructure.profiling import ProfiledAvailabilityProvider
+
+            service = ProfiledAvailabilityProvider(service, profiler)
+        return service
+
+    def appraisal() -> AppraisalProvider:
+        from app.infrastructure.godaddy import GoDaddyAppraisalService
+
+        service: AppraisalProvider = GoDaddyAppraisalService(
+            settings, metrics, profiler
+        )
+        if profiler is not None:
+            from app.infrastructure.profiling import ProfiledAppraisalProvider
+
+            service = ProfiledAppraisalProvider(service, profiler)
+        return service
+
+    def whois() -> WhoisProvider:
+        service = build_whois(
+            settings, metrics, cache, max_workers, resources, profiler
+        )
+        if profiler is not None:
+            from app.infrastructure.profiling import ProfiledWhoisProvider
+
+            service = ProfiledWhoisProvider(service, profiler)
+        return service
+
+    # Built on first call: a run answered from cache never imports them.
+    # GoDaddy has a bulk availability endpoint.
+    availability_service: AvailabilityProvider = LazyAvailabilityProvider(
+        availability, supports_bulk=True
+    )
+    appraisal_service: AppraisalProvider = LazyAppraisalProvider(appraisal)
+    whois_service: WhoisProvider = LazyWhoisProvider(whois)
+
+    if cache is not None:
+        availability_service = CachedAvailabilityProvider(
+            availability_service, cache, settings.CACHE_TTL_AVAILABILITY
+        )
+        appraisal_service = CachedAppraisalProvider(
+            appraisal_service, cache, settings.CACHE_TTL_APPRAISAL
+        )
+        whois_service = CachedWhoisProvider(
+            whois_service, cache, settings.CACHE_TTL_WHOIS
+        )
+
+    zones = build_zones(settings)
+    if zones is not None:
+        from app.infrastructure.zone_index import ZoneAvailabilityProvider
+
+        # Outside the disk cache: zone answers are cheaper than a cache read
+        availability_service = ZoneAvailabilityProvider(
+            availability_service, zones, metrics
+        )
+
+    # In-process layer: dedupes repeats within a run and coalesces concurrent lookups
+    availability_service = MemoizedAvailabilityProvider(
+        availability_service, build_memo(settings, metrics, "availability")
+    )
+    appraisal_service = MemoizedAppraisalProvider(
+        appraisal_service, build_memo(settings, metrics, "appraisal")
+    )
+    whois_service = MemoizedWhoisProvider(
+        whois_service, build_memo(settings, metrics, "whois")
+    )
+
+    evaluate_use_case = EvaluateDomainUseCase(
+        availability_provider=availability_service,
+        appraisal_provider=appraisal_service,
+        whois_provider=whois_service,
+        plan=plan,
+        policy=policy or load_policy(settings.RULES_PATH or None),
+        metrics=metrics,
+    )
+    return BatchEvaluateUseCase(
+        evaluate_use_case,
+        max_workers=max_workers,
+        chunk_size=settings.AVAILABILITY_CHUNK_SIZE,
+    )
+
+
+def build_async_batch_use_case(
+    settings: Settings,
+    cache: Optional[SqliteCache] = None,
+    policy: Optional[ScoringPolicy] = None,
+    metrics: MetricsRecorder = NULL_METRICS,
+    profiler: Optional["Profiler"] = None,
+    resources: Optional[ExitStack] = None,
+) -> "AsyncBatchEvaluateUseCase":
+    # `resources` collects what has to be shut down at the end of the run
+    from app.application.async_use_cases import (
+        AsyncBatchEvaluateUseCase,
+        AsyncEvaluateDomainUseCase,
+    )
+    from app.infrastructure.godaddy_async import (
+        AsyncGoDaddyAppraisalService,
+        AsyncGoDaddyAvailabilityService,
+    )
+
+    availability_service = AsyncGoDaddyAvailabilityService(
+        settings, metrics, profiler
+    )
+    appraisal_service = AsyncGoDaddyAppraisalService(settings, metrics, profiler)
+
+    if profiler is not None:
+        from app.infrastructure.profiling import (
+            AsyncProfiledAppraisalProvider,
+            AsyncProfiledAvailabilityProvider,
+        )
+
+        availability_service = AsyncProfiledAvailabilityProvider(
+            availability_service, profiler
+        )
+        appraisal_service = AsyncProfiledAppraisalProvider(
+            appraisal_service, profiler
+        )
+
+    whois_service = build_async_whois(settings, metrics, cache, profiler, resources)
+
+    if cache is not None:
+        availability_service = AsyncCachedAvailabilityProvider(
+            availability_service, cache, settings.CACHE_TTL_AVAILABILITY
+        )
+        appraisal_service = AsyncCachedAppraisalProvider(
+            appraisal_service, cache, settings.CACHE_TTL_APPRAISAL
+        )
+        whois_service = AsyncCachedWhoisProvider(
+            whois_service, cache, settings.CACHE_TTL_WHOIS
+        )
+
+    zones = build_zones(settings)
+    if zones is not None:
+        from app.infrastructure.zone_index import AsyncZoneAvailabilityProvider
+
+        availability_service = AsyncZoneAvailabilityProvider(
+            availability_service, zones, metrics
+        )
+
+    availability_service = AsyncMemoizedAvailabilityProvider(
+        availability_service, build_memo(settings, metrics, "availability")
+    )
+    appraisal_service = AsyncMemoizedAppraisalProvider(
+        appraisal_service, build_memo(settings, metrics, "appraisal")
+    )
+    whois_service = AsyncMemoizedWhoisProvider(
+        whois_service, build_memo(settings, metrics, "whois")
+    )
+
+    evaluate_use_case = AsyncEvaluateDomainUseCase(
+        availability_provider=availability_service,
+        appraisal_provider=appraisal_service,
+        whois_provider=whois_service,
+        policy=policy or load_policy(settings.RULES_PATH or None),
+        metrics=metrics,
+    )
+    return AsyncBatchEvaluateUseCase(
+        evaluate_use_case,
+        max_concurrency=settings.ASYNC_MAX_CONCURRENCY,
+        chunk_size=settings.AVAILABILITY_CHUNK_SIZE,
+    )
+
+
+def open_queue(
+    settings: Settings, path: Optional[str] = None
+) -> Union["FileWorkQueue", "SqliteWorkQueue"]:
+    from app.infrastructure.work_queue import FileWorkQueue, SqliteWorkQueue
+
+    # "files" is for a directory shared by several hosts (NFS, SMB)
+    queue_class = SqliteWorkQueue
+    if settings.QUEUE_BACKEND == "files":
+        queue_class = FileWorkQueue
+    return queue_class(
+        path or settings.QUEUE_PATH,
+        lease_seconds=settings.QUEUE_LEASE_SECONDS,
+        max_attempts=settings.QUEUE_MAX_ATTEMPTS,
+    )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class Recommendation(Enum):
@@ -8,7 +8,15 @@ class Recommendation(Enum):
     SKIP = auto()
 
 
-@dataclass(frozen=True)
+class SkipReason(Enum):
+    """Why a domain was rejected by the pre-screen, before any lookups."""
+
+    TOO_MANY_HYPHENS = "too_many_hyphens"
+    MIXED_ALNUM_TOO_LONG = "mixed_alnum_too_long"
+    TOO_LONG = "too_long"
+
+
+@dataclass(frozen=True, slots=True)
 class DomainAvailability:
     domain: str
     available: bool
@@ -16,19 +24,51 @@ class DomainAvailability:
     currency: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainAppraisal:
     domain: str
     go_value: float
     sale_probability: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvaluation:
     domain: str
-    is_available: bool
+    # None when the domain was rejected before availability was checked
+    is_available: Optional[bool]
     go_value: float
     sale_probability: float
     recommendation: Recommendation
     price: Optional[float] = None
     registrant: Optional[str] = None
+    error: Optional[str] = None
+    skip_reason: Optional[SkipReason] = None
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A slice of a queued batch, leased by one worker at a time."""
+
+    id: int
+    domains: Tuple[str, ...]
+    worker_id: str
+    # Lease generation; a stale worker holding an older one cannot commit
+    attempt: int
+
+
+@dataclass(frozen=True)
+class EvaluationPlan:
+    """Which lookups an evaluation performs beyond the availability check."""
+
+    # Taken domains are always SKIP, so their GoValue is display-only
+    appraise_taken: bool = True
+    # Registrant is only shown for taken domains and never affects the decision
+    registrant: bool = True
+
+    @classmethod
+    def full(cls) -> "EvaluationPlan":
+        return cls()
+
+    @classmethod
+    def decision_only(cls) -> "EvaluationPlan":
+        return cls(appraise_taken=False, registrant=False)
@@ -1,12 +1,39 @@
 from abc import ABC, abstractmethod
-from app.domain.models import DomainAvailability, DomainAppraisal
+from typing import Iterable, List, Optional
+
+from app.domain.models import (
+    DomainAvailability,
+    DomainAppraisal,
+    DomainEvaluation,
+    Shard,
+)
 
 
 class AvailabilityProvider(ABC):
+    # True when check_availability_bulk is backed by a real multi-domain request
+    supports_bulk: bool = False
+
     @abstractmethod
     def check_availability(self, domain: str) -> DomainAvailability:
         pass
 
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        """
+        Checks many domains at once, returning results in input order.
+        Domains the provider could not resolve may be left out of the
+        result; callers check those individually.
+        Providers with a multi-domain endpoint override this.
+        """
+        return [self.check_availability(domain) for domain in domains]
+
+
+def in_input_order(
+    domains: List[str], results: Iterable[DomainAvailability]
+) -> List[DomainAvailability]:
+    # For bulk wrappers that answer some domains themselves and pass the rest on
+    found = {result.domain.lower(): result for result in results}
+    return [found[domain.lower()] for domain in domains if domain.lower() in found]
+
 
 class AppraisalProvider(ABC):
     @abstractmethod
@@ -18,3 +45,103 @@ class WhoisProvider(ABC):
     @abstractmethod
     def get_registrant(self, domain: str) -> str:
         pass
+
+
+class EvaluationJournal(ABC):
+    """Durable record of completed evaluations, used to resume a batch."""
+
+    @abstractmethod
+    def record(self, evaluation: DomainEvaluation) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+class MetricsRecorder(ABC):
+    """Counters and latency histograms; labels are passed as keyword arguments."""
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        pass
+
+    @abstractmethod
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        pass
+
+
+class NullMetrics(MetricsRecorder):
+    """Default recorder when metrics are off; every call is a no-op."""
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        pass
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+class WorkQueue(ABC):
+    """Durable queue of domain shards shared by worker processes."""
+
+    @abstractmethod
+    def lease(self, worker_id: str) -> Optional[Shard]:
+        """Takes the next pending or abandoned shard, or None when none is left."""
+
+    @abstractmethod
+    def renew(self, shard: Shard) -> bool:
+        """Extends the lease; False if another worker has since taken the shard."""
+
+    @abstractmethod
+    def complete(self, shard: Shard, results: Iterable[DomainEvaluation]) -> bool:
+        """
+        Stores results and closes the shard; False if the lease was lost.
+        Domains whose evaluation errored are queued again while the shard
+        has attempts left.
+        """
+
+    @abstractmethod
+    def release(self, shard: Shard, error: str) -> None:
+        """Gives a shard back after a failure so it can be retried."""
+
+    @abstractmethod
+    def seconds_until_lease(self) -> Optional[float]:
+        """
+        0 when a shard can be leased now, else the time until the earliest
+        active lease runs out; None once no shard is pending or leased.
+        """
+
+
+class SeenFilter(ABC):
+    """Set membership for dedup; may wrongly answer "seen", never "new"."""
+
+    @abstractmethod
+    def add(self, item: str) -> bool:
+        """Remembers `item`; True if it had not been seen before."""
+
+
+class AsyncAvailabilityProvider(ABC):
+    supports_bulk: bool = False
+
+    @abstractmethod
+    async def check_availability(self, domain: str) -> DomainAvailability:
+        pass
+
+    async def check_availability_bulk(
+        self, domains: List[str]
+    ) -> List[DomainAvailability]:
+        return [await self.check_availability(domain) for domain in domains]
+
+
+class AsyncAppraisalProvider(ABC):
+    @abstractmethod
+    async def get_appraisal(self, domain: str) -> DomainAppraisal:
+        pass
+
+
+class AsyncWhoisProvider(ABC):
+    @abstractmethod
+    async def get_registrant(self, domain: str) -> str:
+        pass
@@ -0,0 +1,170 @@
+import math
+import sys
+from array import array
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from app.domain.models import DomainEvaluation, Recommendation, SkipReason
+
+# Small-int codes used by the columns
+AVAILABILITY_UNKNOWN = -1
+NOT_AVAILABLE = 0
+AVAILABLE = 1
+
+_RECOMMENDATIONS = list(Recommendation)
+_SKIP_REASONS = list(SkipReason)
+_RECOMMENDATION_CODES = {r: i for i, r in enumerate(_RECOMMENDATIONS)}
+_SKIP_REASON_CODES = {r: i for i, r in enumerate(_SKIP_REASONS)}
+
+
+class EvaluationTable(Sequence[DomainEvaluation]):
+    """
+    Column-oriented, append-only store for large batches of evaluations.
+    Numbers live in contiguous typed arrays and enums in one-byte codes;
+    domains and registrants are interned, and the rare errors are kept sparse.
+    Rows are rebuilt as DomainEvaluation on access, so it reads like a list.
+    """
+
+    __slots__ = (
+        "_domains",
+        "_available",
+        "_recommendation",
+        "_skip_reason",
+        "_go_value",
+        "_sale_probability",
+        "_price",
+        "_registrant",
+        "_registrants",
+        "_registrant_codes",
+        "_errors",
+    )
+
+    def __init__(self, evaluations: Iterable[DomainEvaluation] = ()):
+        self._domains: List[str] = []
+        self._available = array("b")
+        self._recommendation = array("b")
+        self._skip_reason = array("b")
+        self._go_value = array("d")
+        self._sale_probability = array("d")
+        # NaN stands for "no price"
+        self._price = array("d")
+        # Index into `_registrants`, -1 for none; registrants repeat a lot
+        # ("Hidden/Error", privacy services), so each is stored once
+        self._registrant = array("i")
+        self._registrants: List[str] = []
+        self._registrant_codes: Dict[str, int] = {}
+        self._errors: Dict[int, str] = {}
+        self.extend(evaluations)
+
+    def append(self, evaluation: DomainEvaluation) -> None:
+        index = len(self._domains)
+        self._domains.append(sys.intern(evaluation.domain))
+        if evaluation.is_available is None:
+            self._available.append(AVAILABILITY_UNKNOWN)
+        elif evaluation.is_available:
+            self._available.append(AVAILABLE)
+        else:
+            self._available.append(NOT_AVAILABLE)
+        self._recommendation.append(_RECOMMENDATION_CODES[evaluation.recommendation])
+        self._skip_reason.append(
+            -1
+            if evaluation.skip_reason is None
+            else _SKIP_REASON_CODES[evaluation.skip_reason]
+        )
+        self._go_value.append(evaluation.go_value)
+        self._sale_probability.append(evaluation.sale_probability)
+        self._price.append(math.nan if evaluation.price is None else evaluation.price)
+        self._registrant.append(self._registrant_code(evaluation.registrant))
+        if evaluation.error is not None:
+            self._errors[index] = evaluation.error
+
+    def extend(self, evaluations: Iterable[DomainEvaluation]) -> None:
+        for evaluation in evaluations:
+            self.append(evaluation)
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    @overload
+    def __getitem__(self, index: int) -> DomainEvaluation: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "EvaluationTable": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[DomainEvaluation, "EvaluationTable"]:
+        if isinstance(index, slice):
+            rows = range(*index.indices(len(self)))
+            return EvaluationTable(self._row(i) for i in rows)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EvaluationTable index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[DomainEvaluation]:
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def __repr__(self) -> str:
+        return f"EvaluationTable({len(self)} rows)"
+
+    # Column access, e.g. for the vector scorer
+
+    @property
+    def domains(self) -> List[str]:
+        return self._domains
+
+    @property
+    def availability_codes(self) -> array:
+        return self._available
+
+    @property
+    def go_values(self) -> array:
+        return self._go_value
+
+    @property
+    def sale_probabilities(self) -> array:
+        return self._sale_probability
+
+    @property
+    def prices(self) -> array:
+        return self._price
+
+    def _registrant_code(self, registrant: Optional[str]) -> int:
+        if registrant is None:
+            return -1
+        code = self._registrant_codes.get(registrant)
+        if code is None:
+            code = len(self._registrants)
+            self._registrants.append(sys.intern(registrant))
+            self._registrant_codes[registrant] = code
+        return code
+
+    def _row(self, i: int) -> DomainEvaluation:
+        available = self._available[i]
+        price = self._price[i]
+        skip_reason = self._skip_reason[i]
+        registrant = self._registrant[i]
+        return DomainEvaluation(
+            domain=self._domains[i],
+            is_available=(
+                None if available == AVAILABILITY_UNKNOWN else available == AVAILABLE
+            ),
+            go_value=self._go_value[i],
+            sale_probability=self._sale_probability[i],
+            recommendation=_RECOMMENDATIONS[self._recommendation[i]],
+            price=None if math.isnan(price) else price,
+            registrant=None if registrant < 0 else self._registrants[registrant],
+            error=self._errors.get(i),
+            skip_reason=None if skip_reason < 0 else _SKIP_REASONS[skip_reason],
+        )
@@ -0,0 +1,60 @@
+from typing import Any, Dict, Optional
+
+from app.domain.models import DomainEvaluation, Recommendation, SkipReason
+
+# Column order used by every tabular export
+EVALUATION_FIELDS = (
+    "domain",
+    "is_available",
+    "price",
+    "go_value",
+    "sale_probability",
+    "recommendation",
+    "registrant",
+    "skip_reason",
+    "error",
+)
+
+
+def evaluation_to_dict(evaluation: DomainEvaluation) -> Dict[str, Any]:
+    return {
+        "domain": evaluation.domain,
+        "is_available": evaluation.is_available,
+        "price": evaluation.price,
+        "go_value": evaluation.go_value,
+        "sale_probability": evaluation.sale_probability,
+        "recommendation": evaluation.recommendation.name,
+        "registrant": evaluation.registrant,
+        "skip_reason": evaluation.skip_reason.value if evaluation.skip_reason else None,
+        "error": evaluation.error,
+    }
+
+
+def evaluation_from_dict(data: Dict[str, Any]) -> DomainEvaluation:
+    # Accepts both JSON values and the plain strings read back from CSV
+    skip_reason = data.get("skip_reason")
+    return DomainEvaluation(
+        domain=data["domain"],
+        is_available=_to_bool(data.get("is_available")),
+        go_value=float(data.get("go_value") or 0.0),
+        sale_probability=float(data.get("sale_probability") or 0.0),
+        recommendation=Recommendation[data["recommendation"]],
+        price=_to_float(data.get("price")),
+        registrant=data.get("registrant") or None,
+        error=data.get("error") or None,
+        skip_reason=SkipReason(skip_reason) if skip_reason else None,
+    )
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
@@ -0,0 +1,58 @@
+import hashlib
+import math
+
+from app.domain.ports import SeenFilter
+
+
+def bloom_size(capacity: int, error_rate: float) -> int:
+    """Bits needed for `capacity` items at `error_rate` false positives."""
+    capacity = max(capacity, 1)
+    return max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+
+
+class BloomFilter(SeenFilter):
+    """
+    Fixed-size Bloom filter over a bytearray: memory never grows, whatever
+    is added. A false positive makes `add` report a new item as seen, i.e.
+    a candidate is dropped; nothing is ever reported twice. Past
+    `capacity` items the false-positive rate climbs above `error_rate`.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001, max_bytes: int = 0):
+        bits = bloom_size(capacity, error_rate)
+        if max_bytes:
+            bits = min(bits, max_bytes * 8)
+        self._bits = bits
+        self._array = bytearray((bits + 7) // 8)
+        # Optimal hash count for the size actually used
+        self._hashes = max(1, round(bits / max(capacity, 1) * math.log(2)))
+        self._capacity = capacity
+        self.count = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._array)
+
+    def error_rate(self) -> float:
+        """Expected false-positive rate once `capacity` items are in."""
+        k, m, n = self._hashes, self._bits, max(self._capacity, 1)
+        return (1 - math.exp(-k * n / m)) ** k
+
+    def add(self, item: str) -> bool:
+        # Double hashing: k positions from one 128-bit digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        array = self._array
+        bits = self._bits
+        new = False
+        for i in range(self._hashes):
+            position = (h1 + i * h2) % bits
+            mask = 1 << (position & 7)
+            byte = position >> 3
+            if not array[byte] & mask:
+                array[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
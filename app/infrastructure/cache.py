@@ -0,0 +1,311 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.models import DomainAvailability, DomainAppraisal
+from app.domain.ports import (
+    NULL_METRICS,
+    AppraisalProvider,
+    AsyncAppraisalProvider,
+    AsyncAvailabilityProvider,
+    AsyncWhoisProvider,
+    AvailabilityProvider,
+    MetricsRecorder,
+    WhoisProvider,
+    in_input_order,
+)
+
+AVAILABILITY = "availability"
+APPRAISAL = "appraisal"
+WHOIS = "whois"
+
+
+class SqliteCache:
+    """
+    Local disk-backed TTL cache for provider results, shared by all threads.
+    Entries are evicted least-recently-used first once `max_entries` is exceeded.
+    With `refresh=True` every lookup misses, so results are re-fetched and stored.
+    """
+
+    # How often (in writes) the entry count is checked against max_entries
+    EVICT_EVERY = 1000
+    # Hits only note their access time in memory; the times are written in one
+    # batch with the next `set`, before eviction, on close, or at this many
+    TOUCH_FLUSH_EVERY = 1000
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1_000_000,
+        refresh: bool = False,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        self._max_entries = max_entries
+        self._metrics = metrics
+        self._refresh = refresh
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._touched: Dict[Tuple[str, str], float] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (kind, key)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, kind: str, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = None
+            if not self._refresh:
+                row = self._conn.execute(
+                    "SELECT value FROM entries "
+                    "WHERE kind = ? AND key = ? AND expires_at > ?",
+                    (kind, key, now),
+                ).fetchone()
+                if row is not None:
+                    # No write (and fsync) per hit under the lock
+                    self._touched[(kind, key)] = now
+                    if len(self._touched) >= self.TOUCH_FLUSH_EVERY:
+                        self._flush_touches()
+                        self._conn.commit()
+            self._count(kind, "hits" if row is not None else "misses")
+        return row[0] if row is not None else None
+
+    def set(self, kind: str, key: str, value: str, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (kind, key, value, now + ttl, now),
+            )
+            self._touched.pop((kind, key), None)
+            self._flush_touches()
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict(now)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {kind: dict(counts) for kind, counts in self._stats.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+    def _count(self, kind: str, outcome: str) -> None:
+        counts = self._stats.setdefault(kind, {"hits": 0, "misses": 0})
+        counts[outcome] += 1
+        self._metrics.increment(
+            "domain_intel_cache_requests_total",
+            layer="disk",
+            kind=kind,
+            outcome=outcome,
+        )
+
+    def _flush_touches(self) -> None:
+        # Caller holds the lock and commits
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE entries SET accessed_at = ? WHERE kind = ? AND key = ?",
+            [(at, kind, key) for (kind, key), at in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        (total,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        excess = total - self._max_entries
+        if excess > 0:
+            # Evict a little more than needed so this does not run on every check
+            excess += self._max_entries // 10
+            self._conn.execute(
+                "DELETE FROM entries WHERE rowid IN "
+                "(SELECT rowid FROM entries ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+        self._conn.commit()
+
+
+def _key(domain: str) -> str:
+    return domain.lower()
+
+
+def _dump(value) -> str:
+    return json.dumps(asdict(value), separators=(",", ":"))
+
+
+def _load_availability(domain: str, cached: str) -> DomainAvailability:
+    # Keys are case-insensitive; report the domain as the caller spelled it
+    return DomainAvailability(**{**json.loads(cached), "domain": domain})
+
+
+def _load_appraisal(domain: str, cached: str) -> DomainAppraisal:
+    return DomainAppraisal(**{**json.loads(cached), "domain": domain})
+
+
+def is_fallback_appraisal(appraisal: DomainAppraisal) -> bool:
+    # The appraisal service turns API errors into zero appraisals; don't keep those
+    return appraisal.go_value == 0 and appraisal.sale_probability == 0
+
+
+def is_fallback_registrant(registrant: str) -> bool:
+    return registrant == "Hidden/Error"
+
+
+class CachedAvailabilityProvider(AvailabilityProvider):
+    def __init__(self, inner: AvailabilityProvider, cache: SqliteCache, ttl: float):
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+        self.supports_bulk = inner.supports_bulk
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        cached = self._cache.get(AVAILABILITY, _key(domain))
+        if cached is not None:
+            return _load_availability(domain, cached)
+        result = self._inner.check_availability(domain)
+        self._cache.set(AVAILABILITY, _key(domain), _dump(result), self._ttl)
+        return result
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        results: List[DomainAvailability] = []
+        missing: List[str] = []
+        for domain in domains:
+            cached = self._cache.get(AVAILABILITY, _key(domain))
+            if cached is not None:
+                results.append(_load_availability(domain, cached))
+            else:
+                missing.append(domain)
+
+        if missing:
+            for result in self._inner.check_availability_bulk(missing):
+                self._cache.set(AVAILABILITY, _key(result.domain), _dump(result), self._ttl)
+                results.append(result)
+        return in_input_order(domains, results)
+
+
+class CachedAppraisalProvider(AppraisalProvider):
+    def __init__(self, inner: AppraisalProvider, cache: SqliteCache, ttl: float):
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+
+    def get_appraisal(self, domain: str) -> DomainAppraisal:
+        cached = self._cache.get(APPRAISAL, _key(domain))
+        if cached is not None:
+            return _load_appraisal(domain, cached)
+        result = self._inner.get_appraisal(domain)
+        if not is_fallback_appraisal(result):
+            self._cache.set(APPRAISAL, _key(domain), _dump(result), self._ttl)
+        return result
+
+
+class CachedWhoisProvider(WhoisProvider):
+    def __init__(self, inner: WhoisProvider, cache: SqliteCache, ttl: float):
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+
+    def get_registrant(self, domain: str) -> str:
+        cached = self._cache.get(WHOIS, _key(domain))
+        if cached is not None:
+            return json.loads(cached)
+        result = self._inner.get_registrant(domain)
+        if not is_fallback_registrant(result):
+            self._cache.set(WHOIS, _key(domain), json.dumps(result), self._ttl)
+        return result
+
+
+# SQLite lookups are local and sub-millisecond, so the async wrappers
+# query the cache inline instead of hopping to a thread.
+
+
+class AsyncCachedAvailabilityProvider(AsyncAvailabilityProvider):
+    def __init__(
+        self, inner: AsyncAvailabilityProvider, cache: SqliteCache, ttl: float
+    ):
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+        self.supports_bulk = inner.supports_bulk
+
+    async def check_availability(self, domain: str) -> DomainAvailability:
+        cached = self._cache.get(AVAILABILITY, _key(domain))
+        if cached is not None:
+            return _load_availability(domain, cached)
+        result = await self._inner.check_availability(domain)
+        self._cache.set(AVAILABILITY, _key(domain), _dump(result), self._ttl)
+        return result
+
+    async def check_availability_bulk(
+        self, domains: List[str]
+    ) -> List[DomainAvailability]:
+        results: List[DomainAvailability] = []
+        missing: List[str] = []
+        for domain in domains:
+            cached = self._cache.get(AVAILABILITY, _key(domain))
+            if cached is not None:
+                results.append(_load_availability(domain, cached))
+            else:
+                missing.append(domain)
+
+        if missing:
+            for result in await self._inner.check_availability_bulk(missing):
+                self._cache.set(AVAILABILITY, _key(result.domain), _dump(result), self._ttl)
+                results.append(result)
+        return in_input_order(domains, results)
+
+
+class AsyncCachedAppraisalProvider(AsyncAppraisalProvider):
+    def __init__(self, inner: AsyncAppraisalProvider, cache: SqliteCache, ttl: float):
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+
+    async def get_appraisal(self, domain: str) -> DomainAppraisal:
+        cached = self._cache.get(APPRAISAL, _key(domain))
+        if cached is not None:
+            return _load_appraisal(domain, cached)
+        result = await self._inner.get_appraisal(domain)
+        if not is_fallback_appraisal(result):
+            self._cache.set(APPRAISAL, _key(domain), _dump(result), self._ttl)
+        return result
+
+
+class AsyncCachedWhoisProvider(AsyncWhoisProvider):
+    def __init__(self, inner: AsyncWhoisProvider, cache: SqliteCache, ttl: float):
+        self._inner = inner
+        self._cache = cache
+        self._ttl = ttl
+
+    async def get_registrant(self, domain: str) -> str:
+        cached = self._cache.get(WHOIS, _key(domain))
+        if cached is not None:
+            return json.loads(cached)
+        result = await self._inner.get_registrant(domain)
+        if not is_fallback_registrant(result):
+            self._cache.set(WHOIS, _key(domain), json.dumps(result), self._ttl)
+        return result
@@ -2,12 +2,98 @@ import os
 from dataclasses import dataclass
 
 
+def _processes(value: str) -> int:
+    if value.strip().lower() == "auto":
+        return os.cpu_count() or 1
+    return int(value)
+
+
 @dataclass(frozen=True)
 class Settings:
     GODADDY_API_KEY: str
     GODADDY_API_SECRET: str
     GODADDY_BASE_URL: str = "https://api.ote-godaddy.com"  # Default to Test env
 
+    # Scoring rules file (JSON); empty means the packaged defaults
+    RULES_PATH: str = ""
+
+    # Number of domains evaluated concurrently in batch mode
+    BATCH_MAX_WORKERS: int = 8
+    # Evaluations in flight on the event loop in async mode (TUI)
+    ASYNC_MAX_CONCURRENCY: int = 200
+    # Blocking WHOIS lookups running at once in async mode
+    WHOIS_MAX_CONCURRENCY: int = 16
+    # "rdap" (port-43 fallback for TLDs without RDAP), "native" (built-in
+    # port-43 client) or "python-whois"
+    WHOIS_BACKEND: str = "rdap"
+    WHOIS_TIMEOUT: float = 10.0
+    # Queries running at once against any single WHOIS server (native backend)
+    WHOIS_MAX_PER_SERVER: int = 4
+    # Second source asked when the first is slow or fails (e.g. "native"
+    # behind "rdap"); empty disables hedging
+    WHOIS_HEDGE_BACKEND: str = ""
+    # Hedge once a lookup is slower than this share of recent ones
+    WHOIS_HEDGE_PERCENTILE: float = 0.95
+    WHOIS_HEDGE_MIN_DELAY: float = 0.05
+    # Processes parsing python-whois answers off the GIL ("auto": one per
+    # core); 0 parses on the calling thread
+    WHOIS_PROCESSES: int = 0
+    # Local copy of IANA's RDAP bootstrap file, refreshed when older than this
+    RDAP_BOOTSTRAP_PATH: str = ".domain_intel_rdap.json"
+    RDAP_BOOTSTRAP_MAX_AGE: float = 7 * 24 * 3600
+    # Indexes built from local zone files (`python main.py zone build`);
+    # delegated domains are answered as taken without an API call. Zones
+    # whose snapshot is older than the max age are not used.
+    ZONE_INDEX_DIR: str = ".domain_intel_zones"
+    ZONE_INDEX_MAX_AGE: float = 7 * 24 * 3600
+    # `generate` mode: candidates are deduplicated by a Bloom filter sized
+    # for this false-drop rate, but never larger than the cap (MiB)
+    GENERATE_BLOOM_ERROR_RATE: float = 0.001
+    GENERATE_BLOOM_MAX_MB: int = 1024
+    # Domains per bulk availability request (GoDaddy allows up to 500)
+    AVAILABILITY_CHUNK_SIZE: int = 500
+
+    # Shared keep-alive HTTP connection pool
+    HTTP_POOL_SIZE: int = 32
+    HTTP_MAX_RETRIES: int = 3
+    HTTP_BACKOFF_FACTOR: float = 0.5
+    HTTP_TIMEOUT: float = 10.0
+
+    # Client-side rate limiting (requests per minute, per endpoint)
+    GODADDY_RATE_LIMIT: float = 60.0
+    GODADDY_RATE_BURST: int = 5
+    # e.g. "appraisal=30,availability_bulk=20"
+    GODADDY_ENDPOINT_RATE_LIMITS: str = ""
+    # Retries after a 429, with jittered exponential backoff (seconds)
+    GODADDY_MAX_RETRIES: int = 5
+    GODADDY_BACKOFF_BASE: float = 1.0
+    GODADDY_BACKOFF_MAX: float = 60.0
+
+    # Persistent result cache (TTLs in seconds)
+    CACHE_ENABLED: bool = True
+    CACHE_PATH: str = ".domain_intel_cache.sqlite3"
+    CACHE_MAX_ENTRIES: int = 1_000_000
+    CACHE_TTL_AVAILABILITY: float = 15 * 60
+    CACHE_TTL_APPRAISAL: float = 7 * 24 * 3600
+    CACHE_TTL_WHOIS: float = 24 * 3600
+
+    # In-process LRU in front of the providers (per provider)
+    MEMO_MAX_ENTRIES: int = 10_000
+    MEMO_TTL: float = 300.0
+
+    # Max seconds of journaled results a hard crash can lose (--journal)
+    JOURNAL_FLUSH_INTERVAL: float = 1.0
+
+    # Sharded worker mode (enqueue / worker / status / export)
+    # "sqlite" (one host, local disk) or "files" (QUEUE_PATH is a directory
+    # shared by several hosts, e.g. over NFS)
+    QUEUE_BACKEND: str = "sqlite"
+    QUEUE_PATH: str = "domain_intel_queue.sqlite3"
+    QUEUE_SHARD_SIZE: int = 1000
+    QUEUE_LEASE_SECONDS: float = 300.0
+    QUEUE_MAX_ATTEMPTS: int = 3
+    WORKER_PROCESSES: int = 1
+
     @classmethod
     def from_env(cls) -> "Settings":
         return cls(
@@ -16,4 +102,52 @@ class Settings:
             GODADDY_BASE_URL=os.getenv(
                 "GODADDY_BASE_URL", "https://api.ote-godaddy.com"
             ),
+            RULES_PATH=os.getenv("RULES_PATH", ""),
+            BATCH_MAX_WORKERS=int(os.getenv("BATCH_MAX_WORKERS", "8")),
+            ASYNC_MAX_CONCURRENCY=int(os.getenv("ASYNC_MAX_CONCURRENCY", "200")),
+            WHOIS_MAX_CONCURRENCY=int(os.getenv("WHOIS_MAX_CONCURRENCY", "16")),
+            WHOIS_BACKEND=os.getenv("WHOIS_BACKEND", "rdap").lower(),
+            WHOIS_TIMEOUT=float(os.getenv("WHOIS_TIMEOUT", "10")),
+            WHOIS_MAX_PER_SERVER=int(os.getenv("WHOIS_MAX_PER_SERVER", "4")),
+            WHOIS_HEDGE_BACKEND=os.getenv("WHOIS_HEDGE_BACKEND", "").lower(),
+            WHOIS_HEDGE_PERCENTILE=float(os.getenv("WHOIS_HEDGE_PERCENTILE", "0.95")),
+            WHOIS_HEDGE_MIN_DELAY=float(os.getenv("WHOIS_HEDGE_MIN_DELAY", "0.05")),
+            WHOIS_PROCESSES=_processes(os.getenv("WHOIS_PROCESSES", "0")),
+            RDAP_BOOTSTRAP_PATH=os.getenv(
+                "RDAP_BOOTSTRAP_PATH", ".domain_intel_rdap.json"
+            ),
+            RDAP_BOOTSTRAP_MAX_AGE=float(os.getenv("RDAP_BOOTSTRAP_MAX_AGE", "604800")),
+            ZONE_INDEX_DIR=os.getenv("ZONE_INDEX_DIR", ".domain_intel_zones"),
+            ZONE_INDEX_MAX_AGE=float(os.getenv("ZONE_INDEX_MAX_AGE", "604800")),
+            GENERATE_BLOOM_ERROR_RATE=float(
+                os.getenv("GENERATE_BLOOM_ERROR_RATE", "0.001")
+            ),
+            GENERATE_BLOOM_MAX_MB=int(os.getenv("GENERATE_BLOOM_MAX_MB", "1024")),
+            AVAILABILITY_CHUNK_SIZE=int(os.getenv("AVAILABILITY_CHUNK_SIZE", "500")),
+            HTTP_POOL_SIZE=int(os.getenv("HTTP_POOL_SIZE", "32")),
+            HTTP_MAX_RETRIES=int(os.getenv("HTTP_MAX_RETRIES", "3")),
+            HTTP_BACKOFF_FACTOR=float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5")),
+            HTTP_TIMEOUT=float(os.getenv("HTTP_TIMEOUT", "10")),
+            GODADDY_RATE_LIMIT=float(os.getenv("GODADDY_RATE_LIMIT", "60")),
+            GODADDY_RATE_BURST=int(os.getenv("GODADDY_RATE_BURST", "5")),
+            GODADDY_ENDPOINT_RATE_LIMITS=os.getenv("GODADDY_ENDPOINT_RATE_LIMITS", ""),
+            GODADDY_MAX_RETRIES=int(os.getenv("GODADDY_MAX_RETRIES", "5")),
+            GODADDY_BACKOFF_BASE=float(os.getenv("GODADDY_BACKOFF_BASE", "1")),
+            GODADDY_BACKOFF_MAX=float(os.getenv("GODADDY_BACKOFF_MAX", "60")),
+            CACHE_ENABLED=os.getenv("CACHE_ENABLED", "1").lower()
+            not in ("0", "false", "no"),
+            CACHE_PATH=os.getenv("CACHE_PATH", ".domain_intel_cache.sqlite3"),
+            CACHE_MAX_ENTRIES=int(os.getenv("CACHE_MAX_ENTRIES", "1000000")),
+            CACHE_TTL_AVAILABILITY=float(os.getenv("CACHE_TTL_AVAILABILITY", "900")),
+            CACHE_TTL_APPRAISAL=float(os.getenv("CACHE_TTL_APPRAISAL", "604800")),
+            CACHE_TTL_WHOIS=float(os.getenv("CACHE_TTL_WHOIS", "86400")),
+            MEMO_MAX_ENTRIES=int(os.getenv("MEMO_MAX_ENTRIES", "10000")),
+            MEMO_TTL=float(os.getenv("MEMO_TTL", "300")),
+            JOURNAL_FLUSH_INTERVAL=float(os.getenv("JOURNAL_FLUSH_INTERVAL", "1.0")),
+            QUEUE_BACKEND=os.getenv("QUEUE_BACKEND", "sqlite").lower(),
+            QUEUE_PATH=os.getenv("QUEUE_PATH", "domain_intel_queue.sqlite3"),
+            QUEUE_SHARD_SIZE=int(os.getenv("QUEUE_SHARD_SIZE", "1000")),
+            QUEUE_LEASE_SECONDS=float(os.getenv("QUEUE_LEASE_SECONDS", "300")),
+            QUEUE_MAX_ATTEMPTS=int(os.getenv("QUEUE_MAX_ATTEMPTS", "3")),
+            WORKER_PROCESSES=int(os.getenv("WORKER_PROCESSES", "1")),
         )
@@ -1,53 +1,166 @@
+import time
 import requests
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from app.domain.models import DomainAvailability, DomainAppraisal
-from app.domain.ports import AvailabilityProvider, AppraisalProvider
+from app.domain.ports import (
+    NULL_METRICS,
+    AppraisalProvider,
+    AvailabilityProvider,
+    MetricsRecorder,
+)
 from app.infrastructure.config import Settings
+from app.infrastructure.http import get_session
+from app.infrastructure.rate_limit import RateLimitError, get_rate_limiter, retry_delay
+
+if TYPE_CHECKING:
+    from app.infrastructure.profiling import Profiler
 
 
 class GoDaddyBaseClient:
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        metrics: MetricsRecorder = NULL_METRICS,
+        profiler: Optional["Profiler"] = None,
+    ):
         self._base_url = settings.GODADDY_BASE_URL
-        self._headers = {
-            "Authorization": f"sso-key {settings.GODADDY_API_KEY}:{settings.GODADDY_API_SECRET}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        self._headers = auth_headers(settings)
+        self._timeout = settings.HTTP_TIMEOUT
+        # Shared across all GoDaddy clients so they reuse the same connections
+        self._session = get_session(settings)
+        # Also shared, so concurrent workers stay within GoDaddy's per-endpoint quota
+        self._limiter = get_rate_limiter(settings)
+        self._max_retries = settings.GODADDY_MAX_RETRIES
+        self._backoff_base = settings.GODADDY_BACKOFF_BASE
+        self._backoff_max = settings.GODADDY_BACKOFF_MAX
+        self._metrics = metrics
+        self._profiler = profiler
 
     def _get(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit_key: str = "default",
+    ) -> Dict[str, Any]:
+        return self._request(
+            "GET", endpoint, limit_key, params=params, timeout=self._timeout
+        )
+
+    def _post(
+        self,
+        endpoint: str,
+        payload: Any,
+        params: Optional[Dict[str, Any]] = None,
+        limit_key: str = "default",
+    ) -> Dict[str, Any]:
+        # Bulk requests take noticeably longer than single lookups
+        return self._request(
+            "POST",
+            endpoint,
+            limit_key,
+            params=params,
+            json=payload,
+            timeout=max(self._timeout, 30),
+        )
+
+    def _request(
+        self, method: str, endpoint: str, limit_key: str, **kwargs: Any
     ) -> Dict[str, Any]:
         url = f"{self._base_url}{endpoint}"
+        bucket = self._limiter.bucket(limit_key)
+        metrics = self._metrics
         try:
-            response = requests.get(
-                url, headers=self._headers, params=params, timeout=10
+            for attempt in range(self._max_retries + 1):
+                wait = bucket.reserve()
+                if wait > 0:
+                    metrics.increment(
+                        "domain_intel_rate_limit_wait_seconds_total",
+                        wait,
+                        endpoint=limit_key,
+                    )
+                    time.sleep(wait)
+
+                started = time.perf_counter()
+                try:
+                    response = self._session.request(
+                        method, url, headers=self._headers, **kwargs
+                    )
+                except requests.RequestException:
+                    record_request(metrics, limit_key, "error", started)
+                    raise
+                record_request(metrics, limit_key, str(response.status_code), started)
+                if response.status_code != 429:
+                    response.raise_for_status()
+                    # Only a successful answer earns the rate back
+                    bucket.succeeded()
+                    return decode_json(response, self._profiler)
+
+                # Throttled: slow the whole endpoint down, then try again
+                metrics.increment(
+                    "domain_intel_http_retries_total",
+                    provider="godaddy",
+                    endpoint=limit_key,
+                    reason="rate_limited",
+                )
+                bucket.throttled(
+                    retry_delay(
+                        response.headers.get("Retry-After"),
+                        attempt,
+                        self._backoff_base,
+                        self._backoff_max,
+                    )
+                )
+
+            raise RateLimitError(
+                f"{endpoint} still rate limited after {self._max_retries} retries"
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+        except (requests.RequestException, RateLimitError) as e:
             # Arthur: Need proper logging here later
             print(f"API Error [{endpoint}]: {e}")
             raise
 
 
 class GoDaddyAvailabilityService(GoDaddyBaseClient, AvailabilityProvider):
+    # GoDaddy accepts at most 500 domains per bulk availability request
+    BULK_LIMIT = 500
+    supports_bulk = True
+
     def check_availability(self, domain: str) -> DomainAvailability:
         # Arthur: GET /v1/domains/available
-        data = self._get("/v1/domains/available", params={"domain": domain})
-
-        price = data.get("price")
-        if price:
-            # GoDaddy API returns price in micros (millionths of currency unit)
-            # e.g. 12990000 = 12.99
-            price = float(price) / 1_000_000
-
-        return DomainAvailability(
-            domain=domain,
-            available=data.get("available", False),
-            price=price,
-            currency=data.get("currency"),
+        data = self._get(
+            "/v1/domains/available",
+            params={"domain": domain},
+            limit_key="availability",
         )
+        return parse_availability(domain, data)
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        # POST /v1/domains/available with a JSON array of domains
+        items: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(domains), self.BULK_LIMIT):
+            chunk = domains[start : start + self.BULK_LIMIT]
+            try:
+                data = self._post(
+                    "/v1/domains/available",
+                    chunk,
+                    params={"checkType": "FAST"},
+                    limit_key="availability_bulk",
+                )
+            except Exception as e:
+                # Keep the other chunks; only this one falls back to single checks
+                record_bulk_failure(self._metrics, chunk, e)
+                continue
+            for item in data.get("domains", []):
+                items[item.get("domain", "").lower()] = item
+
+        # Domains reported under "errors" or in a failed chunk are left out
+        # and checked one by one
+        return [
+            parse_availability(domain, items[domain.lower()])
+            for domain in domains
+            if domain.lower() in items
+        ]
 
 
 class GoDaddyAppraisalService(GoDaddyBaseClient, AppraisalProvider):
@@ -58,23 +171,82 @@ class GoDaddyAppraisalService(GoDaddyBaseClient, AppraisalProvider):
         # Fallback to 0 if API fails or returns unexpected structure in this MVP.
 
         try:
-            data = self._get(f"/v1/appraisal/{domain}")
-
-            # Extracting typical fields (adjust based on actual API response schema)
-            govalue = float(data.get("govalue", 0))
-            # sales_probability is often not strictly exposed in public GoValue API
-            # or might be named differently. Mocking mapping or using what's available.
-            # Assuming 'comparable_sales_probability' or similar if using a specific tier.
-            # For this exercise, we safeguard the retrieval.
-
-            # If the API doesn't return probability, we default to 0.0 to fail safely
-            # as per the requirement > 0.2
-            probability = float(data.get("sale_probability", 0.0))
-
-            return DomainAppraisal(
-                domain=domain, go_value=govalue, sale_probability=probability
-            )
+            data = self._get(f"/v1/appraisal/{domain}", limit_key="appraisal")
+            return parse_appraisal(domain, data)
+        except RateLimitError:
+            # A throttled lookup is not a zero appraisal; let the batch record the error
+            raise
         except Exception as e:
             # Arthur: Fail safe
             print(f"Appraisal API Error for {domain}: {e}")
             return DomainAppraisal(domain=domain, go_value=0.0, sale_probability=0.0)
+
+
+def decode_json(response: Any, profiler: Optional["Profiler"]) -> Any:
+    if profiler is None:
+        return response.json()
+    # A breakdown of the provider stage the request is timed in
+    with profiler.stage("json_decode"):
+        return response.json()
+
+
+def record_bulk_failure(
+    metrics: MetricsRecorder, chunk: List[str], error: Exception
+) -> None:
+    print(f"Bulk availability failed for {len(chunk)} domains: {error}")
+    metrics.increment("domain_intel_bulk_failures_total")
+
+
+def record_request(
+    metrics: MetricsRecorder, endpoint: str, status: str, started: float
+) -> None:
+    metrics.observe(
+        "domain_intel_http_request_seconds",
+        time.perf_counter() - started,
+        provider="godaddy",
+        endpoint=endpoint,
+    )
+    metrics.increment(
+        "domain_intel_http_requests_total",
+        provider="godaddy",
+        endpoint=endpoint,
+        status=status,
+    )
+
+
+def auth_headers(settings: Settings) -> Dict[str, str]:
+    return {
+        "Authorization": f"sso-key {settings.GODADDY_API_KEY}:{settings.GODADDY_API_SECRET}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+
+def parse_availability(domain: str, data: Dict[str, Any]) -> DomainAvailability:
+    price = data.get("price")
+    if price:
+        # GoDaddy API returns price in micros (millionths of currency unit)
+        # e.g. 12990000 = 12.99
+        price = float(price) / 1_000_000
+
+    return DomainAvailability(
+        domain=domain,
+        available=data.get("available", False),
+        price=price,
+        currency=data.get("currency"),
+    )
+
+
+def parse_appraisal(domain: str, data: Dict[str, Any]) -> DomainAppraisal:
+    # Extracting typical fields (adjust based on actual API response schema)
+    govalue = float(data.get("govalue", 0))
+    # sales_probability is often not strictly exposed in public GoValue API
+    # or might be named differently. Mocking mapping or using what's available.
+    # Assuming 'comparable_sales_probability' or similar if using a specific tier.
+    # For this exercise, we safeguard the retrieval.
+
+    # If the API doesn't return probability, we default to 0.0 to fail safely
+    # as per the requirement > 0.2
+    probability = float(data.get("sale_probability", 0.0))
+
+    return DomainAppraisal(domain=domain, go_value=govalue, sale_probability=probability)
@@ -0,0 +1,201 @@
+import asyncio
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import httpx
+
+from app.domain.models import DomainAvailability, DomainAppraisal
+from app.domain.ports import (
+    NULL_METRICS,
+    AsyncAppraisalProvider,
+    AsyncAvailabilityProvider,
+    MetricsRecorder,
+)
+from app.infrastructure.config import Settings
+from app.infrastructure.rate_limit import RateLimitError, get_rate_limiter, retry_delay
+from app.infrastructure.godaddy import (
+    GoDaddyAvailabilityService,
+    auth_headers,
+    decode_json,
+    parse_appraisal,
+    parse_availability,
+    record_bulk_failure,
+    record_request,
+)
+
+if TYPE_CHECKING:
+    from app.infrastructure.profiling import Profiler
+
+# An AsyncClient is bound to the event loop it was first used on,
+# so clients are shared per loop rather than per process.
+_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_async_client(settings: Settings) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    key = (settings.HTTP_POOL_SIZE, settings.HTTP_MAX_RETRIES)
+    clients = _clients.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_POOL_SIZE,
+                max_keepalive_connections=settings.HTTP_POOL_SIZE,
+            ),
+            # Retries connection failures; HTTP errors are surfaced to the caller
+            transport=httpx.AsyncHTTPTransport(retries=settings.HTTP_MAX_RETRIES),
+        )
+        clients[key] = client
+    return client
+
+
+class AsyncGoDaddyBaseClient:
+    def __init__(
+        self,
+        settings: Settings,
+        metrics: MetricsRecorder = NULL_METRICS,
+        profiler: Optional["Profiler"] = None,
+    ):
+        self._settings = settings
+        self._base_url = settings.GODADDY_BASE_URL
+        self._headers = auth_headers(settings)
+        self._timeout = settings.HTTP_TIMEOUT
+        self._limiter = get_rate_limiter(settings)
+        self._metrics = metrics
+        self._profiler = profiler
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        limit_key: str = "default",
+    ) -> Dict[str, Any]:
+        return await self._request(
+            "GET", endpoint, limit_key, params=params, timeout=self._timeout
+        )
+
+    async def _post(
+        self,
+        endpoint: str,
+        payload: Any,
+        params: Optional[Dict[str, Any]] = None,
+        limit_key: str = "default",
+    ) -> Dict[str, Any]:
+        return await self._request(
+            "POST",
+            endpoint,
+            limit_key,
+            params=params,
+            json=payload,
+            timeout=max(self._timeout, 30),
+        )
+
+    async def _request(
+        self, method: str, endpoint: str, limit_key: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        url = f"{self._base_url}{endpoint}"
+        client = get_async_client(self._settings)
+        bucket = self._limiter.bucket(limit_key)
+        settings = self._settings
+        metrics = self._metrics
+        try:
+            for attempt in range(settings.GODADDY_MAX_RETRIES + 1):
+                wait = bucket.reserve()
+                if wait > 0:
+                    metrics.increment(
+                        "domain_intel_rate_limit_wait_seconds_total",
+                        wait,
+                        endpoint=limit_key,
+                    )
+                    await asyncio.sleep(wait)
+
+                started = time.perf_counter()
+                try:
+                    response = await client.request(
+                        method, url, headers=self._headers, **kwargs
+                    )
+                except httpx.HTTPError:
+                    record_request(metrics, limit_key, "error", started)
+                    raise
+                record_request(metrics, limit_key, str(response.status_code), started)
+                if response.status_code != 429:
+                    response.raise_for_status()
+                    # Only a successful answer earns the rate back
+                    bucket.succeeded()
+                    # Decoding does not await, so its CPU is measurable here
+                    return decode_json(response, self._profiler)
+
+                metrics.increment(
+                    "domain_intel_http_retries_total",
+                    provider="godaddy",
+                    endpoint=limit_key,
+                    reason="rate_limited",
+                )
+                bucket.throttled(
+                    retry_delay(
+                        response.headers.get("Retry-After"),
+                        attempt,
+                        settings.GODADDY_BACKOFF_BASE,
+                        settings.GODADDY_BACKOFF_MAX,
+                    )
+                )
+
+            raise RateLimitError(
+                f"{endpoint} still rate limited after "
+                f"{settings.GODADDY_MAX_RETRIES} retries"
+            )
+        except (httpx.HTTPError, RateLimitError) as e:
+            print(f"API Error [{endpoint}]: {e}")
+            raise
+
+
+class AsyncGoDaddyAvailabilityService(AsyncGoDaddyBaseClient, AsyncAvailabilityProvider):
+    BULK_LIMIT = GoDaddyAvailabilityService.BULK_LIMIT
+    supports_bulk = True
+
+    async def check_availability(self, domain: str) -> DomainAvailability:
+        data = await self._get(
+            "/v1/domains/available",
+            params={"domain": domain},
+            limit_key="availability",
+        )
+        return parse_availability(domain, data)
+
+    async def check_availability_bulk(
+        self, domains: List[str]
+    ) -> List[DomainAvailability]:
+        items: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(domains), self.BULK_LIMIT):
+            chunk = domains[start : start + self.BULK_LIMIT]
+            try:
+                data = await self._post(
+                    "/v1/domains/available",
+                    chunk,
+                    params={"checkType": "FAST"},
+                    limit_key="availability_bulk",
+                )
+            except Exception as e:
+                record_bulk_failure(self._metrics, chunk, e)
+                continue
+            for item in data.get("domains", []):
+                items[item.get("domain", "").lower()] = item
+
+        return [
+            parse_availability(domain, items[domain.lower()])
+            for domain in domains
+            if domain.lower() in items
+        ]
+
+
+class AsyncGoDaddyAppraisalService(AsyncGoDaddyBaseClient, AsyncAppraisalProvider):
+    async def get_appraisal(self, domain: str) -> DomainAppraisal:
+        try:
+            data = await self._get(f"/v1/appraisal/{domain}", limit_key="appraisal")
+            return parse_appraisal(domain, data)
+        except RateLimitError:
+            raise
+        except Exception as e:
+            # Same fail-safe as the sync service
+            print(f"Appraisal API Error for {domain}: {e}")
+            return DomainAppraisal(domain=domain, go_value=0.0, sale_probability=0.0)
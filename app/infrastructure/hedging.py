@@ -0,0 +1,238 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, List, Optional
+
+from app.domain.ports import (
+    NULL_METRICS,
+    AsyncWhoisProvider,
+    MetricsRecorder,
+    WhoisProvider,
+)
+from app.infrastructure.cache import is_fallback_registrant
+from app.infrastructure.whois_service import HIDDEN
+
+
+class HedgeDelay:
+    """
+    How long to wait for the primary source before asking the secondary:
+    the `percentile` of its recent lookup times, never below `min_delay`.
+    `initial_delay` is used until `warmup` lookups have been seen.
+    """
+
+    # The window is re-sorted this often, not on every lookup
+    REFRESH_EVERY = 16
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        initial_delay: float = 1.0,
+        window: int = 512,
+        warmup: int = 20,
+    ):
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._warmup = warmup
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._unsorted = 0
+        self._delay = max(min_delay, initial_delay)
+        self._lock = threading.Lock()
+
+    def current(self) -> float:
+        return self._delay
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._unsorted += 1
+            if len(self._samples) < self._warmup:
+                return
+            if self._unsorted < self.REFRESH_EVERY:
+                return
+            self._unsorted = 0
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(self._percentile * len(ordered)))
+        self._delay = max(self._min_delay, ordered[index])
+
+
+def _answer(future: Any) -> str:
+    # Works for both concurrent and asyncio futures
+    try:
+        return future.result()
+    except Exception:
+        return HIDDEN
+
+
+def _succeeded(future: Any) -> bool:
+    return not future.cancelled() and not is_fallback_registrant(_answer(future))
+
+
+class _HedgeMetrics:
+    def __init__(self, metrics: MetricsRecorder):
+        self._metrics = metrics
+
+    def lookup(self) -> None:
+        self._metrics.increment("domain_intel_whois_hedge_lookups_total")
+
+    def hedge(self, reason: str) -> None:
+        # reason: "slow" (delay passed) or "error" (primary failed first)
+        self._metrics.increment("domain_intel_whois_hedges_total", reason=reason)
+
+    def won(self, winner: str, started: float) -> None:
+        self._metrics.increment("domain_intel_whois_hedge_wins_total", winner=winner)
+        self._metrics.observe(
+            "domain_intel_whois_hedged_seconds",
+            time.perf_counter() - started,
+            winner=winner,
+        )
+
+    def saved(self, seconds: float) -> None:
+        self._metrics.increment("domain_intel_whois_hedge_saved_seconds_total", seconds)
+
+
+class HedgedWhoisProvider(WhoisProvider):
+    """
+    Asks `primary`; if it has not answered within the hedge delay, or failed,
+    asks `secondary` too and returns the first good answer. A blocking lookup
+    cannot be interrupted, so the loser is abandoned: it finishes on the pool
+    and its answer is dropped. The primary's late finish is still seen, which
+    gives the exact time a secondary win saved.
+    """
+
+    def __init__(
+        self,
+        primary: WhoisProvider,
+        secondary: WhoisProvider,
+        delay: Optional[HedgeDelay] = None,
+        metrics: MetricsRecorder = NULL_METRICS,
+        max_workers: int = 32,
+    ):
+        self._primary = primary
+        self._secondary = secondary
+        self._delay = delay or HedgeDelay()
+        self._metrics = _HedgeMetrics(metrics)
+        # Callers block on futures, so both sources run on this pool
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="whois-hedge"
+        )
+
+    def get_registrant(self, domain: str) -> str:
+        self._metrics.lookup()
+        started = time.perf_counter()
+        primary = self._executor.submit(self._primary.get_registrant, domain)
+        primary.add_done_callback(lambda future: self._observe(future, started))
+        # wait() rather than result(): a failed primary must not raise here
+        done, _ = wait([primary], timeout=self._delay.current())
+        if not done:
+            self._metrics.hedge("slow")
+        else:
+            registrant = _answer(primary)
+            if not is_fallback_registrant(registrant):
+                return registrant
+            self._metrics.hedge("error")
+
+        secondary = self._executor.submit(self._secondary.get_registrant, domain)
+        pending = {secondary} if primary.done() else {primary, secondary}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                registrant = _answer(future)
+                if is_fallback_registrant(registrant):
+                    continue
+                for loser in pending:
+                    # Only stops a lookup still queued for a pool thread
+                    loser.cancel()
+                if future is primary:
+                    self._metrics.won("primary", started)
+                else:
+                    self._metrics.won("secondary", started)
+                    self._record_saving(primary)
+                return registrant
+        self._metrics.won("none", started)
+        return HIDDEN
+
+    def close(self) -> None:
+        # Abandoned lookups still queued are dropped; running ones finish
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _observe(self, primary: "Future[str]", started: float) -> None:
+        # Fast failures would drag the percentile below real lookup times
+        if _succeeded(primary):
+            self._delay.observe(time.perf_counter() - started)
+
+    def _record_saving(self, primary: "Future[str]") -> None:
+        won_at = time.perf_counter()
+
+        def saved(future: "Future[str]") -> None:
+            # A primary that failed would never have answered; nothing was saved
+            if _succeeded(future):
+                self._metrics.saved(time.perf_counter() - won_at)
+
+        primary.add_done_callback(saved)
+
+
+class AsyncHedgedWhoisProvider(AsyncWhoisProvider):
+    """
+    Async counterpart of HedgedWhoisProvider. Here the loser really is
+    cancelled, closing its socket or HTTP request. A cancelled primary never
+    says how long it would have taken, so no saved time is reported; the
+    hedge and win counters and the hedged lookup times still are.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncWhoisProvider,
+        secondary: AsyncWhoisProvider,
+        delay: Optional[HedgeDelay] = None,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        self._primary = primary
+        self._secondary = secondary
+        self._delay = delay or HedgeDelay()
+        self._metrics = _HedgeMetrics(metrics)
+
+    async def get_registrant(self, domain: str) -> str:
+        import asyncio
+
+        self._metrics.lookup()
+        started = time.perf_counter()
+        primary = asyncio.ensure_future(self._primary.get_registrant(domain))
+
+        def observe(task: "asyncio.Future[str]") -> None:
+            # Only answered lookups count; see HedgedWhoisProvider
+            if _succeeded(task):
+                self._delay.observe(time.perf_counter() - started)
+
+        primary.add_done_callback(observe)
+        tasks: List["asyncio.Future[str]"] = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._delay.current())
+            if not done:
+                self._metrics.hedge("slow")
+            else:
+                registrant = _answer(primary)
+                if not is_fallback_registrant(registrant):
+                    return registrant
+                self._metrics.hedge("error")
+
+            tasks.append(asyncio.ensure_future(self._secondary.get_registrant(domain)))
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    registrant = _answer(task)
+                    if not is_fallback_registrant(registrant):
+                        winner = "primary" if task is primary else "secondary"
+                        self._metrics.won(winner, started)
+                        return registrant
+            self._metrics.won("none", started)
+            return HIDDEN
+        finally:
+            # Also runs when the caller itself is cancelled
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
@@ -0,0 +1,57 @@
+import threading
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.infrastructure.config import Settings
+
+_sessions: Dict[Tuple, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def get_session(settings: Settings) -> requests.Session:
+    """
+    Returns a process-wide pooled session shared by all clients with the same
+    pool settings, so connections to the API are kept alive and reused.
+    """
+    key = (
+        settings.HTTP_POOL_SIZE,
+        settings.HTTP_MAX_RETRIES,
+        settings.HTTP_BACKOFF_FACTOR,
+    )
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _build_session(settings)
+            _sessions[key] = session
+        return session
+
+
+def _build_session(settings: Settings) -> requests.Session:
+    # Retry transient server errors and dropped connections only;
+    # request bodies are idempotent lookups, so POST is safe to retry too.
+    # 429s are left to the GoDaddy client's rate limiter.
+    retry = Retry(
+        total=settings.HTTP_MAX_RETRIES,
+        connect=settings.HTTP_MAX_RETRIES,
+        read=settings.HTTP_MAX_RETRIES,
+        backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.HTTP_POOL_SIZE,
+        pool_maxsize=settings.HTTP_POOL_SIZE,
+        max_retries=retry,
+        pool_block=True,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
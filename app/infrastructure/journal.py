@@ -0,0 +1,69 @@
+import json
+import os
+import time
+from typing import Dict
+
+from app.domain.models import DomainEvaluation
+from app.domain.ports import EvaluationJournal
+from app.domain.serialization import evaluation_from_dict, evaluation_to_dict
+
+JOURNAL_BUFFER_SIZE = 1 << 20
+
+
+class JsonlJournal(EvaluationJournal):
+    """
+    Append-only JSONL journal. Records go through a large write buffer and
+    reach the OS at most every `flush_interval` seconds, so journaling costs
+    one small string format per domain. A hard crash loses at most that
+    interval of work; Ctrl-C and exceptions flush on close.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        torn = _ends_mid_line(path)
+        self._file = open(path, "a", encoding="utf-8", buffering=JOURNAL_BUFFER_SIZE)
+        if torn:
+            # Terminate a record cut short by a crash so it stays one bad line
+            self._file.write("\n")
+        self._flush_interval = flush_interval
+        self._flushed_at = time.monotonic()
+
+    def record(self, evaluation: DomainEvaluation) -> None:
+        self._file.write(
+            json.dumps(evaluation_to_dict(evaluation), separators=(",", ":")) + "\n"
+        )
+        now = time.monotonic()
+        if now - self._flushed_at >= self._flush_interval:
+            self._file.flush()
+            self._flushed_at = now
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _ends_mid_line(path: str) -> bool:
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return False
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def load_journal(path: str) -> Dict[str, DomainEvaluation]:
+    """
+    Returns completed evaluations keyed by lower-cased domain (last write wins).
+    A line cut short by a crash is ignored; that domain is simply evaluated again.
+    """
+    completed: Dict[str, DomainEvaluation] = {}
+    if not os.path.exists(path):
+        return completed
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                evaluation = evaluation_from_dict(json.loads(line))
+            except (ValueError, KeyError):
+                continue
+            completed[evaluation.domain.lower()] = evaluation
+    return completed
@@ -0,0 +1,61 @@
+import threading
+from typing import Callable, Generic, List, Optional, TypeVar
+
+from app.domain.models import DomainAvailability, DomainAppraisal
+from app.domain.ports import AppraisalProvider, AvailabilityProvider, WhoisProvider
+
+T = TypeVar("T")
+
+
+class _Deferred(Generic[T]):
+    """Calls `factory` once, on first use, from whichever thread gets there first."""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._value: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        value = self._value
+        if value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._factory()
+                value = self._value
+        return value
+
+
+class LazyAvailabilityProvider(AvailabilityProvider):
+    """
+    Builds the real provider (and imports its HTTP stack) on the first call,
+    so runs answered entirely from cache never pay for it.
+    `supports_bulk` has to be known up front, before anything is built.
+    """
+
+    def __init__(
+        self, factory: Callable[[], AvailabilityProvider], supports_bulk: bool = False
+    ):
+        self._inner = _Deferred(factory)
+        self.supports_bulk = supports_bulk
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        return self._inner.get().check_availability(domain)
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        return self._inner.get().check_availability_bulk(domains)
+
+
+class LazyAppraisalProvider(AppraisalProvider):
+    def __init__(self, factory: Callable[[], AppraisalProvider]):
+        self._inner = _Deferred(factory)
+
+    def get_appraisal(self, domain: str) -> DomainAppraisal:
+        return self._inner.get().get_appraisal(domain)
+
+
+class LazyWhoisProvider(WhoisProvider):
+    def __init__(self, factory: Callable[[], WhoisProvider]):
+        self._inner = _Deferred(factory)
+
+    def get_registrant(self, domain: str) -> str:
+        return self._inner.get().get_registrant(domain)
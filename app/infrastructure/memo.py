@@ -0,0 +1,319 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from app.domain.models import DomainAvailability, DomainAppraisal
+from app.domain.ports import (
+    NULL_METRICS,
+    AppraisalProvider,
+    AsyncAppraisalProvider,
+    AsyncAvailabilityProvider,
+    AsyncWhoisProvider,
+    AvailabilityProvider,
+    MetricsRecorder,
+    WhoisProvider,
+    in_input_order,
+)
+from app.infrastructure.cache import is_fallback_appraisal, is_fallback_registrant
+
+if TYPE_CHECKING:
+    import asyncio
+
+_MISSING = object()
+# Handed to followers when the leading load was cancelled
+_RETRY = object()
+
+
+class MemoCache:
+    """
+    Bounded in-process LRU cache with a TTL and single-flight loading:
+    concurrent lookups of the same key wait for one in-flight load
+    instead of each calling the provider. Failed loads are not stored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 300.0,
+        metrics: MetricsRecorder = NULL_METRICS,
+        name: str = "memo",
+    ):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._metrics = metrics
+        self._name = name
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._ainflight: Dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._lookup(key)
+        self._count(value is not _MISSING)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        store_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        with self._lock:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                self._count(True)
+                return value
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        # Joining an in-flight load saves a provider call, so it counts as a hit
+        self._count(not leader)
+        if not leader:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._inflight[key]
+            if store_if is None or store_if(value):
+                self._store(key, value)
+        future.set_result(value)
+        return value
+
+    async def aget_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        store_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        # Imported here so sync-only runs never load asyncio
+        import asyncio
+
+        # Runs on a single event loop, so only the LRU itself needs the lock
+        while True:
+            with self._lock:
+                value = self._lookup(key)
+            if value is not _MISSING:
+                self._count(True)
+                return value
+
+            future = self._ainflight.get(key)
+            if future is None:
+                break
+            value = await asyncio.shield(future)
+            if value is not _RETRY:
+                self._count(True)
+                return value
+            # The leader was cancelled; look again, maybe as the new leader
+
+        self._count(False)
+        future = asyncio.get_running_loop().create_future()
+        self._ainflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            del self._ainflight[key]
+            # Only the leader's caller gave up; a waiting follower reloads
+            future.set_result(_RETRY)
+            raise
+        except BaseException as e:
+            del self._ainflight[key]
+            future.set_exception(e)
+            # Avoid "exception was never retrieved" when nobody else waited
+            future.exception()
+            raise
+
+        del self._ainflight[key]
+        if store_if is None or store_if(value):
+            with self._lock:
+                self._store(key, value)
+        future.set_result(value)
+        return value
+
+    def _count(self, hit: bool) -> None:
+        self._metrics.increment(
+            "domain_intel_cache_requests_total",
+            layer="memory",
+            kind=self._name,
+            outcome="hits" if hit else "misses",
+        )
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+_Result = TypeVar("_Result", bound=Union[DomainAvailability, DomainAppraisal])
+
+
+def _key(domain: str) -> str:
+    return domain.lower()
+
+
+def _respell(result: _Result, domain: str) -> _Result:
+    # Keys are case-insensitive; report the domain as the caller spelled it
+    return result if result.domain == domain else replace(result, domain=domain)
+
+
+def _keep_appraisal(appraisal: DomainAppraisal) -> bool:
+    return not is_fallback_appraisal(appraisal)
+
+
+def _keep_registrant(registrant: str) -> bool:
+    return not is_fallback_registrant(registrant)
+
+
+class MemoizedAvailabilityProvider(AvailabilityProvider):
+    def __init__(self, inner: AvailabilityProvider, memo: MemoCache):
+        self._inner = inner
+        self._memo = memo
+        self.supports_bulk = inner.supports_bulk
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        result = self._memo.get_or_load(
+            _key(domain), lambda: self._inner.check_availability(domain)
+        )
+        return _respell(result, domain)
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        results: List[DomainAvailability] = []
+        missing: List[str] = []
+        for domain in domains:
+            cached = self._memo.get(_key(domain))
+            if cached is _MISSING:
+                missing.append(domain)
+            else:
+                results.append(_respell(cached, domain))
+
+        if missing:
+            for result in self._inner.check_availability_bulk(missing):
+                self._memo.put(_key(result.domain), result)
+                results.append(result)
+        return in_input_order(domains, results)
+
+
+class MemoizedAppraisalProvider(AppraisalProvider):
+    def __init__(self, inner: AppraisalProvider, memo: MemoCache):
+        self._inner = inner
+        self._memo = memo
+
+    def get_appraisal(self, domain: str) -> DomainAppraisal:
+        result = self._memo.get_or_load(
+            _key(domain),
+            lambda: self._inner.get_appraisal(domain),
+            store_if=_keep_appraisal,
+        )
+        return _respell(result, domain)
+
+
+class MemoizedWhoisProvider(WhoisProvider):
+    def __init__(self, inner: WhoisProvider, memo: MemoCache):
+        self._inner = inner
+        self._memo = memo
+
+    def get_registrant(self, domain: str) -> str:
+        return self._memo.get_or_load(
+            _key(domain),
+            lambda: self._inner.get_registrant(domain),
+            store_if=_keep_registrant,
+        )
+
+
+class AsyncMemoizedAvailabilityProvider(AsyncAvailabilityProvider):
+    def __init__(self, inner: AsyncAvailabilityProvider, memo: MemoCache):
+        self._inner = inner
+        self._memo = memo
+        self.supports_bulk = inner.supports_bulk
+
+    async def check_availability(self, domain: str) -> DomainAvailability:
+        result = await self._memo.aget_or_load(
+            _key(domain), lambda: self._inner.check_availability(domain)
+        )
+        return _respell(result, domain)
+
+    async def check_availability_bulk(
+        self, domains: List[str]
+    ) -> List[DomainAvailability]:
+        results: List[DomainAvailability] = []
+        missing: List[str] = []
+        for domain in domains:
+            cached = self._memo.get(_key(domain))
+            if cached is _MISSING:
+                missing.append(domain)
+            else:
+                results.append(_respell(cached, domain))
+
+        if missing:
+            for result in await self._inner.check_availability_bulk(missing):
+                self._memo.put(_key(result.domain), result)
+                results.append(result)
+        return in_input_order(domains, results)
+
+
+class AsyncMemoizedAppraisalProvider(AsyncAppraisalProvider):
+    def __init__(self, inner: AsyncAppraisalProvider, memo: MemoCache):
+        self._inner = inner
+        self._memo = memo
+
+    async def get_appraisal(self, domain: str) -> DomainAppraisal:
+        result = await self._memo.aget_or_load(
+            _key(domain),
+            lambda: self._inner.get_appraisal(domain),
+            store_if=_keep_appraisal,
+        )
+        return _respell(result, domain)
+
+
+class AsyncMemoizedWhoisProvider(AsyncWhoisProvider):
+    def __init__(self, inner: AsyncWhoisProvider, memo: MemoCache):
+        self._inner = inner
+        self._memo = memo
+
+    async def get_registrant(self, domain: str) -> str:
+        return await self._memo.aget_or_load(
+            _key(domain),
+            lambda: self._inner.get_registrant(domain),
+            store_if=_keep_registrant,
+        )
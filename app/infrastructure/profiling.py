@@ -0,0 +1,298 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Awaitable, Dict, Iterator, List, Optional
+
+from app.domain.models import DomainAvailability, DomainAppraisal
+from app.domain.ports import (
+    AppraisalProvider,
+    AsyncAppraisalProvider,
+    AsyncAvailabilityProvider,
+    AsyncWhoisProvider,
+    AvailabilityProvider,
+    WhoisProvider,
+)
+
+
+class _StageStats:
+    __slots__ = ("calls", "wall", "cpu")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        # None once any call could not be measured (async, shared event loop)
+        self.cpu: Optional[float] = 0.0
+
+
+class Profiler:
+    """
+    Profiles one run: cProfile in every thread started while it is active,
+    tracemalloc allocation sites, and wall vs CPU time per pipeline stage.
+    The stage numbers come from the Profiled* provider wrappers below, plus
+    "json_decode" in the GoDaddy clients and "render"/"progress" in the
+    GUI and TUI; wall minus CPU is time spent waiting (network, rate
+    limiter, locks).
+    """
+
+    def __init__(self, top: int = 25, frames: int = 1):
+        self._top = top
+        self._frames = frames
+        self._profiles: List[cProfile.Profile] = []
+        self._stages: Dict[str, _StageStats] = {}
+        self._lock = threading.Lock()
+        self._wall = 0.0
+        self._cpu = 0.0
+        self._peak = 0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._stats: Optional[pstats.Stats] = None
+        self._running = False
+        self._started = 0.0
+        self._cpu_started = 0.0
+
+    def start(self) -> None:
+        tracemalloc.start(self._frames)
+        # cProfile only sees the thread that enabled it, so each new thread
+        # (executor workers, the GUI worker) gets its own profile on start
+        threading.setprofile(self._enable_in_thread)
+        self._enable()
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+        self._running = True
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self._wall = time.perf_counter() - self._started
+        self._cpu = time.process_time() - self._cpu_started
+        threading.setprofile(None)  # type: ignore[arg-type]
+        # Pool threads outlive the run and keep their hooks; merging now
+        # disables every thread's profile and freezes what it recorded
+        self._stats = self._merged_stats()
+        self._peak = tracemalloc.get_traced_memory()[1]
+        self._snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        # thread_time is CPU used by this thread only, so concurrent calls
+        # in other threads do not inflate it
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self._record(
+                name, time.perf_counter() - wall, time.thread_time() - cpu
+            )
+
+    @contextmanager
+    def thread_cpu(self, name: str) -> Iterator[None]:
+        # CPU of work a stage hands to another thread (e.g. a hedge pool),
+        # where the caller's thread_time cannot see it; not counted as a call
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            self._record(name, 0.0, time.thread_time() - cpu, calls=0)
+
+    async def atimed(self, name: str, awaitable: Awaitable[Any]) -> Any:
+        # Other tasks run on the loop while this one awaits, so only wall
+        # time can be attributed to the call
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._record(name, time.perf_counter() - started, None)
+
+    def write_report(self, path: str) -> None:
+        """Text report at `path`, plus the merged raw stats at `path`.prof."""
+        stats = self._stats or self._merged_stats()
+        stats.dump_stats(path + ".prof")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.report(stats))
+
+    def report(self, stats: Optional[pstats.Stats] = None) -> str:
+        stats = stats or self._stats or self._merged_stats()
+        out = io.StringIO()
+        out.write("== Run ==\n")
+        out.write(f"wall {self._wall:.3f}s  cpu {self._cpu:.3f}s  ")
+        out.write(f"threads profiled {len(self._profiles)}  ")
+        out.write(f"peak traced memory {self._peak / 2**20:.1f} MiB\n\n")
+
+        out.write("== Stages ==\n")
+        out.write(
+            f"{'STAGE':<18} {'CALLS':>7} {'WALL s':>9} {'CPU s':>9} "
+            f"{'WAIT s':>9} {'AVG ms':>8}\n"
+        )
+        with self._lock:
+            stages = sorted(self._stages.items(), key=lambda item: -item[1].wall)
+            for name, s in stages:
+                cpu = "n/a" if s.cpu is None else f"{s.cpu:.3f}"
+                wait = "n/a" if s.cpu is None else f"{s.wall - s.cpu:.3f}"
+                avg = s.wall / s.calls * 1000 if s.calls else 0.0
+                out.write(
+                    f"{name:<18} {s.calls:>7} {s.wall:>9.3f} {cpu:>9} "
+                    f"{wait:>9} {avg:>8.2f}\n"
+                )
+        out.write("\n")
+
+        for sort, title in (("tottime", "self time"), ("cumulative", "cumulative")):
+            out.write(f"== Top {self._top} functions by {title} ==\n")
+            stats.stream = out  # type: ignore[attr-defined]
+            stats.sort_stats(sort).print_stats(self._top)
+
+        out.write(f"== Top {self._top} allocation sites (live at end of run) ==\n")
+        if self._snapshot is not None:
+            snapshot = self._snapshot.filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),)
+            )
+            for stat in snapshot.statistics("lineno")[: self._top]:
+                frame = stat.traceback[0]
+                out.write(
+                    f"{stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  "
+                    f"{frame.filename}:{frame.lineno}\n"
+                )
+        return out.getvalue()
+
+    def _enable(self) -> None:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        profile.enable()
+
+    def _enable_in_thread(self, frame: Any, event: str, arg: Any) -> None:
+        # Called once as the new thread's profile hook; swap it for cProfile
+        sys.setprofile(None)
+        self._enable()
+
+    def _merged_stats(self) -> pstats.Stats:
+        with self._lock:
+            profiles = list(self._profiles)
+        for profile in profiles:
+            profile.disable()
+        if not profiles:
+            # Never started: an empty report rather than an error
+            return pstats.Stats()
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            try:
+                stats.add(profile)
+            except TypeError:
+                # A thread that never ran any profiled code has no stats
+                pass
+        return stats
+
+    def _record(
+        self, name: str, wall: float, cpu: Optional[float], calls: int = 1
+    ) -> None:
+        with self._lock:
+            if not self._running:
+                # Abandoned lookups can finish after the report was cut
+                return
+            s = self._stages.get(name)
+            if s is None:
+                s = self._stages[name] = _StageStats()
+            s.calls += calls
+            s.wall += wall
+            if cpu is None or s.cpu is None:
+                s.cpu = None
+            else:
+                s.cpu += cpu
+
+
+class ProfiledAvailabilityProvider(AvailabilityProvider):
+    def __init__(self, inner: AvailabilityProvider, profiler: Profiler):
+        self._inner = inner
+        self._profiler = profiler
+        self.supports_bulk = inner.supports_bulk
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        with self._profiler.stage("availability"):
+            return self._inner.check_availability(domain)
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        with self._profiler.stage("availability_bulk"):
+            return self._inner.check_availability_bulk(domains)
+
+
+class ProfiledAppraisalProvider(AppraisalProvider):
+    def __init__(self, inner: AppraisalProvider, profiler: Profiler):
+        self._inner = inner
+        self._profiler = profiler
+
+    def get_appraisal(self, domain: str) -> DomainAppraisal:
+        with self._profiler.stage("appraisal"):
+            return self._inner.get_appraisal(domain)
+
+
+class ProfiledWhoisProvider(WhoisProvider):
+    def __init__(self, inner: WhoisProvider, profiler: Profiler):
+        self._inner = inner
+        self._profiler = profiler
+
+    def get_registrant(self, domain: str) -> str:
+        with self._profiler.stage("whois"):
+            return self._inner.get_registrant(domain)
+
+
+class ThreadCpuWhoisProvider(WhoisProvider):
+    """
+    Adds the CPU a lookup uses on the thread running it to the "whois" stage.
+    For sources called on another thread (hedging), under a ProfiledWhoisProvider
+    that times the call itself.
+    """
+
+    def __init__(self, inner: WhoisProvider, profiler: Profiler):
+        self._inner = inner
+        self._profiler = profiler
+
+    def get_registrant(self, domain: str) -> str:
+        with self._profiler.thread_cpu("whois"):
+            return self._inner.get_registrant(domain)
+
+
+class AsyncProfiledAvailabilityProvider(AsyncAvailabilityProvider):
+    def __init__(self, inner: AsyncAvailabilityProvider, profiler: Profiler):
+        self._inner = inner
+        self._profiler = profiler
+        self.supports_bulk = inner.supports_bulk
+
+    async def check_availability(self, domain: str) -> DomainAvailability:
+        return await self._profiler.atimed(
+            "availability", self._inner.check_availability(domain)
+        )
+
+    async def check_availability_bulk(
+        self, domains: List[str]
+    ) -> List[DomainAvailability]:
+        return await self._profiler.atimed(
+            "availability_bulk", self._inner.check_availability_bulk(domains)
+        )
+
+
+class AsyncProfiledAppraisalProvider(AsyncAppraisalProvider):
+    def __init__(self, inner: AsyncAppraisalProvider, profiler: Profiler):
+        self._inner = inner
+        self._profiler = profiler
+
+    async def get_appraisal(self, domain: str) -> DomainAppraisal:
+        return await self._profiler.atimed(
+            "appraisal", self._inner.get_appraisal(domain)
+        )
+
+
+class AsyncProfiledWhoisProvider(AsyncWhoisProvider):
+    def __init__(self, inner: AsyncWhoisProvider, profiler: Profiler):
+        self._inner = inner
+        self._profiler = profiler
+
+    async def get_registrant(self, domain: str) -> str:
+        return await self._profiler.atimed(
+            "whois", self._inner.get_registrant(domain)
+        )
@@ -0,0 +1,136 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from app.infrastructure.config import Settings
+
+
+class RateLimitError(Exception):
+    """Raised when an endpoint keeps answering 429 after all retries."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with adaptive rate (AIMD).
+    `reserve()` never blocks: it books the next token and returns how long the
+    caller has to wait for it, so sync and async clients can share one bucket.
+    A 429 halves the rate and pauses the bucket; successes slowly restore it.
+    Tokens accrue from `_updated`, which a pause moves to its deadline, so the
+    callers waiting it out are spaced at the new rate instead of waking at once.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self._max_rate = rate_per_minute / 60.0
+        self._min_rate = self._max_rate / 16
+        self._rate = self._max_rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            # Past `_updated` unless a pause is running
+            return max(0.0, self._updated - now) + wait
+
+    def throttled(self, delay: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._rate = max(self._min_rate, self._rate / 2)
+            # One request may go at the deadline; saved-up burst is dropped
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, now + delay)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            if self._rate < self._max_rate:
+                self._rate = min(self._max_rate, self._rate + self._max_rate / 20)
+
+    def _refill(self, now: float) -> None:
+        if now <= self._updated:
+            # Paused: nothing accrues before the deadline
+            return
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+
+
+class RateLimiter:
+    """Per-endpoint token buckets, created on first use."""
+
+    def __init__(self, default_per_minute: float, burst: int, overrides: Dict[str, float]):
+        self._default = default_per_minute
+        self._burst = burst
+        self._overrides = overrides
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate = self._overrides.get(key, self._default)
+                bucket = TokenBucket(rate, self._burst)
+                self._buckets[key] = bucket
+            return bucket
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(settings: Settings) -> RateLimiter:
+    # One limiter per API host, shared by every client (sync or async) that calls it
+    with _limiters_lock:
+        limiter = _limiters.get(settings.GODADDY_BASE_URL)
+        if limiter is None:
+            limiter = RateLimiter(
+                settings.GODADDY_RATE_LIMIT,
+                settings.GODADDY_RATE_BURST,
+                parse_overrides(settings.GODADDY_ENDPOINT_RATE_LIMITS),
+            )
+            _limiters[settings.GODADDY_BASE_URL] = limiter
+        return limiter
+
+
+def parse_overrides(value: str) -> Dict[str, float]:
+    # "appraisal=30,availability_bulk=20" -> {"appraisal": 30.0, ...}
+    overrides: Dict[str, float] = {}
+    for item in value.split(","):
+        if "=" in item:
+            key, rate = item.split("=", 1)
+            overrides[key.strip()] = float(rate)
+    return overrides
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(cap, base * (2**attempt)))
+
+
+def retry_delay(retry_after: Optional[str], attempt: int, base: float, cap: float) -> float:
+    delay = parse_retry_after(retry_after)
+    if delay is None:
+        return backoff_delay(attempt, base, cap)
+    # Spread retries of many workers released at the same moment
+    return delay + random.uniform(0, base)
@@ -0,0 +1,269 @@
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
+
+from app.domain.ports import NULL_METRICS, AsyncWhoisProvider, MetricsRecorder
+from app.infrastructure.config import Settings
+from app.infrastructure.whois_client import WhoisRecord, merge_referral
+from app.infrastructure.whois_service import (
+    HIDDEN,
+    GlobalWhoisService,
+    record_lookup,
+    registrant_of,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+BOOTSTRAP_URL = "https://data.iana.org/rdap/dns.json"
+RDAP_HEADERS = {"Accept": "application/rdap+json, application/json"}
+
+
+class RdapBootstrap:
+    """
+    IANA's TLD -> RDAP base URL map (RFC 9224).
+    Read from `path` while it is younger than `max_age`, otherwise
+    downloaded once and written back, so most runs never fetch it.
+    If the download fails a stale copy is still used; with no copy at
+    all every TLD is treated as having no RDAP service.
+    """
+
+    def __init__(self, path: str, max_age: float, fetch: Callable[[], str]):
+        self._path = path
+        self._max_age = max_age
+        # Returns the bootstrap JSON text
+        self._fetch = fetch
+        self._services: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def base_url(self, tld: str) -> Optional[str]:
+        return self.services().get(tld.lower())
+
+    def services(self) -> Dict[str, str]:
+        """TLD -> base URL; the first call may read or download the file."""
+        services = self._services
+        if services is None:
+            with self._lock:
+                if self._services is None:
+                    self._services = self._load()
+                services = self._services
+        return services
+
+    def _load(self) -> Dict[str, str]:
+        text = self._read(fresh_only=True)
+        if text is None:
+            try:
+                text = self._fetch()
+                self._write(text)
+            except Exception as e:
+                print(f"RDAP bootstrap download failed: {e}")
+                text = self._read(fresh_only=False)
+        if text is None:
+            return {}
+        return parse_bootstrap(json.loads(text))
+
+    def _read(self, fresh_only: bool) -> Optional[str]:
+        try:
+            age = time.time() - os.path.getmtime(self._path)
+            if fresh_only and age > self._max_age:
+                return None
+            with open(self._path, encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, text: str) -> None:
+        # Atomic replace: concurrent workers never see a half-written file
+        tmp = f"{self._path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            print(f"RDAP bootstrap not cached: {e}")
+
+
+def parse_bootstrap(data: Dict[str, Any]) -> Dict[str, str]:
+    services: Dict[str, str] = {}
+    for tlds, urls in data.get("services", []):
+        # Prefer HTTPS when a registry lists both
+        url = next((u for u in urls if u.startswith("https://")), urls[0])
+        for tld in tlds:
+            services[tld.lower()] = url.rstrip("/") + "/"
+    return services
+
+
+def _entities(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    # Contacts can be nested, e.g. the registrar's abuse contact
+    for entity in node.get("entities", ()):
+        yield entity
+        yield from _entities(entity)
+
+
+def _vcard(entity: Dict[str, Any], field: str) -> Optional[str]:
+    card = entity.get("vcardArray")
+    if not card or len(card) < 2:
+        return None
+    for item in card[1]:
+        if item and item[0] == field and len(item) > 3:
+            value = item[3]
+            if isinstance(value, list):
+                value = " ".join(str(part) for part in value if part)
+            if value:
+                return str(value).strip() or None
+    return None
+
+
+def parse_rdap(data: Dict[str, Any]) -> WhoisRecord:
+    """Registrant and registrar from an RDAP domain object; the rest is ignored."""
+    org = name = registrar = None
+    for entity in _entities(data):
+        roles = entity.get("roles", ())
+        if "registrant" in roles:
+            org = org or _vcard(entity, "org")
+            name = name or _vcard(entity, "fn")
+        if "registrar" in roles:
+            registrar = registrar or _vcard(entity, "fn")
+    return WhoisRecord(
+        org=org, name=name, registrar=registrar, referral=related_link(data)
+    )
+
+
+def related_link(data: Dict[str, Any]) -> Optional[str]:
+    # Thin registries point at the registrar's RDAP record, which has
+    # the registrant
+    for link in data.get("links", ()):
+        if link.get("rel") != "related":
+            continue
+        if link.get("type", "application/rdap+json") == "application/rdap+json":
+            href = link.get("href")
+            if href and href.startswith(("https://", "http://")):
+                return href
+    return None
+
+
+def build_bootstrap(settings: Settings) -> RdapBootstrap:
+    from app.infrastructure.http import get_session
+
+    def fetch() -> str:
+        session = get_session(settings)
+        response = session.get(BOOTSTRAP_URL, timeout=settings.HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+
+    return RdapBootstrap(
+        settings.RDAP_BOOTSTRAP_PATH, settings.RDAP_BOOTSTRAP_MAX_AGE, fetch
+    )
+
+
+class RdapWhoisService(GlobalWhoisService):
+    """
+    Registrant lookups over RDAP (JSON over HTTPS) through the shared pooled
+    session, so connections to each RDAP server are kept alive. TLDs without
+    an RDAP service go to `fallback`, a port-43 WHOIS provider.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        fallback: GlobalWhoisService,
+        bootstrap: Optional[RdapBootstrap] = None,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        from app.infrastructure.http import get_session
+
+        super().__init__(metrics)
+        self._session = get_session(settings)
+        self._timeout = settings.HTTP_TIMEOUT
+        self._bootstrap = bootstrap or build_bootstrap(settings)
+        self._fallback = fallback
+
+    def get_registrant(self, domain: str) -> str:
+        if self._bootstrap.base_url(domain.rpartition(".")[2]) is None:
+            # The fallback records its own lookup metrics
+            return self._fallback.get_registrant(domain)
+        return super().get_registrant(domain)
+
+    def _lookup(self, domain: str) -> str:
+        base = self._bootstrap.base_url(domain.rpartition(".")[2])
+        try:
+            record = parse_rdap(self._get(f"{base}domain/{domain.lower()}"))
+            if not (record.org or record.name) and record.referral:
+                try:
+                    detail = parse_rdap(self._get(record.referral))
+                    record = merge_referral(record, detail)
+                except Exception:
+                    # The registry record still names the registrar
+                    pass
+            return registrant_of(record)
+        except Exception:
+            return HIDDEN
+
+    def _get(self, url: str) -> Dict[str, Any]:
+        response = self._session.get(url, headers=RDAP_HEADERS, timeout=self._timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class AsyncRdapWhoisService(AsyncWhoisProvider):
+    """RDAP on the event loop over the shared httpx client, per loop."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        fallback: AsyncWhoisProvider,
+        bootstrap: Optional[RdapBootstrap] = None,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        self._settings = settings
+        self._bootstrap = bootstrap or build_bootstrap(settings)
+        self._fallback = fallback
+        self._metrics = metrics
+        # Loaded once; every later lookup is a plain dict access on the loop
+        self._services: Optional[Dict[str, str]] = None
+        self._lock: Optional["asyncio.Lock"] = None
+
+    async def get_registrant(self, domain: str) -> str:
+        services = self._services
+        if services is None:
+            services = await self._load_services()
+        base = services.get(domain.rpartition(".")[2].lower())
+        if base is None:
+            return await self._fallback.get_registrant(domain)
+
+        started = time.perf_counter()
+        try:
+            record = parse_rdap(await self._get(f"{base}domain/{domain.lower()}"))
+            if not (record.org or record.name) and record.referral:
+                try:
+                    detail = parse_rdap(await self._get(record.referral))
+                    record = merge_referral(record, detail)
+                except Exception:
+                    pass
+            registrant = registrant_of(record)
+        except Exception:
+            registrant = HIDDEN
+        record_lookup(self._metrics, registrant, started)
+        return registrant
+
+    async def _load_services(self) -> Dict[str, str]:
+        import asyncio
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._services is None:
+                # May read or download the bootstrap file
+                self._services = await asyncio.to_thread(self._bootstrap.services)
+        return self._services
+
+    async def _get(self, url: str) -> Dict[str, Any]:
+        from app.infrastructure.godaddy_async import get_async_client
+
+        response = await get_async_client(self._settings).get(
+            url, headers=RDAP_HEADERS, timeout=self._settings.HTTP_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json()
@@ -0,0 +1,309 @@
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from app.infrastructure.cache import SqliteCache
+
+IANA_SERVER = "whois.iana.org"
+WHOIS_PORT = 43
+# Cache kind for the TLD -> WHOIS server map; it changes very rarely
+SERVER_KIND = "whois_server"
+SERVER_TTL = 30 * 24 * 3600
+# "No WHOIS server" may be a bad IANA reply, so it is asked again much sooner
+NO_SERVER_TTL = 3600
+# Records are a few KB; anything this large is not a WHOIS answer
+MAX_RESPONSE = 1 << 20
+
+# Registries that want more than the bare domain in the query
+QUERY_FORMATS = {
+    # Exact match only; a bare name also lists look-alike host records
+    "whois.verisign-grs.com": "domain {}",
+    "whois.denic.de": "-T dn,ace {}",
+    "whois.jprs.jp": "{}/e",
+}
+
+# Only the fields get_registrant reads; first match wins
+_FIELDS = {
+    "registrant organization": "org",
+    "registrant organisation": "org",
+    "registrant org": "org",
+    "registrant name": "name",
+    "registrar": "registrar",
+    "sponsoring registrar": "registrar",
+    "registrar name": "registrar",
+}
+_REFERRAL_KEYS = ("registrar whois server", "whois server")
+
+
+class WhoisError(Exception):
+    """Raised when no WHOIS server is known for a TLD or a query fails."""
+
+
+@dataclass(frozen=True, slots=True)
+class WhoisRecord:
+    org: Optional[str] = None
+    name: Optional[str] = None
+    registrar: Optional[str] = None
+    # Registrar's own WHOIS server, given by thin registries (.com, .net)
+    referral: Optional[str] = None
+
+
+def parse_record(text: str) -> WhoisRecord:
+    """
+    Pulls the registrant fields out of a `Key: value` WHOIS answer.
+    Much cheaper than a full parse: one split per line, no regexes.
+    """
+    found: Dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        value = value.strip()
+        if not value:
+            continue
+        key = key.strip().lower()
+        field = _FIELDS.get(key)
+        if field is None and key in _REFERRAL_KEYS:
+            field = "referral"
+        if field is not None and field not in found:
+            found[field] = value
+    referral = found.get("referral")
+    if referral:
+        # Some registries write it as a URL
+        referral = referral.split("://")[-1].strip("/").lower()
+    return WhoisRecord(
+        org=found.get("org"),
+        name=found.get("name"),
+        registrar=found.get("registrar"),
+        referral=referral or None,
+    )
+
+
+def parse_iana_referral(text: str) -> Optional[str]:
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip().lower() in ("whois", "refer") and value.strip():
+            return value.strip().lower()
+    return None
+
+
+def format_query(server: str, domain: str) -> str:
+    return QUERY_FORMATS.get(server, "{}").format(domain) + "\r\n"
+
+
+def referral_target(record: WhoisRecord, server: str) -> Optional[str]:
+    # Thin registries only know the registrar; the registrant is in the
+    # registrar's record, one referral away
+    if record.org or record.name or record.referral == server:
+        return None
+    return record.referral
+
+
+def merge_referral(record: WhoisRecord, detail: WhoisRecord) -> WhoisRecord:
+    return WhoisRecord(
+        org=detail.org,
+        name=detail.name,
+        registrar=detail.registrar or record.registrar,
+        referral=record.referral,
+    )
+
+
+def _connect(host: str, port: int, timeout: float) -> socket.socket:
+    return socket.create_connection((host, port), timeout=timeout)
+
+
+async def _aconnect(
+    host: str, port: int
+) -> Tuple["asyncio.StreamReader", "asyncio.StreamWriter"]:
+    import asyncio
+
+    return await asyncio.open_connection(host, port)
+
+
+class WhoisClient:
+    """
+    Port-43 WHOIS client.
+    The TLD -> server map from IANA is cached in memory (and in the disk
+    cache when one is given), so each TLD costs one IANA query per
+    `SERVER_TTL` instead of one per domain; a TLD without a server is
+    asked again after `NO_SERVER_TTL`. At most `max_per_server`
+    queries run against any one server at a time, across all threads,
+    which keeps registries from rate-limiting or banning us.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_per_server: int = 4,
+        cache: Optional["SqliteCache"] = None,
+    ):
+        self._timeout = timeout
+        self._max_per_server = max_per_server
+        self._cache = cache
+        self._servers: Dict[str, str] = {}
+        # TLD -> monotonic time until which "no server" is believed
+        self._no_server: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._tld_locks: Dict[str, threading.Lock] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @property
+    def max_per_server(self) -> int:
+        return self._max_per_server
+
+    def lookup(self, domain: str) -> WhoisRecord:
+        domain = domain.lower().rstrip(".")
+        server = self.server_for(domain.rpartition(".")[2])
+        record = parse_record(self.query(server, format_query(server, domain)))
+        referral = referral_target(record, server)
+        if referral is None:
+            return record
+        try:
+            detail = self.query(referral, format_query(referral, domain))
+        except OSError:
+            # The registry answer still names the registrar
+            return record
+        return merge_referral(record, parse_record(detail))
+
+    def server_for(self, tld: str) -> str:
+        server = self.known_server(tld)
+        if server is not None:
+            return server
+        with self._tld_lock(tld):
+            # Another thread may have resolved it while we waited
+            server = self.known_server(tld)
+            if server is None:
+                answer = self.query(IANA_SERVER, f"{tld}\r\n")
+                server = self.remember_server(tld, parse_iana_referral(answer))
+        return server
+
+    def query(self, server: str, query: str) -> str:
+        with self._slot(server):
+            with _connect(server, WHOIS_PORT, self._timeout) as sock:
+                sock.sendall(query.encode("utf-8"))
+                chunks = []
+                size = 0
+                while size < MAX_RESPONSE:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+        return b"".join(chunks).decode("utf-8", "replace")
+
+    def known_server(self, tld: str) -> Optional[str]:
+        """The cached server for `tld`, or None if IANA has to be asked."""
+        server = self._servers.get(tld)
+        if server is not None:
+            return server
+        if self._no_server.get(tld, 0.0) > time.monotonic():
+            raise WhoisError(f"No WHOIS server for .{tld}")
+        if self._cache is not None:
+            cached = self._cache.get(SERVER_KIND, tld)
+            if cached is not None:
+                # "" records a TLD that IANA lists without a WHOIS server
+                return self._keep(tld, cached or None)
+        return None
+
+    def remember_server(self, tld: str, server: Optional[str]) -> str:
+        """Stores IANA's answer for `tld`; raises WhoisError if it had none."""
+        if self._cache is not None:
+            ttl = SERVER_TTL if server else NO_SERVER_TTL
+            self._cache.set(SERVER_KIND, tld, server or "", ttl)
+        return self._keep(tld, server)
+
+    def _keep(self, tld: str, server: Optional[str]) -> str:
+        if server is None:
+            with self._lock:
+                self._no_server[tld] = time.monotonic() + NO_SERVER_TTL
+            raise WhoisError(f"No WHOIS server for .{tld}")
+        with self._lock:
+            self._servers[tld] = server
+            self._no_server.pop(tld, None)
+        return server
+
+    def _tld_lock(self, tld: str) -> threading.Lock:
+        with self._lock:
+            lock = self._tld_locks.get(tld)
+            if lock is None:
+                lock = self._tld_locks[tld] = threading.Lock()
+            return lock
+
+    def _slot(self, server: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(server)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._max_per_server)
+                self._slots[server] = slot
+            return slot
+
+
+class AsyncWhoisClient:
+    """
+    asyncio counterpart of WhoisClient, sharing its TLD -> server map.
+    Queries are plain sockets on the event loop, so no thread is held
+    while a registry is slow to answer.
+    """
+
+    def __init__(self, client: WhoisClient):
+        self._client = client
+        self._slots: Dict[str, "asyncio.Semaphore"] = {}
+
+    async def lookup(self, domain: str) -> WhoisRecord:
+        domain = domain.lower().rstrip(".")
+        server = await self.server_for(domain.rpartition(".")[2])
+        record = parse_record(await self.query(server, format_query(server, domain)))
+        referral = referral_target(record, server)
+        if referral is None:
+            return record
+        try:
+            detail = await self.query(referral, format_query(referral, domain))
+        except (OSError, TimeoutError):
+            return record
+        return merge_referral(record, parse_record(detail))
+
+    async def server_for(self, tld: str) -> str:
+        server = self._client.known_server(tld)
+        if server is not None:
+            return server
+        # Two tasks may both ask IANA for a new TLD; both get the same answer
+        answer = await self.query(IANA_SERVER, f"{tld}\r\n")
+        return self._client.remember_server(tld, parse_iana_referral(answer))
+
+    async def query(self, server: str, query: str) -> str:
+        import asyncio
+
+        slot = self._slots.get(server)
+        if slot is None:
+            slot = self._slots[server] = asyncio.Semaphore(
+                self._client.max_per_server
+            )
+        async with slot:
+            return await asyncio.wait_for(
+                self._exchange(server, query), self._client.timeout
+            )
+
+    async def _exchange(self, server: str, query: str) -> str:
+        reader, writer = await _aconnect(server, WHOIS_PORT)
+        try:
+            writer.write(query.encode("utf-8"))
+            await writer.drain()
+            data = await reader.read(MAX_RESPONSE)
+            chunks = [data]
+            size = len(data)
+            while data and size < MAX_RESPONSE:
+                data = await reader.read(MAX_RESPONSE - size)
+                chunks.append(data)
+                size += len(data)
+        finally:
+            writer.close()
+        return b"".join(chunks).decode("utf-8", "replace")
@@ -1,22 +1,201 @@
-import whois
-from app.domain.ports import WhoisProvider
+import multiprocessing
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from app.domain.ports import (
+    NULL_METRICS,
+    AsyncWhoisProvider,
+    MetricsRecorder,
+    WhoisProvider,
+)
+from app.infrastructure.whois_client import AsyncWhoisClient, WhoisClient, WhoisRecord
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+
+UNKNOWN = "Unknown"
+HIDDEN = "Hidden/Error"
+
+
+def registrant_of(record: WhoisRecord) -> str:
+    # Organization first, then the person, then who sold it
+    return record.org or record.name or record.registrar or UNKNOWN
+
+
+def record_lookup(metrics: MetricsRecorder, registrant: str, started: float) -> None:
+    metrics.observe(
+        "domain_intel_whois_lookup_seconds",
+        time.perf_counter() - started,
+        outcome="error" if registrant == HIDDEN else "ok",
+    )
+
+
+def registrant_of_entry(w: Any) -> str:
+    # Different registrars return different structures.
+    # Usually 'org' or 'registrar' or 'name' gives a hint.
+    # If available, we return the registrant organization or name.
+    if w.org:
+        return str(w.org)
+    if w.name:
+        return str(w.name)
+    if w.registrar:
+        return str(w.registrar)
+    return UNKNOWN
+
+
+def fetch_whois_text(domain: str) -> Tuple[str, str]:
+    """The network half of whois.whois(): (query name, raw answer)."""
+    from whois import NICClient, extract_domain
+
+    name = extract_domain(domain).encode("idna").decode("utf-8")
+    return name, NICClient().whois_lookup(None, name, 0, ignore_socket_errors=True)
+
+
+def parse_whois_text(name: str, text: str) -> str:
+    """The CPU half of whois.whois(), reduced to the registrant string."""
+    from whois import WhoisEntry
+
+    try:
+        return registrant_of_entry(WhoisEntry.load(name, text))
+    except Exception:
+        return HIDDEN
+
+
+def _warm_parser() -> None:
+    # Pay python-whois's import and regex compilation once per worker
+    parse_whois_text("example.com", "")
+
+
+class WhoisParserPool:
+    """
+    Worker processes for python-whois's regex-heavy parse, which otherwise
+    holds the GIL and serializes every thread of a batch. Only the raw text
+    goes in and the registrant string comes back. Workers are started on
+    first use and live until `close`.
+    """
+
+    def __init__(self, processes: int):
+        self._processes = processes
+        self._executor: Optional["ProcessPoolExecutor"] = None
+        self._lock = threading.Lock()
+
+    def parse(self, name: str, text: str) -> str:
+        return self._pool().submit(parse_whois_text, name, text).result()
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _pool(self) -> "ProcessPoolExecutor":
+        executor = self._executor
+        if executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with self._lock:
+                if self._executor is None:
+                    # Forking a process that runs threads can copy held locks
+                    self._executor = ProcessPoolExecutor(
+                        self._processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_warm_parser,
+                    )
+                executor = self._executor
+        return executor
 
 
 class GlobalWhoisService(WhoisProvider):
+    """
+    python-whois lookups. With a `parser` pool the socket exchange stays on
+    the calling thread and only the parse runs in a worker process.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsRecorder = NULL_METRICS,
+        parser: Optional[WhoisParserPool] = None,
+    ):
+        self._metrics = metrics
+        self._parser = parser
+
     def get_registrant(self, domain: str) -> str:
+        started = time.perf_counter()
+        registrant = self._lookup(domain)
+        record_lookup(self._metrics, registrant, started)
+        return registrant
+
+    def _lookup(self, domain: str) -> str:
+        # Imported on first lookup; the native backend never needs it
+        import whois
+
+        try:
+            if self._parser is None:
+                return registrant_of_entry(whois.whois(domain))
+            name, text = fetch_whois_text(domain)
+            if not text:
+                return HIDDEN
+            return self._parser.parse(name, text)
+        except Exception:
+            return HIDDEN
+
+
+class NativeWhoisService(GlobalWhoisService):
+    """
+    Same answers as GlobalWhoisService from the in-project port-43 client:
+    cached TLD servers, per-server concurrency limits and a parse of just
+    the registrant fields, instead of python-whois's full regex parse.
+    """
+
+    def __init__(self, client: WhoisClient, metrics: MetricsRecorder = NULL_METRICS):
+        super().__init__(metrics)
+        self._client = client
+
+    def _lookup(self, domain: str) -> str:
+        try:
+            return registrant_of(self._client.lookup(domain))
+        except Exception:
+            return HIDDEN
+
+
+class AsyncGlobalWhoisService(AsyncWhoisProvider):
+    """
+    python-whois only offers a blocking API, so lookups run in the default
+    executor. The semaphore bounds how many of them hold a thread at once.
+    """
+
+    def __init__(
+        self, max_concurrency: int = 16, service: Optional[WhoisProvider] = None
+    ):
+        self._service = service or GlobalWhoisService()
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional["asyncio.Semaphore"] = None
+
+    async def get_registrant(self, domain: str) -> str:
+        import asyncio
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            return await asyncio.to_thread(self._service.get_registrant, domain)
+
+
+class AsyncNativeWhoisService(AsyncWhoisProvider):
+    """Native WHOIS on the event loop; the client limits load per server."""
+
+    def __init__(
+        self, client: AsyncWhoisClient, metrics: MetricsRecorder = NULL_METRICS
+    ):
+        self._client = client
+        self._metrics = metrics
+
+    async def get_registrant(self, domain: str) -> str:
+        started = time.perf_counter()
         try:
-            w = whois.whois(domain)
-            # Different registrars return different structures.
-            # Usually 'org' or 'registrar' or 'name' gives a hint.
-            # If available, we return the registrant organization or name.
-
-            if w.org:
-                return str(w.org)
-            if w.name:
-                return str(w.name)
-            if w.registrar:
-                return str(w.registrar)
-
-            return "Unknown"
+            registrant = registrant_of(await self._client.lookup(domain))
         except Exception:
-            return "Hidden/Error"
+            registrant = HIDDEN
+        record_lookup(self._metrics, registrant, started)
+        return registrant
@@ -0,0 +1,561 @@
+import json
+import os
+import sqlite3
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.domain.models import DomainEvaluation, Recommendation, Shard
+from app.domain.ports import WorkQueue
+from app.domain.serialization import evaluation_from_dict, evaluation_to_dict
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+def split_errored(
+    shard: Shard, results: Iterable[DomainEvaluation], max_attempts: int
+) -> Tuple[List[DomainEvaluation], List[str]]:
+    """
+    Results to store, and domains to queue again because their evaluation
+    errored (a timeout, a rate limit). A retry shard starts at the attempt
+    its domains already used; once they are out of attempts the errors are
+    stored and reported.
+    """
+    results = list(results)
+    if shard.attempt >= max_attempts:
+        return results, []
+    kept = [result for result in results if result.error is None]
+    return kept, [result.domain for result in results if result.error is not None]
+
+
+def _dump(result: DomainEvaluation) -> str:
+    return json.dumps(evaluation_to_dict(result), separators=(",", ":"))
+
+
+class SqliteWorkQueue(WorkQueue):
+    """
+    Durable shard queue in a single SQLite file.
+    Workers lease shards for `lease_seconds`; a shard whose lease runs out
+    (crashed or stuck worker) goes to the next worker that asks, up to
+    `max_attempts` times. Every lease bumps the shard's attempt number and
+    writes are conditional on it, so a worker that lost its lease cannot
+    overwrite the new owner's results.
+
+    Meant for worker processes on one host: SQLite locking is unreliable on
+    network file systems (NFS, SMB), so the file must sit on a local disk.
+    Workers on several hosts share a FileWorkQueue instead.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 300.0, max_attempts: int = 3):
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        # isolation_level=None: transactions are opened explicitly below
+        self._conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=DELETE")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS shards (
+                id INTEGER PRIMARY KEY,
+                domains TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker_id TEXT,
+                lease_expires REAL,
+                error TEXT
+            );
+            CREATE INDEX IF NOT EXISTS shards_status ON shards (status, id);
+            CREATE TABLE IF NOT EXISTS results (
+                shard_id INTEGER NOT NULL,
+                domain TEXT NOT NULL,
+                recommendation TEXT NOT NULL,
+                failed INTEGER NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS results_shard ON results (shard_id);
+            """
+        )
+
+    def enqueue(
+        self, domains: Iterable[str], shard_size: int = 1000
+    ) -> Tuple[int, int]:
+        """Splits domains into shards; returns (shards, domains) added."""
+        iterator = iter(domains)
+        shards = total = 0
+        while True:
+            # One transaction per 100 shards keeps huge inputs out of memory
+            batch = []
+            for _ in range(100):
+                chunk = list(islice(iterator, shard_size))
+                if not chunk:
+                    break
+                batch.append(("\n".join(chunk), len(chunk)))
+            if not batch:
+                return shards, total
+            with self._transaction():
+                self._conn.executemany(
+                    "INSERT INTO shards (domains, size) VALUES (?, ?)", batch
+                )
+            shards += len(batch)
+            total += sum(size for _, size in batch)
+
+    def lease(self, worker_id: str) -> Optional[Shard]:
+        now = time.time()
+        with self._transaction():
+            while True:
+                row = self._conn.execute(
+                    "SELECT id, domains, attempts FROM shards "
+                    "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY id LIMIT 1",
+                    (PENDING, LEASED, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                shard_id, domains, attempts = row
+                if attempts < self._max_attempts:
+                    break
+                # Abandoned too many times; park it for the operator
+                self._conn.execute(
+                    "UPDATE shards SET status = ?, error = COALESCE(error, ?) "
+                    "WHERE id = ?",
+                    (FAILED, "lease expired", shard_id),
+                )
+
+            self._conn.execute(
+                "UPDATE shards SET status = ?, attempts = ?, worker_id = ?, "
+                "lease_expires = ? WHERE id = ?",
+                (LEASED, attempts + 1, worker_id, now + self._lease_seconds, shard_id),
+            )
+        return Shard(
+            id=shard_id,
+            domains=tuple(domains.split("\n")),
+            worker_id=worker_id,
+            attempt=attempts + 1,
+        )
+
+    def renew(self, shard: Shard) -> bool:
+        cursor = self._conn.execute(
+            "UPDATE shards SET lease_expires = ? "
+            "WHERE id = ? AND status = ? AND attempts = ?",
+            (time.time() + self._lease_seconds, shard.id, LEASED, shard.attempt),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, shard: Shard, results: Iterable[DomainEvaluation]) -> bool:
+        kept, retry = split_errored(shard, results, self._max_attempts)
+        rows = [
+            (
+                shard.id,
+                result.domain,
+                result.recommendation.name,
+                result.error is not None,
+                _dump(result),
+            )
+            for result in kept
+        ]
+        with self._transaction():
+            # The shard keeps only the domains it has results for; the rest
+            # are counted under the retry shard
+            cursor = self._conn.execute(
+                "UPDATE shards SET status = ?, size = ?, lease_expires = NULL, "
+                "error = NULL WHERE id = ? AND status = ? AND attempts = ?",
+                (DONE, len(kept), shard.id, LEASED, shard.attempt),
+            )
+            if cursor.rowcount != 1:
+                return False
+            self._conn.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?)", rows)
+            if retry:
+                self._conn.execute(
+                    "INSERT INTO shards (domains, size, attempts) VALUES (?, ?, ?)",
+                    ("\n".join(retry), len(retry), shard.attempt),
+                )
+        return True
+
+    def release(self, shard: Shard, error: str) -> None:
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE shards SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "worker_id = NULL, lease_expires = NULL, error = ? "
+                "WHERE id = ? AND status = ? AND attempts = ?",
+                (
+                    self._max_attempts,
+                    FAILED,
+                    PENDING,
+                    error,
+                    shard.id,
+                    LEASED,
+                    shard.attempt,
+                ),
+            )
+
+    def seconds_until_lease(self) -> Optional[float]:
+        now = time.time()
+        if self._conn.execute(
+            "SELECT 1 FROM shards WHERE status = ? LIMIT 1", (PENDING,)
+        ).fetchone():
+            return 0.0
+        (expires,) = self._conn.execute(
+            "SELECT MIN(lease_expires) FROM shards WHERE status = ?", (LEASED,)
+        ).fetchone()
+        if expires is None:
+            return None
+        return max(0.0, expires - now)
+
+    def retry_failed(self) -> int:
+        """Puts failed shards back in the queue with a fresh attempt budget."""
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE shards SET status = ?, attempts = 0 WHERE status = ?",
+                (PENDING, FAILED),
+            )
+        return cursor.rowcount
+
+    def progress(self) -> Dict[str, object]:
+        now = time.time()
+        shards: Dict[str, int] = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        domains: Dict[str, int] = dict(shards)
+        for status, count, size in self._conn.execute(
+            "SELECT status, COUNT(*), SUM(size) FROM shards GROUP BY status"
+        ):
+            shards[status] = count
+            domains[status] = size or 0
+        evaluated, buys, errors = self._conn.execute(
+            "SELECT COUNT(*), SUM(recommendation = 'BUY'), SUM(failed) FROM results"
+        ).fetchone()
+        workers = dict(
+            self._conn.execute(
+                "SELECT worker_id, COUNT(*) FROM shards "
+                "WHERE status = ? AND lease_expires >= ? GROUP BY worker_id",
+                (LEASED, now),
+            ).fetchall()
+        )
+        return {
+            "shards": shards,
+            "domains": domains,
+            "evaluated": evaluated,
+            "buy": buys or 0,
+            "errors": errors or 0,
+            "workers": workers,
+        }
+
+    def results(self) -> Iterator[DomainEvaluation]:
+        cursor = self._conn.execute("SELECT data FROM results ORDER BY shard_id, rowid")
+        for (data,) in cursor:
+            yield evaluation_from_dict(json.loads(data))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._conn)
+
+
+class _Transaction:
+    # BEGIN IMMEDIATE takes the write lock up front, so two workers can never
+    # read the same pending shard and both lease it
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> None:
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+
+
+SHARDS = "shards"
+RESULTS = "results"
+_STATES = (PENDING, LEASED, DONE, FAILED)
+
+
+class FileWorkQueue(WorkQueue):
+    """
+    Shard queue in a plain directory, for workers on several hosts that
+    share it over NFS or SMB, where SQLite's locks cannot be trusted. It
+    only relies on what those file systems keep atomic: creating a file
+    with O_EXCL and renaming one.
+
+    Every shard has a single token file; its directory is the shard's state
+    and its name the shard id, attempt and size (pending/000000000042.1.1000).
+    Each state change is a rename of the token, which only one worker can
+    win, so a worker whose lease was taken over finds its token gone and its
+    results are refused. Leased tokens hold the owner and the expiry time,
+    so the hosts' clocks must agree to well within `lease_seconds` (NTP).
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 300.0, max_attempts: int = 3):
+        self._path = path
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._next_id: Optional[int] = None
+        for name in (SHARDS, RESULTS) + _STATES:
+            os.makedirs(os.path.join(path, name), exist_ok=True)
+
+    def enqueue(
+        self, domains: Iterable[str], shard_size: int = 1000
+    ) -> Tuple[int, int]:
+        """Splits domains into shards; returns (shards, domains) added."""
+        iterator = iter(domains)
+        shards = total = 0
+        while True:
+            chunk = list(islice(iterator, shard_size))
+            if not chunk:
+                return shards, total
+            self._create_token(PENDING, self._add_shard(chunk), 0, len(chunk))
+            shards += 1
+            total += len(chunk)
+
+    def lease(self, worker_id: str) -> Optional[Shard]:
+        for name in self._tokens(PENDING):
+            shard_id, attempts, size = _parse_token(name)
+            shard = self._claim(PENDING, name, shard_id, attempts + 1, size, worker_id)
+            if shard is not None:
+                return shard
+
+        now = time.time()
+        for name in self._tokens(LEASED):
+            if self._expires(name) >= now:
+                continue
+            shard_id, attempt, size = _parse_token(name)
+            if attempt >= self._max_attempts:
+                # Abandoned too many times; park it for the operator
+                self._move(LEASED, name, FAILED, name)
+                continue
+            shard = self._claim(LEASED, name, shard_id, attempt + 1, size, worker_id)
+            if shard is not None:
+                return shard
+        return None
+
+    def renew(self, shard: Shard) -> bool:
+        return self._write_token(
+            LEASED, _shard_token(shard), self._lease_info(shard.worker_id)
+        )
+
+    def complete(self, shard: Shard, results: Iterable[DomainEvaluation]) -> bool:
+        token = _shard_token(shard)
+        if not os.path.exists(self._file(LEASED, token)):
+            return False
+        kept, retry = split_errored(shard, results, self._max_attempts)
+
+        # Results go under the attempt's own name, so a stale worker never
+        # overwrites the file of the attempt that wins
+        results_path = self._results_path(shard.id, shard.attempt)
+        _write_atomic(results_path, "".join(_dump(result) + "\n" for result in kept))
+        retry_id = self._add_shard(retry) if retry else None
+        summary = {
+            "buy": sum(r.recommendation == Recommendation.BUY for r in kept),
+            "errors": sum(r.error is not None for r in kept),
+            "retry": retry_id,
+        }
+        done = _token(shard.id, shard.attempt, len(kept))
+        if not (
+            self._write_token(LEASED, token, summary)
+            and self._move(LEASED, token, DONE, done)
+        ):
+            _remove(results_path)
+            if retry_id is not None:
+                _remove(self._shard_path(retry_id))
+            return False
+        if retry_id is not None:
+            self._create_token(PENDING, retry_id, shard.attempt, len(retry))
+        return True
+
+    def release(self, shard: Shard, error: str) -> None:
+        token = _shard_token(shard)
+        state = FAILED if shard.attempt >= self._max_attempts else PENDING
+        if self._write_token(LEASED, token, {"error": error}):
+            self._move(LEASED, token, state, token)
+
+    def seconds_until_lease(self) -> Optional[float]:
+        if self._tokens(PENDING):
+            return 0.0
+        leased = self._tokens(LEASED)
+        if not leased:
+            return None
+        return max(0.0, min(map(self._expires, leased)) - time.time())
+
+    def retry_failed(self) -> int:
+        """
+        Puts failed shards back in the queue with a fresh attempt budget,
+        and queues retry shards a worker died before handing out.
+        """
+        count = 0
+        for name in self._tokens(FAILED):
+            shard_id, _, size = _parse_token(name)
+            count += self._move(FAILED, name, PENDING, _token(shard_id, 0, size))
+
+        known = {
+            _parse_token(name)[0] for state in _STATES for name in self._tokens(state)
+        }
+        for name in self._tokens(DONE):
+            retry_id = self._read_token(DONE, name).get("retry")
+            if retry_id is not None and retry_id not in known:
+                with open(self._shard_path(retry_id), encoding="utf-8") as f:
+                    size = len(f.read().split("\n"))
+                self._create_token(PENDING, retry_id, _parse_token(name)[1], size)
+        return count
+
+    def progress(self) -> Dict[str, object]:
+        now = time.time()
+        shards: Dict[str, int] = {state: 0 for state in _STATES}
+        domains: Dict[str, int] = dict(shards)
+        workers: Dict[str, int] = {}
+        buys = errors = 0
+        for state in _STATES:
+            for name in self._tokens(state):
+                shards[state] += 1
+                domains[state] += _parse_token(name)[2]
+                if state == DONE:
+                    summary = self._read_token(DONE, name)
+                    buys += summary.get("buy", 0)
+                    errors += summary.get("errors", 0)
+                elif state == LEASED:
+                    worker_id = self._read_token(LEASED, name).get("worker")
+                    if worker_id and self._expires(name) >= now:
+                        workers[worker_id] = workers.get(worker_id, 0) + 1
+        return {
+            "shards": shards,
+            "domains": domains,
+            "evaluated": domains[DONE],
+            "buy": buys,
+            "errors": errors,
+            "workers": workers,
+        }
+
+    def results(self) -> Iterator[DomainEvaluation]:
+        for name in self._tokens(DONE):
+            shard_id, attempt, _ = _parse_token(name)
+            with open(self._results_path(shard_id, attempt), encoding="utf-8") as f:
+                for line in f:
+                    yield evaluation_from_dict(json.loads(line))
+
+    def close(self) -> None:
+        pass
+
+    def _claim(
+        self,
+        state: str,
+        name: str,
+        shard_id: int,
+        attempt: int,
+        size: int,
+        worker_id: str,
+    ) -> Optional[Shard]:
+        token = _token(shard_id, attempt, size)
+        # Another worker may win the rename; then this shard is not ours
+        if not self._move(state, name, LEASED, token):
+            return None
+        self._write_token(LEASED, token, self._lease_info(worker_id))
+        with open(self._shard_path(shard_id), encoding="utf-8") as f:
+            domains = tuple(f.read().split("\n"))
+        return Shard(id=shard_id, domains=domains, worker_id=worker_id, attempt=attempt)
+
+    def _add_shard(self, domains: List[str]) -> int:
+        # Ids are taken with O_EXCL, so hosts enqueueing at once never share one
+        if self._next_id is None:
+            ids = [
+                int(name.partition(".")[0])
+                for name in os.listdir(os.path.join(self._path, SHARDS))
+            ]
+            self._next_id = max(ids, default=0) + 1
+        while True:
+            shard_id = self._next_id
+            self._next_id += 1
+            try:
+                fd = os.open(
+                    self._shard_path(shard_id), os.O_WRONLY | os.O_CREAT | os.O_EXCL
+                )
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(domains))
+            return shard_id
+
+    def _create_token(self, state: str, shard_id: int, attempt: int, size: int) -> None:
+        fd = os.open(
+            self._file(state, _token(shard_id, attempt, size)),
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+        )
+        os.close(fd)
+
+    def _move(self, state: str, name: str, new_state: str, new_name: str) -> bool:
+        try:
+            os.rename(self._file(state, name), self._file(new_state, new_name))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _write_token(self, state: str, name: str, info: Dict[str, object]) -> bool:
+        # Written in place: opening without O_CREAT fails once the token has
+        # been renamed away, so a lost lease is never brought back
+        try:
+            with open(self._file(state, name), "r+", encoding="utf-8") as f:
+                f.truncate()
+                f.write(json.dumps(info))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _read_token(self, state: str, name: str) -> Dict:
+        try:
+            with open(self._file(state, name), encoding="utf-8") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            # Gone, or caught between truncate and write
+            return {}
+
+    def _expires(self, name: str) -> float:
+        expires = self._read_token(LEASED, name).get("expires")
+        if expires is not None:
+            return expires
+        # Claimed but not yet written (or its owner died in between)
+        try:
+            return os.stat(self._file(LEASED, name)).st_mtime + self._lease_seconds
+        except FileNotFoundError:
+            return float("inf")
+
+    def _lease_info(self, worker_id: str) -> Dict[str, object]:
+        return {"worker": worker_id, "expires": time.time() + self._lease_seconds}
+
+    def _tokens(self, state: str) -> List[str]:
+        return sorted(os.listdir(os.path.join(self._path, state)))
+
+    def _file(self, state: str, name: str) -> str:
+        return os.path.join(self._path, state, name)
+
+    def _shard_path(self, shard_id: int) -> str:
+        return os.path.join(self._path, SHARDS, f"{shard_id:012d}.txt")
+
+    def _results_path(self, shard_id: int, attempt: int) -> str:
+        return os.path.join(self._path, RESULTS, f"{shard_id:012d}.{attempt}.jsonl")
+
+
+def _token(shard_id: int, attempt: int, size: int) -> str:
+    # Zero-padded, so sorted names are shards in queue order
+    return f"{shard_id:012d}.{attempt}.{size}"
+
+
+def _shard_token(shard: Shard) -> str:
+    return _token(shard.id, shard.attempt, len(shard.domains))
+
+
+def _parse_token(name: str) -> Tuple[int, int, int]:
+    shard_id, attempt, size = name.split(".")
+    return int(shard_id), int(attempt), int(size)
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,426 @@
+import gzip
+import heapq
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from contextlib import ExitStack
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+from app.domain.models import DomainAvailability
+from app.domain.ports import (
+    NULL_METRICS,
+    AsyncAvailabilityProvider,
+    AvailabilityProvider,
+    MetricsRecorder,
+    in_input_order,
+)
+
+MAGIC = b"DIZ1"
+# Magic, label count, file offset of the offset table
+_HEADER = struct.Struct("<4sQQ")
+# Label i spans blob[offset[i]:offset[i + 1]]
+_SPAN = struct.Struct("<QQ")
+MANIFEST = "manifest.json"
+INDEX_SUFFIX = ".zidx"
+# Labels sorted in memory per run of the external sort (~100 MB)
+RUN_SIZE = 2_000_000
+
+_CLASSES = {"in", "ch", "hs", "cs"}
+
+
+def zone_tld(path: str) -> str:
+    # CZDS names snapshots after the zone: com.txt.gz, net.zone, ...
+    return os.path.basename(path).split(".", 1)[0].lower()
+
+
+def open_zone(path: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="ascii", errors="replace")
+    return open(path, encoding="ascii", errors="replace")
+
+
+def _absolute(name: str, origin: str) -> str:
+    if name == "@":
+        return origin
+    if name.endswith("."):
+        return name[:-1]
+    return f"{name}.{origin}" if origin else name
+
+
+def _record_type(tokens: List[str]) -> Optional[str]:
+    # [ttl] [class] type, in either order
+    for token in tokens[:3]:
+        token = token.lower()
+        if token[0].isdigit() or token in _CLASSES:
+            continue
+        return token
+    return None
+
+
+def iter_delegations(lines: Iterable[str], tld: str) -> Iterator[str]:
+    """
+    Second-level labels delegated (NS record) in a DNS master file for
+    `tld`, lower-cased, in file order and with repeats. Glue and deeper
+    names are skipped; a delegation is what registration looks like.
+    """
+    tld = tld.lower().strip(".")
+    suffix = "." + tld
+    origin = tld
+    owner = ""
+    depth = 0
+    for line in lines:
+        line = line.split(";", 1)[0]
+        if depth > 0:
+            # Rest of a multi-line record, e.g. the SOA
+            depth += line.count("(") - line.count(")")
+            continue
+        tokens = line.split()
+        if not tokens:
+            continue
+        depth = line.count("(") - line.count(")")
+        if tokens[0].startswith("$"):
+            if tokens[0].upper() == "$ORIGIN" and len(tokens) > 1:
+                origin = tokens[1].lower().rstrip(".")
+            continue
+        if not line[0].isspace():
+            # A line starting with whitespace reuses the previous owner
+            owner = _absolute(tokens[0].lower(), origin)
+            tokens = tokens[1:]
+        if _record_type(tokens) != "ns" or not owner.endswith(suffix):
+            continue
+        label = owner[: -len(suffix)]
+        if label and "." not in label and label.isascii():
+            yield label
+
+
+def _write_run(labels: List[bytes], directory: Optional[str]) -> str:
+    fd, path = tempfile.mkstemp(prefix="zone-run-", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        f.writelines(label + b"\n" for label in labels)
+    return path
+
+
+def _read_run(f: IO[bytes]) -> Iterator[bytes]:
+    for line in f:
+        yield line[:-1]
+
+
+def sorted_unique(
+    labels: Iterable[str], run_size: int = RUN_SIZE, tmpdir: Optional[str] = None
+) -> Iterator[bytes]:
+    """
+    External sort: sorted runs of `run_size` labels spill to temp files and
+    are merged, so memory stays bounded however large the zone is.
+    """
+    runs: List[str] = []
+    try:
+        batch: List[bytes] = []
+        for label in labels:
+            batch.append(label.encode("ascii"))
+            if len(batch) >= run_size:
+                runs.append(_write_run(sorted(set(batch)), tmpdir))
+                batch = []
+        batch = sorted(set(batch))
+        if not runs:
+            yield from batch
+            return
+        runs.append(_write_run(batch, tmpdir))
+        del batch
+        with ExitStack() as stack:
+            files = [stack.enter_context(open(path, "rb")) for path in runs]
+            previous = None
+            for label in heapq.merge(*(_read_run(f) for f in files)):
+                if label != previous:
+                    yield label
+                    previous = label
+    finally:
+        for path in runs:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def write_index(labels: Iterable[bytes], path: str) -> int:
+    """
+    Writes sorted, unique `labels` to `path` and returns how many. The file
+    is replaced atomically, so processes still mapping the old one are safe.
+    Layout: header, label bytes back to back, then count + 1 offsets.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    count = 0
+    position = 0
+    with open(tmp, "wb") as out, tempfile.TemporaryFile(
+        dir=os.path.dirname(path) or None
+    ) as offsets:
+        out.write(_HEADER.pack(MAGIC, 0, 0))
+        chunk = array("Q")
+        for label in labels:
+            chunk.append(position)
+            if len(chunk) >= 65536:
+                _write_offsets(chunk, offsets)
+                chunk = array("Q")
+            out.write(label)
+            position += len(label)
+            count += 1
+        chunk.append(position)
+        _write_offsets(chunk, offsets)
+
+        table = out.tell()
+        offsets.seek(0)
+        while True:
+            block = offsets.read(1 << 20)
+            if not block:
+                break
+            out.write(block)
+        out.seek(0)
+        out.write(_HEADER.pack(MAGIC, count, table))
+    os.replace(tmp, path)
+    return count
+
+
+def _write_offsets(chunk: "array[int]", f: IO[bytes]) -> None:
+    if sys.byteorder != "little":
+        chunk.byteswap()
+    chunk.tofile(f)
+
+
+class ZoneIndex:
+    """One TLD's sorted labels, memory-mapped; a lookup is a binary search."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self._table = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a zone index")
+
+    def __contains__(self, label: bytes) -> bool:
+        data = self._map
+        table = self._table
+        base = _HEADER.size
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start, end = _SPAN.unpack_from(data, table + middle * 8)
+            key = data[base + start : base + end]
+            if key < label:
+                low = middle + 1
+            elif key > label:
+                high = middle
+            else:
+                return True
+        return False
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def load_manifest(directory: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(directory: str, manifest: Dict[str, Dict[str, Any]]) -> None:
+    path = os.path.join(directory, MANIFEST)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def build_zone_indexes(
+    paths: Iterable[str],
+    directory: str,
+    force: bool = False,
+    run_size: int = RUN_SIZE,
+) -> Dict[str, Optional[int]]:
+    """
+    Indexes each zone file into `directory`, one index per TLD. A file
+    whose size and mtime match the manifest is skipped, so when a new
+    snapshot of one zone arrives only that TLD is rebuilt. The rebuild
+    re-reads and re-sorts the whole snapshot; it is not merged as a diff
+    into the old index. Returns TLD -> labels indexed, or None for a
+    skipped file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = load_manifest(directory)
+    built: Dict[str, Optional[int]] = {}
+    for path in paths:
+        tld = zone_tld(path)
+        stat = os.stat(path)
+        snapshot = {
+            "source": os.path.abspath(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        entry = manifest.get(tld)
+        index_path = os.path.join(directory, tld + INDEX_SUFFIX)
+        if (
+            not force
+            and entry is not None
+            and all(entry.get(key) == value for key, value in snapshot.items())
+            and os.path.exists(index_path)
+        ):
+            built[tld] = None
+            continue
+
+        with open_zone(path) as zone:
+            labels = sorted_unique(iter_delegations(zone, tld), run_size, directory)
+            count = write_index(labels, index_path)
+        manifest[tld] = dict(snapshot, count=count, built_at=time.time())
+        # Saved per TLD: an interrupted build keeps the zones already done
+        _write_manifest(directory, manifest)
+        built[tld] = count
+    return built
+
+
+class ZoneDirectory:
+    """
+    The indexes built by build_zone_indexes. A TLD whose snapshot is older
+    than `max_age` is ignored: a domain dropped since then would wrongly
+    look taken, so its domains go to the API instead.
+    """
+
+    def __init__(self, directory: str, max_age: float = 7 * 24 * 3600):
+        self._directory = directory
+        self._max_age = max_age
+        self._indexes: Dict[str, Optional[ZoneIndex]] = {}
+        self._lock = threading.Lock()
+        self._manifest = load_manifest(directory)
+
+    def is_registered(self, domain: str) -> bool:
+        """True if `domain` is delegated in its zone; False means unknown."""
+        label, _, tld = domain.lower().rstrip(".").partition(".")
+        index = self._index(tld)
+        if index is None or not label:
+            return False
+        try:
+            key = label.encode("ascii") if label.isascii() else label.encode("idna")
+        except UnicodeError:
+            return False
+        return key in index
+
+    def _index(self, tld: str) -> Optional[ZoneIndex]:
+        if tld in self._indexes:
+            return self._indexes[tld]
+        with self._lock:
+            if tld not in self._indexes:
+                self._indexes[tld] = self._open(tld)
+            return self._indexes[tld]
+
+    def _open(self, tld: str) -> Optional[ZoneIndex]:
+        entry = self._manifest.get(tld)
+        if entry is None:
+            return None
+        age = time.time() - entry["mtime_ns"] / 1e9
+        if age > self._max_age:
+            print(
+                f"Zone index for .{tld} is {age / 86400:.0f} days old; "
+                "not used until rebuilt"
+            )
+            return None
+        try:
+            return ZoneIndex(os.path.join(self._directory, tld + INDEX_SUFFIX))
+        except (OSError, ValueError) as e:
+            print(f"Zone index for .{tld} not used: {e}")
+            return None
+
+
+def _taken(domain: str) -> DomainAvailability:
+    return DomainAvailability(domain=domain, available=False)
+
+
+def _registered(zones: ZoneDirectory, metrics: MetricsRecorder, domain: str) -> bool:
+    registered = zones.is_registered(domain)
+    metrics.increment(
+        "domain_intel_zone_lookups_total",
+        outcome="registered" if registered else "unknown",
+    )
+    return registered
+
+
+class ZoneAvailabilityProvider(AvailabilityProvider):
+    """
+    Domains delegated in a local zone snapshot are answered as taken
+    without an API call; only the rest, which may be available, reach
+    `inner`. Absence from the zone proves nothing (e.g. domains on hold
+    have no NS records), so it is never answered locally.
+    """
+
+    def __init__(
+        self,
+        inner: AvailabilityProvider,
+        zones: ZoneDirectory,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        self._inner = inner
+        self._zones = zones
+        self._metrics = metrics
+        self.supports_bulk = inner.supports_bulk
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        if self._registered(domain):
+            return _taken(domain)
+        return self._inner.check_availability(domain)
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        results: List[DomainAvailability] = []
+        missing: List[str] = []
+        for domain in domains:
+            if self._registered(domain):
+                results.append(_taken(domain))
+            else:
+                missing.append(domain)
+        if missing:
+            results.extend(self._inner.check_availability_bulk(missing))
+        return in_input_order(domains, results)
+
+    def _registered(self, domain: str) -> bool:
+        return _registered(self._zones, self._metrics, domain)
+
+
+# An index lookup is a few page reads, so the async wrapper checks inline
+class AsyncZoneAvailabilityProvider(AsyncAvailabilityProvider):
+    def __init__(
+        self,
+        inner: AsyncAvailabilityProvider,
+        zones: ZoneDirectory,
+        metrics: MetricsRecorder = NULL_METRICS,
+    ):
+        self._inner = inner
+        self._zones = zones
+        self._metrics = metrics
+        self.supports_bulk = inner.supports_bulk
+
+    async def check_availability(self, domain: str) -> DomainAvailability:
+        if self._registered(domain):
+            return _taken(domain)
+        return await self._inner.check_availability(domain)
+
+    async def check_availability_bulk(
+        self, domains: List[str]
+    ) -> List[DomainAvailability]:
+        results: List[DomainAvailability] = []
+        missing: List[str] = []
+        for domain in domains:
+            if self._registered(domain):
+                results.append(_taken(domain))
+            else:
+                missing.append(domain)
+        if missing:
+            results.extend(await self._inner.check_availability_bulk(missing))
+        return in_input_order(domains, results)
+
+    def _registered(self, domain: str) -> bool:
+        return _registered(self._zones, self._metrics, domain)
@@ -7,25 +7,32 @@ class CLIHandler:
     def __init__(self, batch_use_case: BatchEvaluateUseCase):
         self._batch_use_case = batch_use_case
 
-    def run(self, domains: List[str]):
+    def run(self, domains: List[str], ordered: bool = True):
         print(f"Processing {len(domains)} domains...\n")
 
         try:
-            results = self._batch_use_case.execute(domains)
-
             print(
                 f"{'DOMAIN':<25} | {'AVAIL':<8} | {'GOVALUE':<10} | {'PROB':<6} | {'DECISION'}"
             )
             print("-" * 75)
 
-            for res in results:
+            # Rows are printed as soon as they are evaluated
+            for res in self._batch_use_case.execute_iter(domains, ordered=ordered):
                 decision = "BUY" if res.recommendation == Recommendation.BUY else "SKIP"
                 color = "\033[92m" if decision == "BUY" else "\033[91m"
                 reset = "\033[0m"
 
+                if res.error:
+                    print(f"{res.domain:<25} | \033[93mERROR: {res.error}{reset}")
+                    continue
+
+                if res.skip_reason:
+                    decision = f"SKIP ({res.skip_reason.value})"
+
+                avail = "-" if res.is_available is None else str(res.is_available)
                 print(
                     f"{res.domain:<25} | "
-                    f"{str(res.is_available):<8} | "
+                    f"{avail:<8} | "
                     f"${int(res.go_value):<9} | "
                     f"{res.sale_probability:<6} | "
                     f"{color}{decision}{reset}"
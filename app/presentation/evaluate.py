@@ -0,0 +1,156 @@
+import sys
+from contextlib import ExitStack
+from itertools import chain
+from typing import Iterator, Optional
+
+from app.application.rules import ScoringPolicy
+from app.composition import (
+    build_async_batch_use_case,
+    build_batch_use_case,
+    build_cache,
+    build_metrics,
+    build_profiler,
+)
+from app.domain.models import EvaluationPlan
+from app.infrastructure.config import Settings
+from app.presentation.cli import CLIHandler
+from app.presentation.generate import build_candidates
+from app.presentation.reports import print_cache_stats, profiling, write_metrics
+from app.presentation.stream import WRITERS, StreamHandler, read_domains
+
+
+def run_tui(args, settings: Settings, policy: ScoringPolicy) -> None:
+    from app.presentation.tui import DomainIntelApp
+
+    metrics = build_metrics(bool(args.metrics))
+    resources = ExitStack()
+    cache = build_cache(
+        settings, metrics, not args.no_cache, args.refresh_cache, resources
+    )
+    profiler = build_profiler(bool(args.profile))
+    app = DomainIntelApp(
+        build_async_batch_use_case(
+            settings, cache, policy, metrics, profiler, resources
+        ),
+        profiler,
+    )
+    with resources, profiling(profiler, args.profile):
+        app.run()
+    if args.metrics:
+        write_metrics(metrics, args.metrics)
+
+
+def run_gui(args, settings: Settings, policy: ScoringPolicy) -> None:
+    from app.presentation.gui import DomainIntelGUI
+
+    metrics = build_metrics(bool(args.metrics))
+    resources = ExitStack()
+    cache = build_cache(
+        settings, metrics, not args.no_cache, args.refresh_cache, resources
+    )
+    profiler = build_profiler(bool(args.profile))
+    app = DomainIntelGUI(
+        build_batch_use_case(
+            settings,
+            args.workers or settings.BATCH_MAX_WORKERS,
+            cache,
+            policy=policy,
+            metrics=metrics,
+            profiler=profiler,
+            resources=resources,
+        ),
+        profiler,
+    )
+    with resources, profiling(profiler, args.profile):
+        app.run()
+    if args.metrics:
+        write_metrics(metrics, args.metrics)
+
+
+def run_evaluate(args, settings: Settings, policy: ScoringPolicy) -> None:
+    # The CLI table, streaming (-i/-o) and `generate` runs
+    candidates = None
+    if args.domains[:1] == ["generate"]:
+        candidates = build_candidates(args, settings, policy)
+        if candidates is None:
+            return
+
+    metrics = build_metrics(bool(args.metrics))
+    resources = ExitStack()
+    cache = build_cache(
+        settings, metrics, not args.no_cache, args.refresh_cache, resources
+    )
+    profiler = build_profiler(bool(args.profile))
+
+    streaming = candidates is not None or bool(args.input or args.output)
+    plan = EvaluationPlan.full()
+    if args.decision_only:
+        plan = EvaluationPlan.decision_only()
+    elif not streaming:
+        # The CLI table has no owner column, so registrants are never looked up
+        plan = EvaluationPlan(registrant=False)
+    batch_use_case = build_batch_use_case(
+        settings,
+        args.workers or settings.BATCH_MAX_WORKERS,
+        cache,
+        plan,
+        policy,
+        metrics,
+        profiler,
+        resources,
+    )
+
+    journal = None
+    if args.journal:
+        from app.application.checkpoint import CheckpointedBatchEvaluateUseCase
+        from app.infrastructure.journal import JsonlJournal, load_journal
+
+        completed = load_journal(args.journal) if args.resume else {}
+        if completed:
+            print(
+                f"Resuming: {len(completed)} domains already done", file=sys.stderr
+            )
+        journal = JsonlJournal(args.journal, settings.JOURNAL_FLUSH_INTERVAL)
+        batch_use_case = CheckpointedBatchEvaluateUseCase(
+            batch_use_case, journal, completed
+        )
+
+    try:
+        with profiling(profiler, args.profile):
+            run_batch(args, batch_use_case, candidates)
+    finally:
+        resources.close()
+        if journal is not None:
+            journal.close()
+        if args.metrics:
+            write_metrics(metrics, args.metrics)
+
+    if cache is not None and not streaming:
+        print_cache_stats(cache)
+
+
+def run_batch(
+    args, batch_use_case, candidates: Optional[Iterator[str]] = None
+) -> None:
+    # 3. Input Handling
+    if candidates is not None or args.input or args.output:
+        # Streaming mode: lazy input, incremental output
+        if candidates is not None:
+            domains = candidates
+        else:
+            domains = iter(args.domains)
+            if args.input:
+                domains = chain(domains, read_domains(args.input))
+        writer = WRITERS[args.format](args.output)
+        StreamHandler(batch_use_case).run(
+            domains, writer, ordered=not args.unordered
+        )
+        return
+
+    cli = CLIHandler(batch_use_case)
+    domains = args.domains
+    if not domains:
+        print("Usage: python main.py <domain1> ... OR python main.py tui")
+        domains = ["example.com", "myawesomestartup123.com", "google.com"]
+
+    cli.run(domains, ordered=not args.unordered)
@@ -0,0 +1,49 @@
+import os
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.application.rules import ScoringPolicy
+from app.infrastructure.config import Settings
+from app.presentation.stream import read_domains
+
+
+def load_word_list(spec: str) -> Tuple[str, List[str]]:
+    # "tld=com,io" inline, or "word=words.txt"; an empty inline value
+    # ("prefix=,get") makes the placeholder optional
+    name, sep, value = spec.partition("=")
+    if not sep or not name:
+        raise ValueError(f"--list {spec!r}: expected NAME=FILE or NAME=a,b,c")
+    values = read_domains(value) if os.path.isfile(value) else value.split(",")
+    # Order kept, repeats dropped: the lists are what multiplies
+    return name, list(dict.fromkeys(v.strip().lower() for v in values))
+
+
+def build_candidates(
+    args, settings: Settings, policy: ScoringPolicy
+) -> Optional[Iterator[str]]:
+    from app.application.candidates import count_combinations, generate_candidates
+    from app.infrastructure.bloom import BloomFilter
+
+    if not args.pattern:
+        print(
+            "Usage: python main.py generate --pattern '{word}.{tld}' "
+            "--list word=words.txt --list tld=com,io [-o results.csv]"
+        )
+        return None
+    try:
+        lists: Dict[str, List[str]] = dict(map(load_word_list, args.list))
+        total = count_combinations(args.pattern, lists)
+    except ValueError as e:
+        print(e)
+        return None
+    seen = BloomFilter(
+        total,
+        settings.GENERATE_BLOOM_ERROR_RATE,
+        max_bytes=settings.GENERATE_BLOOM_MAX_MB * 2**20,
+    )
+    print(
+        f"Generating up to {total} candidates; dedup filter "
+        f"{seen.size_bytes / 2**20:.1f} MiB, ~{seen.error_rate():.2%} dropped wrongly",
+        file=sys.stderr,
+    )
+    return generate_candidates(args.pattern, lists, seen, policy)
@@ -1,9 +1,14 @@
 import tkinter as tk
 from tkinter import ttk
 import threading
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, ContextManager, Optional
 from app.application.use_cases import BatchEvaluateUseCase
 from app.domain.models import Recommendation
 
+if TYPE_CHECKING:
+    from app.infrastructure.profiling import Profiler
+
 
 def rounded_rect(canvas, x1, y1, x2, y2, radius, **kwargs):
     points = [
@@ -201,8 +206,13 @@ class RoundedButton(tk.Canvas):
 
 
 class DomainIntelGUI:
-    def __init__(self, batch_use_case: BatchEvaluateUseCase):
+    def __init__(
+        self,
+        batch_use_case: BatchEvaluateUseCase,
+        profiler: Optional["Profiler"] = None,
+    ):
         self._batch_use_case = batch_use_case
+        self._profiler = profiler
         self.root = tk.Tk()
         self.root.title("Domain Intel GUI")
         self.root.geometry("1000x700")
@@ -460,29 +470,36 @@ class DomainIntelGUI:
         ).start()
 
     def process_domains(self, domains):
-        for domain in domains:
-            try:
-                # We process one by one to update UI
-                results = self._batch_use_case.execute([domain])
-
-                if results:
-                    res = results[0]
-                    self.root.after(0, self.add_result, res)
-            except Exception as e:
-                print(f"Error processing {domain}: {e}")
-
-            self.root.after(0, self.step_progress)
+        try:
+            # Rows are added in completion order while the batch runs concurrently
+            for res in self._batch_use_case.execute_iter(domains, ordered=False):
+                if res.error:
+                    print(f"Error processing {res.domain}: {res.error}")
+                self.root.after(0, self.add_result, res)
+                self.root.after(0, self.step_progress)
+        except Exception as e:
+            print(f"Error processing batch: {e}")
 
         self.root.after(0, self.finish_processing)
 
     def step_progress(self):
-        self.progress["value"] += 1
+        with self._stage("progress"):
+            self.progress["value"] += 1
 
     def add_result(self, res):
+        # Runs on the Tk thread, between redraws
+        with self._stage("render"):
+            self._insert_row(res)
+
+    def _insert_row(self, res):
         # Format similar to TUI
         price_val = f"${res.price}" if res.price else f"${res.go_value or 0}"
         prob = f"{int((res.sale_probability or 0) * 100)}%"
         registrant = res.registrant or "N/A"
+        if res.skip_reason:
+            registrant = res.skip_reason.value
+        if res.error:
+            registrant = f"Error: {res.error}"
         decision = "BUY" if res.recommendation == Recommendation.BUY else "SKIP"
 
         # Color coding (Treeview tags)
@@ -493,7 +510,7 @@ class DomainIntelGUI:
             tk.END,
             values=(
                 res.domain,
-                "YES" if res.is_available else "NO",
+                "-" if res.is_available is None else ("YES" if res.is_available else "NO"),
                 price_val,
                 prob,
                 registrant,
@@ -502,6 +519,11 @@ class DomainIntelGUI:
             tags=(tag,),
         )
 
+    def _stage(self, name: str) -> ContextManager[None]:
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.stage(name)
+
     def finish_processing(self):
         self.submit_btn.config(state=tk.NORMAL)
         self.domain_input.entry.focus()
@@ -0,0 +1,47 @@
+import json
+import sys
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from app.infrastructure.cache import SqliteCache
+
+if TYPE_CHECKING:
+    from app.infrastructure.metrics import MetricsRegistry
+    from app.infrastructure.profiling import Profiler
+
+
+def write_metrics(metrics: "MetricsRegistry", path: str) -> None:
+    if path == "-" or path.endswith(".json"):
+        text = json.dumps(metrics.summary(), indent=2) + "\n"
+    else:
+        text = metrics.to_prometheus()
+    if path == "-":
+        sys.stdout.write(text)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+@contextmanager
+def profiling(profiler: Optional["Profiler"], path: Optional[str]) -> Iterator[None]:
+    if profiler is None or path is None:
+        yield
+        return
+    profiler.start()
+    try:
+        yield
+    finally:
+        # Written on Ctrl-C too: an interrupted slow run is the usual case
+        profiler.stop()
+        profiler.write_report(path)
+        print(f"Profile written to {path} (raw stats: {path}.prof)", file=sys.stderr)
+
+
+def print_cache_stats(cache: SqliteCache) -> None:
+    print("\nCache:")
+    for kind, counts in cache.stats().items():
+        total = counts["hits"] + counts["misses"]
+        rate = counts["hits"] / total if total else 0.0
+        print(
+            f"  {kind:<13} {counts['hits']} hits / {counts['misses']} misses ({rate:.0%})"
+        )
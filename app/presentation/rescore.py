@@ -0,0 +1,20 @@
+from app.application.rules import ScoringPolicy
+from app.presentation.stream import WRITERS, read_results
+
+
+def rescore_results(args, policy: ScoringPolicy) -> None:
+    # Offline: re-decides stored results under new rules, no provider calls
+    from app.application.scoring import rescore
+
+    if not args.input:
+        print(
+            "Usage: python main.py rescore -i results.jsonl "
+            "[--rules rules.json] [-o out.csv]"
+        )
+        return
+    writer = WRITERS[args.format](args.output)
+    try:
+        for evaluation in rescore(read_results(args.input), policy):
+            writer.write(evaluation)
+    finally:
+        writer.close()
@@ -0,0 +1,116 @@
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import IO, Iterable, Iterator, Optional
+
+from app.application.use_cases import BatchEvaluateUseCase
+from app.domain.models import DomainEvaluation
+from app.domain.serialization import (
+    EVALUATION_FIELDS,
+    evaluation_from_dict,
+    evaluation_to_dict,
+)
+
+# Output is written through a large buffer instead of one syscall per row
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def read_domains(path: str) -> Iterator[str]:
+    """
+    Lazily yields domains from a file ("-" for stdin), one per line.
+    Blank lines and '#' comments are skipped; only the first column is used.
+    """
+    source = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in source:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            yield line.replace(",", " ").split()[0]
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def read_results(path: str) -> Iterator[DomainEvaluation]:
+    """Lazily reads results previously written as JSONL (*.jsonl) or CSV."""
+    source = sys.stdin if path == "-" else open(path, encoding="utf-8", newline="")
+    try:
+        if path.endswith(".jsonl"):
+            for line in source:
+                if line.strip():
+                    yield evaluation_from_dict(json.loads(line))
+        else:
+            for row in csv.DictReader(source):
+                yield evaluation_from_dict(row)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+class ResultWriter(ABC):
+    def __init__(self, path: Optional[str]):
+        if path is None or path == "-":
+            self._file: IO[str] = sys.stdout
+        else:
+            self._file = open(
+                path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE
+            )
+
+    @abstractmethod
+    def write(self, evaluation: DomainEvaluation) -> None:
+        pass
+
+    def close(self) -> None:
+        if self._file is sys.stdout:
+            self._file.flush()
+        else:
+            self._file.close()
+
+
+class CsvResultWriter(ResultWriter):
+    def __init__(self, path: Optional[str]):
+        super().__init__(path)
+        self._writer = csv.DictWriter(self._file, fieldnames=EVALUATION_FIELDS)
+        self._writer.writeheader()
+
+    def write(self, evaluation: DomainEvaluation) -> None:
+        self._writer.writerow(evaluation_to_dict(evaluation))
+
+
+class JsonlResultWriter(ResultWriter):
+    def write(self, evaluation: DomainEvaluation) -> None:
+        self._file.write(
+            json.dumps(evaluation_to_dict(evaluation), separators=(",", ":")) + "\n"
+        )
+
+
+WRITERS = {"csv": CsvResultWriter, "jsonl": JsonlResultWriter}
+
+
+class StreamHandler:
+    """
+    Streams domains through the batch use case and writes each result as soon
+    as it is ready. Memory use stays flat regardless of input size.
+    """
+
+    PROGRESS_EVERY = 10_000
+
+    def __init__(self, batch_use_case: BatchEvaluateUseCase):
+        self._batch_use_case = batch_use_case
+
+    def run(
+        self, domains: Iterable[str], writer: ResultWriter, ordered: bool = True
+    ) -> int:
+        count = 0
+        try:
+            for res in self._batch_use_case.execute_iter(domains, ordered=ordered):
+                writer.write(res)
+                count += 1
+                if count % self.PROGRESS_EVERY == 0:
+                    print(f"{count} domains processed", file=sys.stderr)
+        finally:
+            writer.close()
+        print(f"Done: {count} domains processed", file=sys.stderr)
+        return count
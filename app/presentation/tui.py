@@ -1,8 +1,14 @@
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, ContextManager, Optional
+
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Input, DataTable, Static, ProgressBar
 from textual import work
-from app.application.use_cases import BatchEvaluateUseCase
-from app.domain.models import Recommendation
+from app.application.async_use_cases import AsyncBatchEvaluateUseCase
+from app.domain.models import DomainEvaluation, Recommendation
+
+if TYPE_CHECKING:
+    from app.infrastructure.profiling import Profiler
 
 
 class DomainIntelApp(App):
@@ -32,9 +38,14 @@ class DomainIntelApp(App):
         ("q", "quit", "Quit"),
     ]
 
-    def __init__(self, batch_use_case: BatchEvaluateUseCase):
+    def __init__(
+        self,
+        batch_use_case: AsyncBatchEvaluateUseCase,
+        profiler: Optional["Profiler"] = None,
+    ):
         super().__init__()
         self._batch_use_case = batch_use_case
+        self._profiler = profiler
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -81,47 +92,53 @@ class DomainIntelApp(App):
         progress = self.query_one(ProgressBar)
         progress.update(total=len(domains), progress=0)
 
-        # Arthur: Using loop executor to avoid blocking UI with sync calls
-        import asyncio
+        # Evaluations run natively on the event loop; rows appear as they complete
+        async for res in self._batch_use_case.execute_iter(domains, ordered=False):
+            # No await inside, so the stage's CPU time is this row's alone
+            with self._stage("render"):
+                self._add_row(table, res)
 
-        loop = asyncio.get_running_loop()
+            # Update progress
+            with self._stage("progress"):
+                progress.advance(1)
+
+    def _add_row(self, table: DataTable, res: DomainEvaluation) -> None:
+        if res.recommendation == Recommendation.BUY:
+            # Check if it was a heuristic buy (Prob 0 but Buy)
+            if res.sale_probability == 0 and res.go_value == 0:
+                decision = "BUY (Hint)"
+            else:
+                decision = "BUY"
+        else:
+            decision = "SKIP"
 
-        for i, domain in enumerate(domains):
-            # Process one at a time to update progress
-            results = await loop.run_in_executor(
-                None, self._batch_use_case.execute, [domain]
-            )
+        # Arthur: Formatting strings for TUI
+        avail_str = "YES" if res.is_available else "NO"
+        if res.is_available is None:
+            avail_str = "-"
 
-            # Since we process one by one, results header is 1 element
-            if not results:
-                continue
+        if res.is_available and res.price is not None:
+            price_str = f"${res.price:,.2f}"
+        else:
+            price_str = f"${res.go_value:,.2f}"
 
-            res = results[0]
-            if res.recommendation == Recommendation.BUY:
-                # Check if it was a heuristic buy (Prob 0 but Buy)
-                if res.sale_probability == 0 and res.go_value == 0:
-                    decision = "BUY (Hint)"
-                else:
-                    decision = "BUY"
-            else:
-                decision = "SKIP"
+        prob_str = f"{res.sale_probability:.0%}"
 
-            # Arthur: Formatting strings for TUI
-            avail_str = "YES" if res.is_available else "NO"
+        # Format registrant info
+        owner_str = res.registrant if res.registrant else "-"
 
-            if res.is_available and res.price is not None:
-                price_str = f"${res.price:,.2f}"
-            else:
-                price_str = f"${res.go_value:,.2f}"
-
-            prob_str = f"{res.sale_probability:.0%}"
+        if res.skip_reason:
+            owner_str = res.skip_reason.value
 
-            # Format registrant info
-            owner_str = res.registrant if res.registrant else "-"
+        if res.error:
+            decision = "ERROR"
+            owner_str = res.error
 
-            table.add_row(
-                res.domain, avail_str, price_str, prob_str, owner_str, decision
-            )
+        table.add_row(
+            res.domain, avail_str, price_str, prob_str, owner_str, decision
+        )
 
-            # Update progress
-            progress.advance(1)
+    def _stage(self, name: str) -> ContextManager[None]:
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.stage(name)
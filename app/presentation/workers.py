@@ -0,0 +1,130 @@
+import os
+import socket
+from contextlib import ExitStack
+from itertools import chain
+
+from dotenv import load_dotenv
+
+from app.application.rules import load_policy
+from app.composition import (
+    build_batch_use_case,
+    build_cache,
+    build_metrics,
+    open_queue,
+)
+from app.domain.models import EvaluationPlan
+from app.infrastructure.config import Settings
+from app.presentation.reports import write_metrics
+from app.presentation.stream import WRITERS, read_domains
+
+
+def run_queue_command(command: str, settings: Settings, args) -> None:
+    # Coordinator side: none of these call the APIs
+    queue = open_queue(settings, args.queue)
+    try:
+        if command == "enqueue":
+            domains = iter(args.domains[1:])
+            if args.input:
+                domains = chain(domains, read_domains(args.input))
+            shards, count = queue.enqueue(
+                domains, args.shard_size or settings.QUEUE_SHARD_SIZE
+            )
+            print(f"Enqueued {count} domains in {shards} shards")
+        elif command == "requeue":
+            print(f"Requeued {queue.retry_failed()} failed shards")
+        elif command == "export":
+            writer = WRITERS[args.format](args.output)
+            try:
+                for evaluation in queue.results():
+                    writer.write(evaluation)
+            finally:
+                writer.close()
+        else:
+            print_queue_progress(queue.progress())
+    finally:
+        queue.close()
+
+
+def print_queue_progress(progress) -> None:
+    shards = progress["shards"]
+    domains = progress["domains"]
+    total_shards = sum(shards.values())
+    total_domains = sum(domains.values())
+    done = progress["evaluated"]
+    rate = done / total_domains if total_domains else 0.0
+    print(f"Domains: {done} / {total_domains} evaluated ({rate:.1%})")
+    print(f"  BUY: {progress['buy']}   errors: {progress['errors']}")
+    print(
+        f"Shards:  {shards['done']} / {total_shards} done, "
+        f"{shards['leased']} leased, {shards['pending']} pending, "
+        f"{shards['failed']} failed"
+    )
+    workers = progress["workers"]
+    print(f"Active workers: {len(workers)}")
+    for worker_id, count in sorted(workers.items()):
+        print(f"  {worker_id}: {count} shard(s)")
+
+
+def run_worker(args) -> None:
+    # Entry point of each worker process; providers are built per process
+    load_dotenv()
+    settings = Settings.from_env()
+    policy = load_policy(args.rules or settings.RULES_PATH or None)
+    from app.application.worker import ShardWorker
+
+    plan = EvaluationPlan.decision_only() if args.decision_only else None
+    metrics = build_metrics(bool(args.metrics))
+    resources = ExitStack()
+    cache = build_cache(
+        settings, metrics, not args.no_cache, args.refresh_cache, resources
+    )
+    batch_use_case = build_batch_use_case(
+        settings,
+        args.workers or settings.BATCH_MAX_WORKERS,
+        cache,
+        plan,
+        policy,
+        metrics,
+        resources=resources,
+    )
+    queue = open_queue(settings, args.queue)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    try:
+        count = ShardWorker(
+            queue,
+            batch_use_case,
+            worker_id,
+            renew_every=settings.QUEUE_LEASE_SECONDS / 3,
+        ).run()
+    finally:
+        queue.close()
+        resources.close()
+        if args.metrics:
+            # One file per process; e.g. metrics.prom -> metrics.12345.prom
+            root, ext = os.path.splitext(args.metrics)
+            path = args.metrics if root == "-" else f"{root}.{os.getpid()}{ext}"
+            write_metrics(metrics, path)
+    print(f"Worker {worker_id}: queue drained, {count} domains evaluated")
+
+
+def run_workers(args, settings: Settings) -> None:
+    processes = args.processes or settings.WORKER_PROCESSES
+    if processes <= 1:
+        run_worker(args)
+        return
+
+    import multiprocessing
+
+    workers = [
+        multiprocessing.Process(target=run_worker, args=(args,), name=f"worker-{i}")
+        for i in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        # Children got the same SIGINT and release their shards
+        for worker in workers:
+            worker.join()
@@ -0,0 +1,38 @@
+import time
+
+from app.infrastructure.config import Settings
+
+
+def run_zone_command(args, settings: Settings) -> None:
+    # Offline: indexes local zone files, no provider calls
+    from app.infrastructure.zone_index import build_zone_indexes, load_manifest
+
+    action = args.domains[1] if len(args.domains) > 1 else ""
+    directory = settings.ZONE_INDEX_DIR
+    if action == "build" and len(args.domains) > 2:
+        for path in args.domains[2:]:
+            started = time.perf_counter()
+            built = build_zone_indexes([path], directory, force=args.rebuild)
+            for tld, count in built.items():
+                if count is None:
+                    print(f".{tld}: snapshot unchanged, index kept")
+                else:
+                    elapsed = time.perf_counter() - started
+                    print(f".{tld}: {count} domains indexed in {elapsed:.1f}s")
+    elif action == "status":
+        manifest = load_manifest(directory)
+        if not manifest:
+            print(f"No zone indexes in {directory}")
+        for tld, entry in sorted(manifest.items()):
+            age = time.time() - entry["mtime_ns"] / 1e9
+            stale = age > settings.ZONE_INDEX_MAX_AGE
+            print(
+                f".{tld:<10} {entry['count']:>12} domains  "
+                f"snapshot {age / 86400:.1f} days old"
+                + ("  (stale, not used)" if stale else "")
+            )
+    else:
+        print(
+            "Usage: python main.py zone build <zone file> [...] [--rebuild]\n"
+            "       python main.py zone status"
+        )
@@ -0,0 +1,304 @@
+"""
+Local stand-ins for the GoDaddy API and WHOIS, so throughput can be measured
+without spending API quota. Both run on background threads in-process.
+"""
+
+import json
+import random
+import socket
+import socketserver
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class ServerOptions:
+    # Per-request latency: uniform in [latency_ms - jitter_ms, latency_ms + jitter_ms]
+    latency_ms: float = 20.0
+    jitter_ms: float = 5.0
+    # Extra latency per domain in a bulk availability request
+    bulk_item_ms: float = 0.1
+    # Fraction of requests answered with 500
+    error_rate: float = 0.0
+    # Fraction of requests answered with 429 regardless of load
+    throttle_rate: float = 0.0
+    # Server-side request budget per second (0 = unlimited); excess gets 429
+    rate_limit: float = 0.0
+    retry_after: str = "1"
+    # Share of domains reported as available (decided by a hash of the name)
+    available_ratio: float = 0.5
+
+
+class _Budget:
+    """Server-side token bucket deciding which requests get a 429."""
+
+    def __init__(self, per_second: float):
+        self._rate = per_second
+        self._tokens = per_second
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        if self._rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._rate, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def _hash(domain: str) -> float:
+    return zlib.crc32(domain.lower().encode()) / 0xFFFFFFFF
+
+
+def fake_availability(domain: str, options: ServerOptions) -> Dict[str, Any]:
+    return {
+        "domain": domain,
+        "available": _hash(domain) < options.available_ratio,
+        "definitive": True,
+        "price": 12_990_000,
+        "currency": "USD",
+        "period": 1,
+    }
+
+
+def fake_appraisal(domain: str) -> Dict[str, Any]:
+    h = _hash(domain[::-1])
+    return {"govalue": round(h * 5000), "sale_probability": round(h * 0.6, 3)}
+
+
+def _vcard(**fields: str) -> List[Any]:
+    properties: List[Any] = [["version", {}, "text", "4.0"]]
+    properties += [[key, {}, "text", value] for key, value in fields.items()]
+    return ["vcard", properties]
+
+
+def fake_rdap(domain: str) -> Dict[str, Any]:
+    return {
+        "objectClassName": "domain",
+        "ldhName": domain.upper(),
+        "entities": [
+            {
+                "roles": ["registrant"],
+                "vcardArray": _vcard(
+                    fn="Benchmark Person",
+                    org=f"Benchmark Holdings {_hash(domain):.3f}",
+                ),
+            },
+            {"roles": ["registrar"], "vcardArray": _vcard(fn="Benchmark Registrar")},
+        ],
+    }
+
+
+def rdap_bootstrap(base_url: str, tlds: Iterable[str]) -> Dict[str, Any]:
+    """An IANA-style RDAP bootstrap file sending every TLD to the fake server."""
+    return {
+        "version": "1.0",
+        "services": [[sorted(set(tlds)), [f"{base_url}/rdap/"]]],
+    }
+
+
+class _GoDaddyHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so the client's connection pool is exercised as in production
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, the body
+    # waits for the client's delayed ACK (~40 ms) on every request
+    disable_nagle_algorithm = True
+    server: "_GoDaddyHTTPServer"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/v1/domains/available":
+            domain = parse_qs(url.query).get("domain", [""])[0]
+            self._respond(lambda: fake_availability(domain, self.server.options))
+        elif url.path.startswith("/v1/appraisal/"):
+            domain = url.path.rsplit("/", 1)[1]
+            self._respond(lambda: fake_appraisal(domain))
+        elif url.path.startswith("/rdap/domain/"):
+            domain = url.path.rsplit("/", 1)[1]
+            self._respond(lambda: fake_rdap(domain))
+        else:
+            self._send(404, {"code": "NOT_FOUND"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        domains = json.loads(self.rfile.read(length) or b"[]")
+        if urlparse(self.path).path != "/v1/domains/available":
+            self._send(404, {"code": "NOT_FOUND"})
+            return
+        options = self.server.options
+        self._respond(
+            lambda: {"domains": [fake_availability(d, options) for d in domains]},
+            extra_ms=options.bulk_item_ms * len(domains),
+        )
+
+    def _respond(self, body, extra_ms: float = 0.0) -> None:
+        options = self.server.options
+        self.server.count("requests")
+        if not self.server.budget.take() or random.random() < options.throttle_rate:
+            self.server.count("429")
+            self._send(429, {"code": "TOO_MANY_REQUESTS"}, options.retry_after)
+            return
+
+        delay = options.latency_ms + random.uniform(-1, 1) * options.jitter_ms
+        time.sleep(max(0.0, delay + extra_ms) / 1000)
+        if random.random() < options.error_rate:
+            self.server.count("500")
+            self._send(500, {"code": "INTERNAL_ERROR"})
+            return
+        self._send(200, body())
+
+    def _send(self, status: int, body: Any, retry_after: Optional[str] = None) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if retry_after is not None:
+            self.send_header("Retry-After", retry_after)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _GoDaddyHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+    def __init__(self, options: ServerOptions):
+        super().__init__(("127.0.0.1", 0), _GoDaddyHandler)
+        self.options = options
+        self.budget = _Budget(options.rate_limit)
+        self.stats: Dict[str, int] = {"requests": 0, "429": 0, "500": 0}
+        self._stats_lock = threading.Lock()
+
+    def count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+
+class FakeGoDaddyServer:
+    """
+    Serves /v1/domains/available (GET and bulk POST), /v1/appraisal/{domain}
+    and RDAP at /rdap/domain/{domain}.
+    """
+
+    def __init__(self, options: Optional[ServerOptions] = None):
+        self._server = _GoDaddyHTTPServer(options or ServerOptions())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-godaddy", daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(self._server.stats)
+
+    def __enter__(self) -> "FakeGoDaddyServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _WhoisHandler(socketserver.StreamRequestHandler):
+    server: "_WhoisTCPServer"
+
+    def handle(self) -> None:
+        query = self.rfile.readline().decode("utf-8", "replace").strip()
+        time.sleep(self.server.latency_ms / 1000)
+        domain = query.split()[-1] if query else ""
+        if "." not in domain:
+            # IANA-style referral query for a bare TLD
+            referral = f"domain: {domain.upper()}\nwhois: whois.nic.test\n"
+            self.wfile.write(referral.encode())
+            return
+        self.wfile.write(
+            (
+                f"Domain Name: {domain.upper()}\r\n"
+                f"Registrar: Benchmark Registrar, Inc.\r\n"
+                f"Registrant Organization: Benchmark Holdings {_hash(domain):.3f}\r\n"
+                f"Name Server: NS1.EXAMPLE.NET\r\n"
+            ).encode()
+        )
+
+
+class _WhoisTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 512
+
+    def __init__(self, latency_ms: float):
+        super().__init__(("127.0.0.1", 0), _WhoisHandler)
+        self.latency_ms = latency_ms
+
+
+class FakeWhoisServer:
+    """Answers any WHOIS query (port-43 protocol) with a registered-domain record."""
+
+    def __init__(self, latency_ms: float = 50.0):
+        self._server = _WhoisTCPServer(latency_ms)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-whois", daemon=True
+        )
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def __enter__(self) -> "FakeWhoisServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def redirect_whois(port: int) -> None:
+    """
+    Points both WHOIS backends at the fake responder. They always dial
+    <server>:43, so their connection factories are swapped for ones that
+    connect to 127.0.0.1:<port> instead. Only the benchmark process is affected.
+    """
+    from app.infrastructure import whois_client
+    from whois.whois import NICClient
+
+    def connect(host: str, _port: int, timeout: float) -> socket.socket:
+        return socket.create_connection(("127.0.0.1", port), timeout=timeout)
+
+    async def aconnect(host: str, _port: int):
+        import asyncio
+
+        return await asyncio.open_connection("127.0.0.1", port)
+
+    whois_client._connect = connect
+    whois_client._aconnect = aconnect
+
+    class _RedirectedSocket(socket.socket):
+        def connect(self, address) -> None:
+            if address[1] == 43:
+                address = ("127.0.0.1", port)
+            super().connect(address)
+
+    NICClient.get_socket = staticmethod(
+        lambda: _RedirectedSocket(socket.AF_INET, socket.SOCK_STREAM)
+    )
@@ -0,0 +1,358 @@
+"""
+Throughput benchmark against local fake servers (no API quota is used).
+
+    python -m benchmarks.run --domains 2000 --concurrency 1,8,32 --paths cli,gui,tui
+
+Each path runs the same code the app runs:
+  cli  CLIHandler over BatchEvaluateUseCase (ordered, no WHOIS)
+  gui  DomainIntelGUI's worker thread over BatchEvaluateUseCase (unordered)
+  tui  DomainIntelApp's worker, headless, over AsyncBatchEvaluateUseCase
+Latency is per domain, from the moment the batch pulls it from the input
+until its result is yielded, so it includes queueing.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import random
+import statistics
+import os
+import string
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List
+
+from app.domain.models import DomainEvaluation, EvaluationPlan
+from app.infrastructure.config import Settings
+from benchmarks.fake_servers import (
+    FakeGoDaddyServer,
+    FakeWhoisServer,
+    ServerOptions,
+    rdap_bootstrap,
+    redirect_whois,
+)
+
+TLDS = ("com", "com", "com", "net", "org", "io", "ai", "dev", "xyz", "shop")
+
+
+@dataclass
+class Result:
+    path: str
+    concurrency: int
+    domains: int
+    seconds: float
+    per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    errors: int
+    http_requests: int
+    http_429: int
+    http_500: int
+
+
+def generate_domains(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    domains = []
+    for i in range(count):
+        # A unique letter prefix keeps names distinct without adding digits
+        prefix = ""
+        n = i
+        while True:
+            prefix += string.ascii_lowercase[n % 26]
+            n //= 26
+            if n == 0:
+                break
+        name = prefix + "".join(
+            rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))
+        )
+        if rng.random() < 0.1:
+            name = name[:3] + "-" + name[3:]
+        domains.append(f"{name}.{rng.choice(TLDS)}")
+    return domains
+
+
+class _Latencies:
+    def __init__(self):
+        self.values: List[float] = []
+        self.errors = 0
+        self._started: Dict[str, float] = {}
+
+    def feed(self, domains: Iterable[str]) -> Iterator[str]:
+        for domain in domains:
+            self._started[domain] = time.perf_counter()
+            yield domain
+
+    def done(self, result: DomainEvaluation) -> None:
+        self.values.append(time.perf_counter() - self._started.pop(result.domain))
+        if result.error:
+            self.errors += 1
+
+
+class _TimedBatch:
+    def __init__(self, batch, latencies: _Latencies):
+        self._batch = batch
+        self._latencies = latencies
+
+    def execute_iter(
+        self, domains: Iterable[str], ordered: bool = True
+    ) -> Iterator[DomainEvaluation]:
+        for result in self._batch.execute_iter(
+            self._latencies.feed(domains), ordered=ordered
+        ):
+            self._latencies.done(result)
+            yield result
+
+
+class _AsyncTimedBatch(_TimedBatch):
+    async def execute_iter(  # type: ignore[override]
+        self, domains: Iterable[str], ordered: bool = True
+    ) -> AsyncIterator[DomainEvaluation]:
+        async for result in self._batch.execute_iter(
+            self._latencies.feed(domains), ordered=ordered
+        ):
+            self._latencies.done(result)
+            yield result
+
+
+class _HeadlessRoot:
+    # Stands in for Tk: the worker's UI callbacks are dropped
+    def after(self, delay: int, callback: Any, *args: Any) -> None:
+        pass
+
+
+class _HeadlessGUI:
+    # Just the attributes DomainIntelGUI.process_domains touches
+    def __init__(self, batch):
+        self._batch_use_case = batch
+        self.root = _HeadlessRoot()
+
+    def add_result(self, res: DomainEvaluation) -> None:
+        pass
+
+    def step_progress(self) -> None:
+        pass
+
+    def finish_processing(self) -> None:
+        pass
+
+
+def drive_cli(settings: Settings, domains: List[str], latencies: _Latencies) -> None:
+    from app.presentation.cli import CLIHandler
+    from app.composition import build_batch_use_case
+
+    # Same plan main() uses for the table: no owner column, so no WHOIS
+    with contextlib.ExitStack() as resources:
+        batch = build_batch_use_case(
+            settings,
+            settings.BATCH_MAX_WORKERS,
+            plan=EvaluationPlan(registrant=False),
+            resources=resources,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            CLIHandler(_TimedBatch(batch, latencies)).run(domains)
+
+
+def drive_gui(settings: Settings, domains: List[str], latencies: _Latencies) -> None:
+    from app.presentation.gui import DomainIntelGUI
+    from app.composition import build_batch_use_case
+
+    with contextlib.ExitStack() as resources:
+        batch = build_batch_use_case(
+            settings, settings.BATCH_MAX_WORKERS, resources=resources
+        )
+        gui = _HeadlessGUI(_TimedBatch(batch, latencies))
+        # The GUI evaluates on a background thread; run that method the same way
+        worker = threading.Thread(
+            target=DomainIntelGUI.process_domains, args=(gui, domains), daemon=True
+        )
+        worker.start()
+        worker.join()
+
+
+def drive_tui(settings: Settings, domains: List[str], latencies: _Latencies) -> None:
+    from app.presentation.tui import DomainIntelApp
+    from app.composition import build_async_batch_use_case
+
+    async def run(resources: contextlib.ExitStack) -> None:
+        batch = build_async_batch_use_case(settings, resources=resources)
+        app = DomainIntelApp(_AsyncTimedBatch(batch, latencies))
+        async with app.run_test(headless=True, size=(160, 50)):
+            app.process_domains(domains)
+            await app.workers.wait_for_complete()
+
+    with contextlib.ExitStack() as resources:
+        asyncio.run(run(resources))
+
+
+DRIVERS = {"cli": drive_cli, "gui": drive_gui, "tui": drive_tui}
+
+
+def percentile(values: List[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] * 1000 if values else 0.0
+    return statistics.quantiles(values, n=100)[pct - 1] * 1000
+
+
+def run_once(
+    path: str,
+    concurrency: int,
+    domains: List[str],
+    options: ServerOptions,
+    base: Settings,
+) -> Result:
+    # A fresh server per run also gives a fresh client-side rate limiter,
+    # which is keyed by base URL
+    with FakeGoDaddyServer(options) as server:
+        if base.WHOIS_BACKEND == "rdap":
+            # RDAP is served by the same fake HTTP server
+            with open(base.RDAP_BOOTSTRAP_PATH, "w", encoding="utf-8") as f:
+                json.dump(rdap_bootstrap(server.url, TLDS), f)
+        settings = replace(
+            base,
+            GODADDY_BASE_URL=server.url,
+            BATCH_MAX_WORKERS=concurrency,
+            ASYNC_MAX_CONCURRENCY=concurrency,
+            HTTP_POOL_SIZE=max(base.HTTP_POOL_SIZE, concurrency),
+        )
+        latencies = _Latencies()
+        start = time.perf_counter()
+        DRIVERS[path](settings, domains, latencies)
+        seconds = time.perf_counter() - start
+        stats = server.stats
+
+    values = latencies.values
+    return Result(
+        path=path,
+        concurrency=concurrency,
+        domains=len(values),
+        seconds=round(seconds, 3),
+        per_second=round(len(values) / seconds, 1),
+        p50_ms=round(percentile(values, 50), 1),
+        p95_ms=round(percentile(values, 95), 1),
+        p99_ms=round(percentile(values, 99), 1),
+        errors=latencies.errors,
+        http_requests=stats["requests"],
+        http_429=stats["429"],
+        http_500=stats["500"],
+    )
+
+
+def print_table(results: List[Result]) -> None:
+    header = (
+        f"{'PATH':<5} {'CONC':>5} {'DOMAINS':>8} {'SEC':>8} {'DOM/S':>9} "
+        f"{'P50ms':>8} {'P95ms':>8} {'P99ms':>8} {'ERR':>5} {'REQ':>7} "
+        f"{'429':>5} {'500':>5}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.path:<5} {r.concurrency:>5} {r.domains:>8} {r.seconds:>8.2f} "
+            f"{r.per_second:>9.1f} {r.p50_ms:>8.1f} {r.p95_ms:>8.1f} "
+            f"{r.p99_ms:>8.1f} {r.errors:>5} {r.http_requests:>7} "
+            f"{r.http_429:>5} {r.http_500:>5}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Domain Intel throughput benchmark")
+    parser.add_argument("--domains", type=int, default=1000)
+    parser.add_argument(
+        "--concurrency",
+        default="1,8,32",
+        help="Comma-separated workers (cli/gui) or in-flight evaluations (tui)",
+    )
+    parser.add_argument("--paths", default="cli,gui,tui")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--bulk-item-ms", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--server-rate-limit",
+        type=float,
+        default=0.0,
+        help="Server-side requests/sec before answering 429 (0 = unlimited)",
+    )
+    parser.add_argument("--retry-after", default="1")
+    parser.add_argument("--available-ratio", type=float, default=0.5)
+    parser.add_argument("--whois-latency-ms", type=float, default=50.0)
+    parser.add_argument(
+        "--whois-backend", choices=("rdap", "native", "python-whois"), default="rdap"
+    )
+    parser.add_argument(
+        "--whois-hedge",
+        choices=("", "rdap", "native", "python-whois"),
+        default="",
+        help="Second WHOIS source for hedged lookups (WHOIS_HEDGE_BACKEND)",
+    )
+    parser.add_argument(
+        "--whois-processes",
+        type=int,
+        default=0,
+        help="python-whois parse processes (WHOIS_PROCESSES)",
+    )
+    parser.add_argument(
+        "--client-rate-limit",
+        type=float,
+        default=1_000_000.0,
+        help="GODADDY_RATE_LIMIT for the client (requests/min per endpoint)",
+    )
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    options = ServerOptions(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        bulk_item_ms=args.bulk_item_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.server_rate_limit,
+        retry_after=args.retry_after,
+        available_ratio=args.available_ratio,
+    )
+    base = Settings(
+        GODADDY_API_KEY="benchmark",
+        GODADDY_API_SECRET="benchmark",
+        GODADDY_RATE_LIMIT=args.client_rate_limit,
+        GODADDY_BACKOFF_BASE=0.1,
+        CACHE_ENABLED=False,
+        ZONE_INDEX_DIR="",
+        WHOIS_BACKEND=args.whois_backend,
+        WHOIS_HEDGE_BACKEND=args.whois_hedge,
+        WHOIS_PROCESSES=args.whois_processes,
+        RDAP_BOOTSTRAP_PATH=os.path.join(tempfile.mkdtemp(), "rdap.json"),
+    )
+    domains = generate_domains(args.domains)
+    paths = [p.strip() for p in args.paths.split(",") if p.strip()]
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    results: List[Result] = []
+    with FakeWhoisServer(args.whois_latency_ms) as whois_server:
+        redirect_whois(whois_server.port)
+        for path in paths:
+            for concurrency in levels:
+                result = run_once(path, concurrency, domains, options, base)
+                print(
+                    f"{path} x{concurrency}: {result.per_second} domains/s",
+                    file=sys.stderr,
+                )
+                results.append(result)
+
+    print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
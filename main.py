@@ -1,66 +1,187 @@
-import sys
+import argparse
+
 from dotenv import load_dotenv
 
+# Argument parsing and dispatch only: providers are wired in app/composition.py
+# and each command lives in app/presentation/. Heavy modules load on first
+# use; tests/test_import_time.py guards this.
+from app.application.rules import load_policy
 from app.infrastructure.config import Settings
-from app.infrastructure.godaddy import (
-    GoDaddyAvailabilityService,
-    GoDaddyAppraisalService,
-)
-from app.infrastructure.whois_service import GlobalWhoisService
-from app.application.use_cases import EvaluateDomainUseCase, BatchEvaluateUseCase
-from app.presentation.cli import CLIHandler
+from app.presentation.evaluate import run_evaluate, run_gui, run_tui
+from app.presentation.rescore import rescore_results
+from app.presentation.stream import WRITERS
+from app.presentation.workers import run_queue_command, run_workers
+from app.presentation.zone import run_zone_command
+
+QUEUE_COMMANDS = ("enqueue", "status", "requeue", "export")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Domain Intel")
+    parser.add_argument(
+        "domains",
+        nargs="*",
+        help=(
+            "Domains to evaluate, or a command: tui, gui, rescore, "
+            "enqueue, worker, status, requeue, export, zone build|status, generate"
+        ),
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of domains evaluated concurrently (default: BATCH_MAX_WORKERS)",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Print results in completion order instead of input order",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        help="Stream domains from a file, one per line ('-' for stdin)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Stream results to a file instead of the table ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(WRITERS),
+        default="csv",
+        help="Output format for streamed results (default: csv)",
+    )
+    parser.add_argument(
+        "--decision-only",
+        action="store_true",
+        help="Skip lookups that cannot change the decision (GoValue of taken domains)",
+    )
+    parser.add_argument(
+        "--rules",
+        help="Scoring rules file (JSON, default: RULES_PATH or the built-in rules)",
+    )
+    parser.add_argument(
+        "--journal",
+        help="Append completed evaluations to this JSONL journal",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip domains already in the journal and reuse their results",
+    )
+    parser.add_argument(
+        "--queue",
+        help=(
+            "Work queue file, or directory with QUEUE_BACKEND=files, for the "
+            "sharded worker mode (default: QUEUE_PATH)"
+        ),
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=None,
+        help="Domains per shard when enqueueing (default: QUEUE_SHARD_SIZE)",
+    )
+    parser.add_argument(
+        "-p",
+        "--processes",
+        type=int,
+        default=None,
+        help="Worker processes to start on this host (default: WORKER_PROCESSES)",
+    )
+    parser.add_argument(
+        "--pattern",
+        action="append",
+        default=[],
+        help="generate: candidate pattern, e.g. '{prefix}{word}.{tld}' (repeatable)",
+    )
+    parser.add_argument(
+        "--list",
+        action="append",
+        default=[],
+        metavar="NAME=FILE|a,b,c",
+        help="generate: values for {NAME}, from a file or inline (repeatable)",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="zone build: reindex zone files even if their snapshot is unchanged",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="domain_intel_profile.txt",
+        help=(
+            "Profile the run (CPU, allocations, wall vs CPU per provider call) "
+            "and write a report here (default: %(const)s)"
+        ),
+    )
+    parser.add_argument(
+        "--metrics",
+        help=(
+            "Write metrics at the end of the run: Prometheus text, "
+            "or a JSON summary for *.json / '-' (stdout)"
+        ),
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the persistent result cache entirely",
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached results but store fresh ones",
+    )
+    args = parser.parse_args()
+    if args.resume and not args.journal:
+        parser.error("--resume requires --journal")
+    return args
 
 
 def main():
+    args = parse_args()
+    command = args.domains[0] if args.domains else ""
+
     # 0. Load env vars
     load_dotenv()
 
     # 1. Infrastructure Setup - Arthur
     settings = Settings.from_env()
 
-    # Check for basic config presence
-    if not settings.GODADDY_API_KEY:
-        print("Warning: GODADDY_API_KEY not set. API calls will fail.")
-
-    availability_service = GoDaddyAvailabilityService(settings)
-    appraisal_service = GoDaddyAppraisalService(settings)
-    whois_service = GlobalWhoisService()
+    # Rules are compiled once and shared by every evaluation
+    policy = load_policy(args.rules or settings.RULES_PATH or None)
 
-    # 2. Application Setup
-    evaluate_use_case = EvaluateDomainUseCase(
-        availability_provider=availability_service,
-        appraisal_provider=appraisal_service,
-        whois_provider=whois_service,
-    )
-    batch_use_case = BatchEvaluateUseCase(evaluate_use_case)
-
-    # 3. Presentation Setup
-    # Check if TUI is requested
-    if len(sys.argv) > 1 and sys.argv[1] == "tui":
-        from app.presentation.tui import DomainIntelApp
-
-        app = DomainIntelApp(batch_use_case)
-        app.run()
+    if command == "rescore":
+        rescore_results(args, policy)
         return
 
-    # Check if GUI is requested
-    if len(sys.argv) > 1 and sys.argv[1] == "gui":
-        from app.presentation.gui import DomainIntelGUI
-
-        app = DomainIntelGUI(batch_use_case)
-        app.run()
+    if command == "zone":
+        run_zone_command(args, settings)
         return
 
-    cli = CLIHandler(batch_use_case)
+    if command in QUEUE_COMMANDS:
+        run_queue_command(command, settings, args)
+        return
 
-    # 4. Input Handling
-    # Arthur: In a real app, use argparse. Here we take args or default list.
-    domains = sys.argv[1:]
-    if not domains:
-        print("Usage: python main.py <domain1> ... OR python main.py tui")
-        domains = ["example.com", "myawesomestartup123.com", "google.com"]
+    # Check for basic config presence
+    if not settings.GODADDY_API_KEY:
+        print("Warning: GODADDY_API_KEY not set. API calls will fail.")
 
-    cli.run(domains)
+    # 2. Application + Presentation Setup (providers are built per mode)
+    if command == "worker":
+        run_workers(args, settings)
+    elif command == "tui":
+        run_tui(args, settings, policy)
+    elif command == "gui":
+        run_gui(args, settings, policy)
+    else:
+        # Domains on the command line, -i/-o streaming, or `generate`
+        run_evaluate(args, settings, policy)
 
 
 if __name__ == "__main__":
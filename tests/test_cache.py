@@ -0,0 +1,97 @@
+import sqlite3
+from typing import List
+
+from app.domain.models import DomainAvailability
+from app.domain.ports import AvailabilityProvider
+from app.infrastructure.cache import (
+    AVAILABILITY,
+    CachedAvailabilityProvider,
+    SqliteCache,
+)
+
+
+class CountingAvailability(AvailabilityProvider):
+    supports_bulk = True
+
+    def __init__(self):
+        self.calls: List[str] = []
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        self.calls.append(domain)
+        return DomainAvailability(domain, True, 12.99, "USD")
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        self.calls.extend(domains)
+        # Answers in reverse, like a provider that does not keep input order
+        return [DomainAvailability(d, False) for d in reversed(domains)]
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = SqliteCache(str(tmp_path / "cache.db"))
+    cache.set(AVAILABILITY, "fresh.com", "1", ttl=60)
+    cache.set(AVAILABILITY, "stale.com", "2", ttl=-1)
+
+    assert cache.get(AVAILABILITY, "fresh.com") == "1"
+    assert cache.get(AVAILABILITY, "stale.com") is None
+    assert cache.stats() == {AVAILABILITY: {"hits": 1, "misses": 1}}
+    cache.close()
+
+
+def test_refresh_misses_but_stores_new_results(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SqliteCache(path)
+    cache.set(AVAILABILITY, "example.com", "old", ttl=60)
+    cache.close()
+
+    refreshing = SqliteCache(path, refresh=True)
+    inner = CountingAvailability()
+    provider = CachedAvailabilityProvider(inner, refreshing, ttl=60)
+    provider.check_availability("example.com")
+    assert inner.calls == ["example.com"]
+    assert refreshing.get(AVAILABILITY, "example.com") is None
+    refreshing.close()
+
+    cache = SqliteCache(path)
+    assert cache.get(AVAILABILITY, "example.com") != "old"
+    cache.close()
+
+
+def test_cached_provider_serves_hits_case_insensitively(tmp_path):
+    cache = SqliteCache(str(tmp_path / "cache.db"))
+    inner = CountingAvailability()
+    provider = CachedAvailabilityProvider(inner, cache, ttl=60)
+
+    first = provider.check_availability("Example.com")
+    second = provider.check_availability("example.COM")
+    assert inner.calls == ["Example.com"]
+    assert second.domain == "example.COM"
+    assert (second.available, second.price) == (first.available, first.price)
+    cache.close()
+
+
+def test_bulk_keeps_input_order_across_hits_and_misses(tmp_path):
+    cache = SqliteCache(str(tmp_path / "cache.db"))
+    inner = CountingAvailability()
+    provider = CachedAvailabilityProvider(inner, cache, ttl=60)
+    provider.check_availability("b.com")
+
+    domains = ["a.com", "b.com", "c.com", "d.com"]
+    results = provider.check_availability_bulk(domains)
+    assert [r.domain for r in results] == domains
+    assert inner.calls == ["b.com", "a.com", "c.com", "d.com"]
+    cache.close()
+
+
+def test_access_times_are_written_on_close(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SqliteCache(path)
+    cache.set(AVAILABILITY, "example.com", "1", ttl=60)
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE entries SET accessed_at = 0")
+
+    cache.get(AVAILABILITY, "example.com")
+    cache.close()
+    conn = sqlite3.connect(path)
+    (accessed_at,) = conn.execute("SELECT accessed_at FROM entries").fetchone()
+    conn.close()
+    assert accessed_at > 0
@@ -0,0 +1,60 @@
+import pytest
+
+from app.application.candidates import count_combinations, generate_candidates
+from app.infrastructure.bloom import BloomFilter
+
+LISTS = {
+    "word": ["cloud", "data", "Cloud"],
+    "suffix": ["hub", "lab"],
+    "tld": ["com", "io"],
+}
+PATTERNS = ["{word}{suffix}.{tld}", "{word}hub.{tld}", "{word}{word}.com"]
+
+
+def test_bloom_false_positive_rate_near_error_rate():
+    bloom = BloomFilter(capacity=20_000, error_rate=0.01)
+    assert bloom.error_rate() == pytest.approx(0.01, rel=0.1)
+    for i in range(18_000):
+        bloom.add(f"name{i}.com")
+
+    # Probing adds, so the probes take the filter up to about its capacity
+    probes = 4_000
+    false_positives = sum(not bloom.add(f"fresh{i}.io") for i in range(probes))
+    assert 0.005 < false_positives / probes < 0.015
+
+
+def test_bloom_reports_repeats_as_seen():
+    bloom = BloomFilter(capacity=100)
+    assert bloom.add("example.com")
+    assert not bloom.add("example.com")
+    assert bloom.count == 1
+
+
+def test_bloom_max_bytes_caps_memory():
+    bloom = BloomFilter(capacity=1_000_000, error_rate=0.001, max_bytes=1024)
+    assert bloom.size_bytes == 1024
+    assert bloom.error_rate() > 0.001
+
+
+def test_count_combinations_includes_duplicates():
+    assert count_combinations(PATTERNS, LISTS) == 12 + 6 + 9
+
+
+def test_generate_candidates_yields_no_duplicates():
+    candidates = list(generate_candidates(PATTERNS, LISTS, BloomFilter(1000)))
+    assert len(candidates) == len(set(candidates))
+    # "Cloud" repeats "cloud" once lower-cased
+    assert len(candidates) == 8 + 4
+    assert all(candidate == candidate.lower() for candidate in candidates)
+    assert candidates[:2] == ["cloudhub.com", "cloudhub.io"]
+
+
+def test_generate_candidates_drops_prescreen_rejects():
+    lists = {"word": ["ok", "a-b-c-d", "x" * 30]}
+    candidates = list(generate_candidates(["{word}.com"], lists, BloomFilter(10)))
+    assert candidates == ["ok.com"]
+
+
+def test_unknown_list_is_an_error():
+    with pytest.raises(ValueError):
+        count_combinations(["{missing}.com"], LISTS)
@@ -0,0 +1,88 @@
+import threading
+from typing import List
+
+from app.application.checkpoint import CheckpointedBatchEvaluateUseCase
+from app.application.use_cases import BatchEvaluateUseCase, EvaluateDomainUseCase
+from app.domain.models import DomainAppraisal, DomainAvailability
+from app.domain.ports import AppraisalProvider, AvailabilityProvider, WhoisProvider
+from app.infrastructure.journal import JsonlJournal, load_journal
+
+DOMAINS = [f"name{i}.com" for i in range(30)] + ["boom.com"]
+
+
+class RecordingAvailability(AvailabilityProvider):
+    def __init__(self):
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        with self._lock:
+            self.calls.append(domain)
+        if domain.startswith("boom"):
+            raise RuntimeError("boom")
+        return DomainAvailability(domain, True, 10.0, "USD")
+
+
+class FixedAppraisal(AppraisalProvider):
+    def get_appraisal(self, domain: str) -> DomainAppraisal:
+        return DomainAppraisal(domain, 1500.0, 0.5)
+
+
+class FixedWhois(WhoisProvider):
+    def get_registrant(self, domain: str) -> str:
+        return "Org"
+
+
+def run(path: str, domains: List[str], ordered: bool = True):
+    availability = RecordingAvailability()
+    evaluate = EvaluateDomainUseCase(availability, FixedAppraisal(), FixedWhois())
+    journal = JsonlJournal(path, flush_interval=60.0)
+    use_case = CheckpointedBatchEvaluateUseCase(
+        BatchEvaluateUseCase(evaluate, max_workers=4, chunk_size=7),
+        journal,
+        load_journal(path),
+    )
+    try:
+        results = list(use_case.execute_iter(domains, ordered=ordered))
+    finally:
+        journal.close()
+    return results, availability.calls
+
+
+def test_resume_skips_journaled_domains_and_keeps_input_order(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    first, _ = run(path, DOMAINS[::2])
+    assert first[-1].error == "boom"
+
+    results, calls = run(path, DOMAINS)
+    assert [r.domain for r in results] == DOMAINS
+    # The failed domain was not journaled, so it is retried
+    assert sorted(calls) == sorted(DOMAINS[1::2] + ["boom.com"])
+    assert results[0] == first[0]
+
+
+def test_unordered_resume_yields_every_domain_once(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    run(path, DOMAINS[:10])
+    results, calls = run(path, DOMAINS, ordered=False)
+    assert sorted(r.domain for r in results) == sorted(DOMAINS)
+    assert len(calls) == len(DOMAINS) - 10
+
+
+def test_journal_lookup_ignores_case(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    run(path, ["Example.com"])
+    results, calls = run(path, ["example.COM"])
+    assert calls == []
+    assert len(results) == 1
+
+
+def test_torn_last_line_is_ignored_and_terminated(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    run(path, DOMAINS[:3])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"domain": "cut')
+
+    _, calls = run(path, DOMAINS[:4])
+    assert calls == [DOMAINS[3]]
+    assert sorted(load_journal(path)) == DOMAINS[:4]
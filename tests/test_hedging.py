@@ -0,0 +1,148 @@
+import asyncio
+import threading
+from typing import List, Tuple
+
+import pytest
+
+from app.domain.ports import AsyncWhoisProvider, MetricsRecorder, WhoisProvider
+from app.infrastructure.hedging import (
+    AsyncHedgedWhoisProvider,
+    HedgeDelay,
+    HedgedWhoisProvider,
+)
+
+SAVED = "domain_intel_whois_hedge_saved_seconds_total"
+WINS = "domain_intel_whois_hedge_wins_total"
+
+
+class RecordingMetrics(MetricsRecorder):
+    def __init__(self):
+        self.increments: List[Tuple[str, dict]] = []
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        self.increments.append((name, labels))
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        pass
+
+    def names(self) -> List[str]:
+        return [name for name, _ in self.increments]
+
+
+class BlockedWhois(WhoisProvider):
+    """Answers (or fails) only once `release` is set."""
+
+    def __init__(self, answer: str = "Slow Org", fail: bool = False):
+        self.release = threading.Event()
+        self._answer = answer
+        self._fail = fail
+
+    def get_registrant(self, domain: str) -> str:
+        self.release.wait(5)
+        if self._fail:
+            raise OSError("connection reset")
+        return self._answer
+
+
+class FixedWhois(WhoisProvider):
+    def get_registrant(self, domain: str) -> str:
+        return "Fast Org"
+
+
+def short_delay() -> HedgeDelay:
+    return HedgeDelay(min_delay=0.01, initial_delay=0.01)
+
+
+def test_delay_is_initial_until_warmup_then_percentile():
+    delay = HedgeDelay(percentile=0.95, min_delay=0.0, initial_delay=1.0, warmup=20)
+    for i in range(1, 20):
+        delay.observe(i / 100)
+    assert delay.current() == 1.0
+    delay.observe(0.20)
+    # int(0.95 * 20) = 19th of the sorted samples
+    assert delay.current() == pytest.approx(0.20)
+
+
+def test_delay_never_drops_below_min_delay():
+    delay = HedgeDelay(min_delay=0.05, warmup=1)
+    for _ in range(HedgeDelay.REFRESH_EVERY):
+        delay.observe(0.001)
+    assert delay.current() == 0.05
+
+
+def finish_primary(provider: HedgedWhoisProvider, primary: BlockedWhois) -> None:
+    # Lets the abandoned primary finish and its callbacks run
+    primary.release.set()
+    provider._executor.shutdown(wait=True)
+
+
+def test_secondary_wins_and_late_primary_records_saving():
+    metrics = RecordingMetrics()
+    primary = BlockedWhois()
+    provider = HedgedWhoisProvider(primary, FixedWhois(), short_delay(), metrics)
+    assert provider.get_registrant("example.com") == "Fast Org"
+    finish_primary(provider, primary)
+    assert (WINS, {"winner": "secondary"}) in metrics.increments
+    assert metrics.names().count(SAVED) == 1
+
+
+def test_failed_primary_is_not_recorded_as_saving():
+    metrics = RecordingMetrics()
+    primary = BlockedWhois(fail=True)
+    provider = HedgedWhoisProvider(primary, FixedWhois(), short_delay(), metrics)
+    assert provider.get_registrant("example.com") == "Fast Org"
+    finish_primary(provider, primary)
+    assert SAVED not in metrics.names()
+
+
+def test_fast_primary_is_not_hedged():
+    metrics = RecordingMetrics()
+    provider = HedgedWhoisProvider(FixedWhois(), BlockedWhois(), HedgeDelay(), metrics)
+    assert provider.get_registrant("example.com") == "Fast Org"
+    assert "domain_intel_whois_hedges_total" not in metrics.names()
+    provider.close()
+
+
+class HangingAsyncWhois(AsyncWhoisProvider):
+    def __init__(self):
+        self.cancelled = False
+
+    async def get_registrant(self, domain: str) -> str:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "Slow Org"
+
+
+class FixedAsyncWhois(AsyncWhoisProvider):
+    async def get_registrant(self, domain: str) -> str:
+        return "Fast Org"
+
+
+def test_async_loser_is_cancelled():
+    async def run():
+        primary = HangingAsyncWhois()
+        provider = AsyncHedgedWhoisProvider(primary, FixedAsyncWhois(), short_delay())
+        assert await provider.get_registrant("example.com") == "Fast Org"
+        # Give the cancelled task a turn to see its CancelledError
+        await asyncio.sleep(0)
+        assert primary.cancelled
+
+    asyncio.run(run())
+
+
+def test_async_lookup_cancelled_by_caller_cancels_both_sources():
+    async def run():
+        primary, secondary = HangingAsyncWhois(), HangingAsyncWhois()
+        provider = AsyncHedgedWhoisProvider(primary, secondary, short_delay())
+        lookup = asyncio.ensure_future(provider.get_registrant("example.com"))
+        await asyncio.sleep(0.05)
+        lookup.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lookup
+        await asyncio.sleep(0)
+        assert primary.cancelled and secondary.cancelled
+
+    asyncio.run(run())
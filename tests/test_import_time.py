@@ -0,0 +1,104 @@
+"""
+Startup regression check: a CLI call must not load heavy modules it does not use.
+Each scenario runs in a fresh interpreter and reports its sys.modules at exit.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+from app.domain.models import DomainAppraisal, DomainAvailability
+from app.domain.ports import AppraisalProvider, AvailabilityProvider
+from app.infrastructure.cache import (
+    CachedAppraisalProvider,
+    CachedAvailabilityProvider,
+    SqliteCache,
+)
+
+# Loaded on first use only; none of them is needed to answer from cache
+HEAVY_MODULES = (
+    "requests",
+    "urllib3",
+    "httpx",
+    "whois",
+    "asyncio",
+    "numpy",
+    "textual",
+    "tkinter",
+    "cProfile",
+    "tracemalloc",
+)
+
+DOMAIN = "example.com"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs `code` and prints every loaded module on exit, even after sys.exit()
+_PROBE = """
+import atexit, sys
+atexit.register(lambda: print("\\n".join(sys.modules), file=sys.stderr))
+{code}
+"""
+
+
+class _Seed(AvailabilityProvider, AppraisalProvider):
+    # Fixed answers written through the real cache layer
+    def check_availability(self, domain: str) -> DomainAvailability:
+        return DomainAvailability(domain=domain, available=True, price=12.99)
+
+    def get_appraisal(self, domain: str) -> DomainAppraisal:
+        return DomainAppraisal(domain=domain, go_value=1500.0, sale_probability=0.3)
+
+
+def loaded_modules(code: str, env: Optional[Dict[str, str]] = None) -> Set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(code=code)],
+        cwd=ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(proc.stderr.splitlines())
+
+
+def heavy(modules: Set[str]) -> List[str]:
+    return [m for m in HEAVY_MODULES if m in modules]
+
+
+@pytest.fixture
+def cache_path(tmp_path) -> str:
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SqliteCache(path)
+    try:
+        CachedAvailabilityProvider(_Seed(), cache, 3600).check_availability(DOMAIN)
+        CachedAppraisalProvider(_Seed(), cache, 3600).get_appraisal(DOMAIN)
+    finally:
+        cache.close()
+    return path
+
+
+def test_import_main_loads_no_heavy_modules():
+    modules = loaded_modules("import main")
+    assert "main" in modules
+    assert heavy(modules) == []
+
+
+def test_cached_cli_call_loads_no_heavy_modules(cache_path):
+    env = {
+        "CACHE_PATH": cache_path,
+        "GODADDY_API_KEY": "import-time",
+        "GODADDY_API_SECRET": "import-time",
+        # Fail fast instead of hanging if anything does reach the network
+        "GODADDY_BASE_URL": "http://127.0.0.1:9",
+    }
+    code = (
+        "import runpy\n"
+        f"sys.argv = ['main.py', {DOMAIN!r}]\n"
+        "runpy.run_path('main.py', run_name='__main__')"
+    )
+    modules = loaded_modules(code, env)
+    assert "app.infrastructure.cache" in modules
+    assert heavy(modules) == []
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.memo import MemoCache
+
+
+def test_concurrent_lookups_share_one_load():
+    memo = MemoCache()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(memo.get_or_load, "key", loader) for _ in range(8)]
+        # Let every thread reach the cache before the load finishes
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert memo.get("key") == "value"
+
+
+def test_failed_load_is_not_stored():
+    memo = MemoCache()
+
+    def failing():
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        memo.get_or_load("key", failing)
+    assert memo.get_or_load("key", lambda: "value") == "value"
+
+
+def test_store_if_rejects_fallback_values():
+    memo = MemoCache()
+    assert memo.get_or_load("key", lambda: "", store_if=bool) == ""
+    assert memo.get_or_load("key", lambda: "value", store_if=bool) == "value"
+    assert memo.get_or_load("key", lambda: "other", store_if=bool) == "value"
+
+
+def test_entries_expire_after_ttl():
+    memo = MemoCache(ttl=0.0)
+    memo.put("key", "value")
+    assert memo.get_or_load("key", lambda: "reloaded") == "reloaded"
+
+
+def test_lru_evicts_oldest_entry():
+    memo = MemoCache(maxsize=2)
+    memo.put("a", 1)
+    memo.put("b", 2)
+    memo.get("a")
+    memo.put("c", 3)
+    assert memo.get("a") == 1
+    assert memo.get_or_load("b", lambda: "gone") == "gone"
+
+
+def test_follower_of_cancelled_leader_loads_again():
+    async def run():
+        memo = MemoCache()
+        calls = []
+        never = asyncio.Event()
+
+        async def loader():
+            calls.append(1)
+            if len(calls) == 1:
+                await never.wait()
+            return "value"
+
+        leader = asyncio.ensure_future(memo.aget_or_load("key", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(memo.aget_or_load("key", loader))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "value"
+        assert leader.cancelled()
+        assert len(calls) == 2
+        assert memo.get("key") == "value"
+
+    asyncio.run(run())
+
+
+def test_async_followers_share_one_load():
+    async def run():
+        memo = MemoCache()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(
+            *(memo.aget_or_load("key", loader) for _ in range(5))
+        )
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+
+    asyncio.run(run())
@@ -0,0 +1,70 @@
+import pytest
+
+from app.infrastructure.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    parse_overrides,
+    parse_retry_after,
+)
+
+# 10 requests per second
+RATE_PER_MINUTE = 600
+
+
+def reserve_many(bucket: TokenBucket, count: int):
+    return [bucket.reserve() for _ in range(count)]
+
+
+def test_burst_goes_at_once_then_spaced_at_rate():
+    waits = reserve_many(TokenBucket(RATE_PER_MINUTE, burst=3), 6)
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
+def test_throttled_pauses_and_spaces_callers_at_half_rate():
+    bucket = TokenBucket(RATE_PER_MINUTE, burst=5)
+    bucket.throttled(2.0)
+    waits = reserve_many(bucket, 4)
+    # One request at the deadline, then one per 1 / (5 per second)
+    assert waits == pytest.approx([2.0, 2.2, 2.4, 2.6], abs=0.01)
+
+
+def test_second_throttle_does_not_shorten_the_pause():
+    bucket = TokenBucket(RATE_PER_MINUTE, burst=5)
+    bucket.throttled(2.0)
+    bucket.throttled(0.5)
+    # Rate is now a quarter: 2.5 per second
+    assert reserve_many(bucket, 2) == pytest.approx([2.0, 2.4], abs=0.01)
+
+
+def test_rate_never_drops_below_a_sixteenth():
+    bucket = TokenBucket(RATE_PER_MINUTE, burst=1)
+    for _ in range(10):
+        bucket.throttled(0.0)
+    waits = reserve_many(bucket, 2)
+    assert waits[1] - waits[0] == pytest.approx(1.6, abs=0.01)
+
+
+def test_successes_restore_the_rate():
+    bucket = TokenBucket(RATE_PER_MINUTE, burst=1)
+    bucket.throttled(0.0)
+    for _ in range(10):
+        bucket.succeeded()
+    waits = reserve_many(bucket, 3)
+    assert waits[2] - waits[1] == pytest.approx(0.1, abs=0.01)
+
+
+def test_limiter_shares_one_bucket_per_endpoint():
+    limiter = RateLimiter(60, 1, parse_overrides("appraisal=30, bulk = 6"))
+    assert limiter.bucket("appraisal") is limiter.bucket("appraisal")
+    assert limiter.bucket("appraisal") is not limiter.bucket("availability")
+    assert limiter.bucket("bulk").reserve() == 0.0
+    assert limiter.bucket("bulk").reserve() == pytest.approx(10.0, abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("soon", None)],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
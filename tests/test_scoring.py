@@ -0,0 +1,193 @@
+import itertools
+import json
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from app.application.rules import DEFAULT_POLICY, ScoringPolicy, load_policy
+from app.application.scoring import BatchScorer, rescore, split_domains
+from app.application.use_cases import analyze_potential
+from app.domain.models import (
+    DomainAppraisal,
+    DomainAvailability,
+    DomainEvaluation,
+    Recommendation,
+)
+from app.domain.results import EvaluationTable
+
+NAN = math.nan
+
+# Names on both sides of every structure threshold of the default rules
+# (short 6, medium 10, mixed 6, max 20, one hyphen) and the custom ones below
+NAMES = [
+    "a",
+    "abcd",
+    "abcde",
+    "abcdef",
+    "abcdefg",
+    "abcdefghij",
+    "abcdefghijk",
+    "a" * 20,
+    "a" * 21,
+    "ab-cd",
+    "a-b-c",
+    "a-b-c-d",
+    "888",
+    "123456",
+    "1234567",
+    "12345678901234567890",
+    "ab1",
+    "abcd12",
+    "abcde12",
+    "ab-12",
+    "٣٣٣",
+    "ab٣",
+]
+TLDS = ["com", "COM", "io", "net", "dev", "xyz", "shop"]
+PRICES: List[Optional[float]] = [None, NAN, 0.0, 10.0, 49.99, 50.0, 1000.0, 2500.0]
+GO_VALUES = [0.0, NAN, 499.99, 500.0, 999.99, 1000.0, 2500.0, 3000.0, 30000.0]
+PROBABILITIES = [0.0, NAN, 0.19, 0.2, 0.3, 0.4, 1.0]
+
+CUSTOM_RULES = {
+    "tiers": {
+        "premium": {
+            "tlds": ["xyz", "io"],
+            "min_value": 900,
+            "min_probability": 0.3,
+            "heuristic_bonus": 60,
+        },
+        "standard": {
+            "tlds": ["com", "io", "shop"],
+            "min_value": 2000,
+            "min_probability": 0.1,
+            "heuristic_bonus": 10,
+        },
+    },
+    "default_tier": {"min_value": 100, "min_probability": 0.05},
+    "structure": {"max_hyphens": 2, "max_mixed_length": 4, "max_length": 10},
+    "roi": {"min_multiple": 2, "high_price": 1000, "high_price_min_multiple": 5},
+    "heuristic": {"short_length": 4, "medium_length": 7, "buy_score": 60},
+}
+
+
+@pytest.fixture(params=["default", "custom"])
+def policy(request, tmp_path) -> ScoringPolicy:
+    if request.param == "default":
+        return DEFAULT_POLICY
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(CUSTOM_RULES), encoding="utf-8")
+    return load_policy(str(path))
+
+
+Row = Tuple[str, bool, Optional[float], float, float]
+
+
+def _scalar(rows: List[Row], policy: ScoringPolicy) -> List[bool]:
+    return [
+        analyze_potential(
+            domain,
+            DomainAvailability(domain, available, price),
+            DomainAppraisal(domain, go_value, probability),
+            policy,
+        )
+        for domain, available, price, go_value, probability in rows
+    ]
+
+
+def _vector(rows: List[Row], policy: ScoringPolicy) -> List[bool]:
+    names, tlds = split_domains(row[0] for row in rows)
+    buy, _ = BatchScorer(policy).score(
+        names,
+        tlds,
+        np.array([row[1] for row in rows], dtype=bool),
+        np.array([NAN if row[2] is None else row[2] for row in rows], dtype=float),
+        np.array([row[3] for row in rows], dtype=float),
+        np.array([row[4] for row in rows], dtype=float),
+    )
+    return buy.tolist()
+
+
+def _evaluations(rows: List[Row]) -> List[DomainEvaluation]:
+    return [
+        DomainEvaluation(
+            domain=domain,
+            is_available=available,
+            go_value=go_value,
+            sale_probability=probability,
+            recommendation=Recommendation.SKIP,
+            price=price,
+        )
+        for domain, available, price, go_value, probability in rows
+    ]
+
+
+def _assert_same(rows: List[Row], policy: ScoringPolicy) -> None:
+    expected = _scalar(rows, policy)
+    actual = _vector(rows, policy)
+    mismatches = [row for row, e, a in zip(rows, expected, actual) if e != a]
+    assert not mismatches, f"{len(mismatches)} rows differ, e.g. {mismatches[:5]}"
+    # Both input paths of score_evaluations
+    evaluations = _evaluations(rows)
+    scorer = BatchScorer(policy)
+    assert scorer.score_evaluations(evaluations)[0].tolist() == expected
+    table = EvaluationTable(evaluations)
+    assert scorer.score_evaluations(table)[0].tolist() == expected
+
+
+def test_threshold_grid_matches_analyze_potential(policy):
+    rows = [
+        (f"{name}.{tld}", available, price, go_value, probability)
+        for name, tld, available, price, go_value, probability in itertools.product(
+            NAMES, TLDS, (True, False), PRICES, GO_VALUES, PROBABILITIES
+        )
+    ]
+    _assert_same(rows, policy)
+
+
+def test_roi_multiples_match_analyze_potential(policy):
+    # GoValue just under, at and over each multiple of the price
+    rows: List[Row] = []
+    for price in (1.0, 49.0, 999.0, 1000.0, 1000.01, 2000.0, 2000.01, 5000.0):
+        for multiple in (
+            policy.roi_multiple,
+            policy.high_price_roi_multiple,
+        ):
+            target = price * multiple
+            for go_value in (math.nextafter(target, 0), target, target + 0.01):
+                for probability in (0.0, 0.5):
+                    rows.append(("roi.com", True, price, go_value, probability))
+                    rows.append(("roi.xyz", True, price, go_value, probability))
+    _assert_same(rows, policy)
+
+
+def test_fallback_heuristic_matches_analyze_potential(policy):
+    # No appraisal data: only the heuristic score can decide
+    rows = [
+        (f"{name}.{tld}", True, price, 0.0, 0.0)
+        for name, tld, price in itertools.product(NAMES, TLDS, PRICES)
+    ]
+    _assert_same(rows, policy)
+
+
+def test_nan_appraisal_is_never_a_buy(policy):
+    rows = [
+        ("short.com", True, price, go_value, probability)
+        for price in PRICES
+        for go_value, probability in ((NAN, NAN), (NAN, 0.0), (0.0, NAN))
+    ]
+    assert _vector(rows, policy) == _scalar(rows, policy) == [False] * len(rows)
+
+
+def test_rescore_matches_scalar_decisions(policy):
+    rows = [
+        (f"{name}.{tld}", True, 10.0, go_value, 0.5)
+        for name, tld, go_value in itertools.product(NAMES, TLDS, GO_VALUES)
+    ]
+    expected = [
+        Recommendation.BUY if buy else Recommendation.SKIP
+        for buy in _scalar(rows, policy)
+    ]
+    rescored = rescore(EvaluationTable(_evaluations(rows)), policy, chunk_size=50)
+    assert [e.recommendation for e in rescored] == expected
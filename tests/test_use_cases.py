@@ -0,0 +1,106 @@
+import random
+import threading
+import time
+from typing import List
+
+from app.application.use_cases import BatchEvaluateUseCase, EvaluateDomainUseCase
+from app.domain.models import DomainAppraisal, DomainAvailability
+from app.domain.ports import AppraisalProvider, AvailabilityProvider, WhoisProvider
+
+DOMAINS = [f"name{i}.com" for i in range(40)]
+
+
+class SlowAvailability(AvailabilityProvider):
+    """Answers after a random short delay, so completion order is shuffled."""
+
+    def __init__(self):
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        with self._lock:
+            self.calls.append(domain)
+        if domain.startswith("boom"):
+            raise RuntimeError("boom")
+        time.sleep(random.random() * 0.005)
+        return DomainAvailability(domain, True, 10.0, "USD")
+
+
+class PartialBulkAvailability(SlowAvailability):
+    """Bulk answers leave out every third domain; a chunk with `fail` raises."""
+
+    supports_bulk = True
+
+    def __init__(self):
+        super().__init__()
+        self.bulk_calls: List[List[str]] = []
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        self.bulk_calls.append(list(domains))
+        if any(domain.startswith("fail") for domain in domains):
+            raise RuntimeError("bulk down")
+        return [
+            DomainAvailability(domain, False, None, None)
+            for i, domain in enumerate(domains)
+            if i % 3
+        ]
+
+
+class FixedAppraisal(AppraisalProvider):
+    def get_appraisal(self, domain: str) -> DomainAppraisal:
+        return DomainAppraisal(domain, 1500.0, 0.5)
+
+
+class FixedWhois(WhoisProvider):
+    def get_registrant(self, domain: str) -> str:
+        return "Org"
+
+
+def make_batch(availability: AvailabilityProvider, **kwargs) -> BatchEvaluateUseCase:
+    evaluate = EvaluateDomainUseCase(availability, FixedAppraisal(), FixedWhois())
+    return BatchEvaluateUseCase(evaluate, **kwargs)
+
+
+def test_concurrent_batch_keeps_input_order():
+    batch = make_batch(SlowAvailability(), max_workers=8)
+    results = list(batch.execute_iter(iter(DOMAINS)))
+    assert [r.domain for r in results] == DOMAINS
+
+
+def test_unordered_batch_yields_every_domain_once():
+    batch = make_batch(SlowAvailability(), max_workers=8)
+    results = list(batch.execute_iter(DOMAINS, ordered=False))
+    assert sorted(r.domain for r in results) == sorted(DOMAINS)
+
+
+def test_failing_domain_does_not_abort_batch():
+    domains = ["good.com", "boom.com", "fine.com"]
+    results = list(make_batch(SlowAvailability(), max_workers=4).execute_iter(domains))
+    assert [r.domain for r in results] == domains
+    assert results[1].error == "boom"
+    assert results[0].error is None and results[2].error is None
+
+
+def test_prefetch_falls_back_to_single_checks_for_left_out_domains():
+    availability = PartialBulkAvailability()
+    batch = make_batch(availability, max_workers=4, chunk_size=10)
+    results = list(batch.execute_iter(DOMAINS))
+
+    assert [r.domain for r in results] == DOMAINS
+    assert [len(chunk) for chunk in availability.bulk_calls] == [10, 10, 10, 10]
+    left_out = [d for chunk in availability.bulk_calls for d in chunk[::3]]
+    assert sorted(availability.calls) == sorted(left_out)
+    # Singly checked domains report available, prefetched ones taken
+    for result in results:
+        assert result.is_available == (result.domain in left_out)
+
+
+def test_failed_bulk_chunk_is_checked_domain_by_domain():
+    domains = ["fail.com", "one.com", "two.com", "three.com"]
+    availability = PartialBulkAvailability()
+    results = list(make_batch(availability, chunk_size=2).execute_iter(domains))
+
+    assert [r.domain for r in results] == domains
+    assert all(r.error is None for r in results)
+    # First chunk failed as a whole; the second only left out its first domain
+    assert availability.calls == ["fail.com", "one.com", "two.com"]
@@ -0,0 +1,124 @@
+import sqlite3
+
+import pytest
+
+from app.infrastructure import whois_client
+from app.infrastructure.cache import SqliteCache
+from app.infrastructure.whois_client import (
+    IANA_SERVER,
+    NO_SERVER_TTL,
+    SERVER_KIND,
+    WhoisClient,
+    WhoisError,
+    WhoisRecord,
+    format_query,
+    parse_iana_referral,
+    parse_record,
+)
+
+REGISTRY_ANSWER = """\
+   Domain Name: EXAMPLE.COM
+   Registrar WHOIS Server: https://whois.registrar.test/
+   Registrar: Example Registrar, Inc.
+   Registrar: Ignored Second Registrar
+"""
+REGISTRAR_ANSWER = """\
+Domain Name: example.com
+Registrant Name:
+Registrant Organization: Example Org
+Registrar: Example Registrar, Inc.
+"""
+
+
+def test_parse_record_keeps_first_value_and_cleans_referral():
+    record = parse_record(REGISTRY_ANSWER)
+    assert record == WhoisRecord(
+        registrar="Example Registrar, Inc.", referral="whois.registrar.test"
+    )
+    assert parse_record(REGISTRAR_ANSWER).org == "Example Org"
+    assert parse_record(REGISTRAR_ANSWER).name is None
+
+
+def test_parse_iana_referral():
+    assert parse_iana_referral("refer:  whois.nic.io\n") == "whois.nic.io"
+    assert parse_iana_referral("domain: TEST\nstatus: ACTIVE\n") is None
+
+
+def test_format_query_per_registry():
+    assert format_query("whois.verisign-grs.com", "a.com") == "domain a.com\r\n"
+    assert format_query("whois.nic.io", "a.io") == "a.io\r\n"
+
+
+def fake_queries(client: WhoisClient, answers):
+    # Replaces the socket round trip; records every (server, query) asked
+    asked = []
+
+    def query(server: str, query: str) -> str:
+        asked.append((server, query))
+        return answers[server]
+
+    client.query = query
+    return asked
+
+
+def test_lookup_follows_registrar_referral():
+    client = WhoisClient()
+    asked = fake_queries(
+        client,
+        {
+            IANA_SERVER: "refer: whois.verisign-grs.com\n",
+            "whois.verisign-grs.com": REGISTRY_ANSWER,
+            "whois.registrar.test": REGISTRAR_ANSWER,
+        },
+    )
+    record = client.lookup("Example.COM.")
+    assert record.org == "Example Org"
+    assert record.registrar == "Example Registrar, Inc."
+
+    client.lookup("other.com")
+    # IANA is asked once per TLD
+    assert [server for server, _ in asked].count(IANA_SERVER) == 1
+    assert ("whois.verisign-grs.com", "domain example.com\r\n") in asked
+
+
+def test_server_map_is_shared_through_the_disk_cache(tmp_path):
+    cache = SqliteCache(str(tmp_path / "cache.db"))
+    first = WhoisClient(cache=cache)
+    fake_queries(first, {IANA_SERVER: "whois: whois.nic.io\n"})
+    assert first.server_for("io") == "whois.nic.io"
+
+    second = WhoisClient(cache=cache)
+    assert fake_queries(second, {}) == []
+    assert second.server_for("io") == "whois.nic.io"
+    cache.close()
+
+
+def test_missing_server_is_cached_for_no_server_ttl(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SqliteCache(path)
+    client = WhoisClient(cache=cache)
+    asked = fake_queries(client, {IANA_SERVER: "domain: TEST\n"})
+    for _ in range(2):
+        with pytest.raises(WhoisError):
+            client.server_for("test")
+    assert len(asked) == 1
+    assert cache.get(SERVER_KIND, "test") == ""
+    cache.close()
+
+    conn = sqlite3.connect(path)
+    (ttl,) = conn.execute("SELECT expires_at - accessed_at FROM entries").fetchone()
+    conn.close()
+    assert ttl == pytest.approx(NO_SERVER_TTL)
+
+
+def test_missing_server_is_asked_again_after_no_server_ttl(monkeypatch):
+    client = WhoisClient()
+    asked = fake_queries(client, {IANA_SERVER: "domain: TEST\n"})
+    with pytest.raises(WhoisError):
+        client.server_for("test")
+
+    later = whois_client.time.monotonic() + NO_SERVER_TTL + 1
+    monkeypatch.setattr(whois_client.time, "monotonic", lambda: later)
+    with pytest.raises(WhoisError):
+        client.server_for("test")
+    assert len(asked) == 2
@@ -0,0 +1,109 @@
+import pytest
+
+from app.domain.models import DomainEvaluation, Recommendation
+from app.infrastructure.work_queue import FileWorkQueue, SqliteWorkQueue
+
+DOMAINS = [f"name{i}.com" for i in range(10)]
+
+
+@pytest.fixture(params=["sqlite", "files"])
+def open_queue(request, tmp_path):
+    # Both backends must behave the same; tests pass their own lease settings
+    def factory(lease_seconds: float = 300.0, max_attempts: int = 3):
+        if request.param == "sqlite":
+            return SqliteWorkQueue(
+                str(tmp_path / "queue.db"), lease_seconds, max_attempts
+            )
+        return FileWorkQueue(str(tmp_path / "queue"), lease_seconds, max_attempts)
+
+    return factory
+
+
+def evaluation(domain: str, error=None) -> DomainEvaluation:
+    return DomainEvaluation(domain, True, 1.0, 0.1, Recommendation.SKIP, error=error)
+
+
+def test_shards_are_leased_once_in_queue_order(open_queue):
+    queue = open_queue()
+    assert queue.enqueue(iter(DOMAINS), shard_size=4) == (3, 10)
+
+    first = queue.lease("a")
+    second = queue.lease("b")
+    third = queue.lease("a")
+    assert [len(s.domains) for s in (first, second, third)] == [4, 4, 2]
+    assert first.domains == tuple(DOMAINS[:4]) and first.attempt == 1
+    assert queue.lease("c") is None
+    assert queue.progress()["workers"] == {"a": 2, "b": 1}
+
+    for shard in (third, first, second):
+        assert queue.complete(shard, [evaluation(d) for d in shard.domains])
+    assert [r.domain for r in queue.results()] == DOMAINS
+    assert queue.progress()["evaluated"] == 10
+    assert queue.seconds_until_lease() is None
+    queue.close()
+
+
+def test_expired_lease_is_taken_over_and_stale_writes_rejected(open_queue):
+    queue = open_queue(lease_seconds=-1)
+    queue.enqueue(DOMAINS, shard_size=10)
+    stale = queue.lease("dead")
+    assert queue.seconds_until_lease() == 0.0
+
+    current = queue.lease("alive")
+    assert current.id == stale.id and current.attempt == stale.attempt + 1
+    assert not queue.renew(stale)
+    assert not queue.complete(stale, [evaluation(d, "late") for d in DOMAINS])
+    assert queue.renew(current)
+    assert queue.complete(current, [evaluation(d) for d in DOMAINS])
+    assert [r.error for r in queue.results()] == [None] * 10
+    queue.close()
+
+
+def test_shard_abandoned_max_attempts_times_fails(open_queue):
+    queue = open_queue(lease_seconds=-1, max_attempts=2)
+    queue.enqueue(DOMAINS, shard_size=10)
+    assert queue.lease("a").attempt == 1
+    assert queue.lease("b").attempt == 2
+    assert queue.lease("c") is None
+    assert queue.progress()["shards"]["failed"] == 1
+
+    assert queue.retry_failed() == 1
+    assert queue.lease("d").attempt == 1
+    queue.close()
+
+
+def test_released_shard_goes_back_until_out_of_attempts(open_queue):
+    queue = open_queue(max_attempts=2)
+    queue.enqueue(DOMAINS, shard_size=10)
+    queue.release(queue.lease("a"), "crashed")
+    assert queue.progress()["shards"]["pending"] == 1
+    queue.release(queue.lease("a"), "crashed")
+    assert queue.progress()["shards"]["failed"] == 1
+    assert queue.lease("a") is None
+    queue.close()
+
+
+def test_errored_domains_are_retried_within_max_attempts(open_queue):
+    queue = open_queue(max_attempts=2)
+    queue.enqueue(["a.com", "b.com", "c.com"], shard_size=10)
+
+    first = queue.lease("w")
+    assert queue.complete(
+        first,
+        [evaluation("a.com"), evaluation("b.com", "timeout"), evaluation("c.com", "x")],
+    )
+    retry = queue.lease("w")
+    assert retry.domains == ("b.com", "c.com") and retry.attempt == 2
+    assert queue.complete(retry, [evaluation("b.com"), evaluation("c.com", "x")])
+
+    # Out of attempts: the last error is stored instead of queued again
+    assert queue.lease("w") is None
+    assert sorted((r.domain, r.error) for r in queue.results()) == [
+        ("a.com", None),
+        ("b.com", None),
+        ("c.com", "x"),
+    ]
+    progress = queue.progress()
+    assert progress["domains"]["done"] == 3
+    assert progress["errors"] == 1
+    queue.close()
@@ -0,0 +1,134 @@
+import gzip
+import os
+from typing import List
+
+from app.domain.models import DomainAvailability
+from app.domain.ports import AvailabilityProvider
+from app.infrastructure.zone_index import (
+    ZoneAvailabilityProvider,
+    ZoneDirectory,
+    ZoneIndex,
+    build_zone_indexes,
+    iter_delegations,
+    load_manifest,
+    sorted_unique,
+    write_index,
+)
+
+ZONE = """\
+$ORIGIN COM.
+$TTL 900
+@ IN SOA a.gtld-servers.net. nstld.verisign-grs.com. (
+    1 1800 900
+    604800 86400 )
+@ NS A.GTLD-SERVERS.NET.
+EXAMPLE NS NS1.EXAMPLE
+ NS NS2.EXAMPLE
+example.com. 172800 in ns ns1.host.net.
+other.com.\t172800\tIN\tNS\tns1.host.net. ; comment
+NS1.EXAMPLE A 192.0.2.1
+xn--mnchen-3ya 86400 IN NS ns.host.net.
+sub.deep NS ns.host.net.
+onlyglue A 192.0.2.2
+"""
+DELEGATED = ["example", "example", "example", "other", "xn--mnchen-3ya"]
+
+
+def test_iter_delegations_keeps_only_second_level_ns_owners():
+    assert list(iter_delegations(ZONE.splitlines(), "com")) == DELEGATED
+
+
+def test_sorted_unique_merges_spilled_runs(tmp_path):
+    labels = [f"name{i % 250}" for i in range(1000)][::-1]
+    merged = list(sorted_unique(labels, run_size=64, tmpdir=str(tmp_path)))
+    assert merged == sorted({label.encode("ascii") for label in labels})
+    # Spilled runs are removed once merged
+    assert os.listdir(tmp_path) == []
+
+
+def test_sorted_unique_without_spills():
+    assert list(sorted_unique(["b", "a", "b"])) == [b"a", b"b"]
+
+
+def test_index_round_trip(tmp_path):
+    path = str(tmp_path / "com.zidx")
+    labels = [f"name{i:04d}".encode("ascii") for i in range(0, 2000, 2)]
+    assert write_index(labels, path) == 1000
+
+    index = ZoneIndex(path)
+    assert index.count == 1000
+    assert all(label in index for label in labels)
+    for missing in (b"", b"a", b"name0001", b"name1999", b"name9999", b"zzz"):
+        assert missing not in index
+    index.close()
+
+
+def test_empty_index(tmp_path):
+    path = str(tmp_path / "com.zidx")
+    assert write_index([], path) == 0
+    index = ZoneIndex(path)
+    assert b"example" not in index
+    index.close()
+
+
+def write_zone(directory, text: str = ZONE) -> str:
+    path = os.path.join(str(directory), "com.txt.gz")
+    with gzip.open(path, "wt", encoding="ascii") as f:
+        f.write(text)
+    return path
+
+
+def test_build_and_look_up_zone_directory(tmp_path):
+    zones = str(tmp_path / "zones")
+    source = write_zone(tmp_path)
+    assert build_zone_indexes([source], zones, run_size=2) == {"com": 3}
+    # An unchanged snapshot is skipped
+    assert build_zone_indexes([source], zones) == {"com": None}
+    assert load_manifest(zones)["com"]["count"] == 3
+
+    directory = ZoneDirectory(zones)
+    assert directory.is_registered("example.com")
+    assert directory.is_registered("EXAMPLE.COM.")
+    assert directory.is_registered("münchen.com")
+    assert not directory.is_registered("onlyglue.com")
+    assert not directory.is_registered("deep.com")
+    assert not directory.is_registered("example.net")
+    assert not directory.is_registered(".com")
+
+
+def test_stale_snapshot_is_not_used(tmp_path):
+    zones = str(tmp_path / "zones")
+    source = write_zone(tmp_path)
+    week_ago = os.stat(source).st_mtime - 8 * 24 * 3600
+    os.utime(source, (week_ago, week_ago))
+    build_zone_indexes([source], zones)
+    assert not ZoneDirectory(zones).is_registered("example.com")
+
+
+class RecordingAvailability(AvailabilityProvider):
+    supports_bulk = True
+
+    def __init__(self):
+        self.asked: List[str] = []
+
+    def check_availability(self, domain: str) -> DomainAvailability:
+        self.asked.append(domain)
+        return DomainAvailability(domain, True, 9.99, "USD")
+
+    def check_availability_bulk(self, domains: List[str]) -> List[DomainAvailability]:
+        self.asked.extend(domains)
+        return [DomainAvailability(domain, True) for domain in reversed(domains)]
+
+
+def test_zone_provider_answers_taken_locally_in_input_order(tmp_path):
+    zones = str(tmp_path / "zones")
+    build_zone_indexes([write_zone(tmp_path)], zones)
+    inner = RecordingAvailability()
+    provider = ZoneAvailabilityProvider(inner, ZoneDirectory(zones))
+
+    domains = ["fresh.com", "example.com", "new.org", "other.com"]
+    results = provider.check_availability_bulk(domains)
+    assert [r.domain for r in results] == domains
+    assert [r.available for r in results] == [True, False, True, False]
+    assert inner.asked == ["fresh.com", "new.org"]
+    assert not provider.check_availability("Other.com").available